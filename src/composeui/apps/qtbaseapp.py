@@ -3,9 +3,13 @@ from composeui.apps.eventdrivenappmixin import EventDrivenAppMixin
 from composeui.commontypes import AnyMainView, AnyModel
 from composeui.core import tools
 from composeui.core.basesignal import SIGNAL_LOGGER
+from composeui.history.compaction import HistoryCompactor
+
+from qtpy.QtCore import QTimer
 
 import logging
 from argparse import Namespace
+from functools import partial
 from pathlib import Path
 
 
@@ -38,10 +42,24 @@ class QtBaseApp(BaseApp, EventDrivenAppMixin[AnyMainView, AnyModel]):
     def model(self) -> AnyModel:
         return self._model
 
-    def run(self, log_signals: bool = False) -> None:
+    def run(self, log_signals: bool = False, defer_updates: bool = False) -> None:
+        """Run the app.
+
+        By default, the views are updated as soon as they are requested. If defer_updates is
+        True, the updates of the views requested during an iteration of the event loop are
+        collected and applied once at the next iteration. The slots reading the state of a
+        view updated during the same iteration must then call `tools.flush_updates` first to
+        apply the pending updates synchronously.
+        In both cases, the old actions of the history are removed at the next iteration,
+        outside of the recording of the action.
+        """
         super().run()
         if log_signals or (self._args is not None and self._args.log_signals):
             SIGNAL_LOGGER.setLevel(level=logging.DEBUG)
+        if self._app is not None:
+            HistoryCompactor.call_later = partial(QTimer.singleShot, 0)
+        if defer_updates and self._app is not None:
+            tools.defer_updates(partial(QTimer.singleShot, 0))
         self.initialize()
         self.connect()
         if self._args is not None and self._args.f is not None:
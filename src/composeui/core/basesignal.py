@@ -5,6 +5,7 @@ import enum
 import functools
 import logging
 import sys
+import types
 import typing
 
 if typing.TYPE_CHECKING:
@@ -34,6 +35,11 @@ from typing import (
 )
 from weakref import ReferenceType, WeakKeyDictionary
 
+# cache of the parameters of the signature of the functions
+_SIGNATURE_PARAMETERS: MutableMapping[Callable[..., Any], Tuple[inspect.Parameter, ...]] = (
+    WeakKeyDictionary()
+)
+
 CallbackFunc: TypeAlias = Callable[..., Any]
 Callback: TypeAlias = Union[CallbackFunc, List[CallbackFunc]]
 if sys.version_info >= (3, 9):
@@ -70,6 +76,32 @@ def _call_callback_functions(
             break
 
 
+def _get_signature_parameters(callback: Callable[..., Any]) -> Tuple[inspect.Parameter, ...]:
+    """Get the parameters of the signature of the given callback.
+
+    The parameters are cached by function (the underlying function for the methods) to
+    avoid inspecting the signature each time a callback is connected.
+    """
+    function = getattr(callback, "__func__", callback)
+    if not isinstance(function, types.FunctionType):
+        return tuple(inspect.signature(callback).parameters.values())
+    parameters = _SIGNATURE_PARAMETERS.get(function)
+    if parameters is None:
+        parameters = tuple(inspect.signature(function).parameters.values())
+        _SIGNATURE_PARAMETERS[function] = parameters
+    if function is not callback:
+        # the first parameter of the method is bound
+        return parameters[1:]
+    return parameters
+
+
+def _is_coroutine_callback(callback: Callable[..., Any]) -> bool:
+    """Check if the callback is a coroutine function or a partial of a coroutine function."""
+    return asyncio.iscoroutinefunction(callback) or (
+        hasattr(callback, "func") and asyncio.iscoroutinefunction(callback.func)
+    )
+
+
 def _extend_callback_parameters(
     callback: Callable[..., Any], missing_parameters_indices: List[int]
 ) -> Callable[..., Any]:
@@ -92,7 +124,28 @@ def _extend_callback_parameters(
     return wrapper
 
 
+def _call_slot_functions(qt_signal: "_BaseQtSignal", *args: Any) -> None:
+    r"""Call the slot functions connected to a qt signal in their order.
+
+    Like with one qt connection by slot, an exception raised by a slot is given to
+    sys.excepthook and doesn't prevent the call of the next slots.
+    """
+    # the slots are a tuple replaced at each modification, so a slot can modify the
+    # connected slots without copying them at each emit
+    for slot_function in qt_signal.slot_functions:
+        try:
+            slot_function(*args)
+        except Exception:  # noqa: BLE001, PERF203
+            sys.excepthook(*sys.exc_info())
+
+
 class _BaseQtSignal:
+    r"""Qt signal of a BaseSignal.
+
+    The qt signal is connected once to a function calling the ordered slot functions, so
+    inserting or removing a callback doesn't need to reconnect the others.
+    """
+
     def __init__(
         self,
         signal: "SignalInstance",
@@ -104,25 +157,22 @@ class _BaseQtSignal:
             self.parameter_types = self._find_parameter_types(obj, signal)
         else:
             self.parameter_types = []
-        self._slots: MutableMapping[CallbackFunc, CallbackFunc] = WeakKeyDictionary()
-        self.connect(*slots)
-
-    def connect(self, *callback_functions: CallbackFunc) -> None:
-        for callback_function in callback_functions:
-            self._connect(callback_function)
-
-    def disconnect(self, *callback_functions: CallbackFunc) -> None:
-        for callback_function in callback_functions:
-            self._disconnect(callback_function)
+        self.slot_functions: Tuple[CallbackFunc, ...] = tuple(
+            self._create_slot_function(slot) for slot in slots
+        )
+        self._signal.connect(partial(_call_slot_functions, self))
 
-    def _connect(self, callback_function: CallbackFunc) -> None:
-        slot_function = self._create_slot_function(callback_function)
-        self._signal.connect(slot_function)
-        self._slots[callback_function] = slot_function
+    def insert(self, index: int, callback_function: CallbackFunc) -> None:
+        r"""Insert the callback at the given position of the slots."""
+        slot_functions = list(self.slot_functions)
+        slot_functions.insert(index, self._create_slot_function(callback_function))
+        self.slot_functions = tuple(slot_functions)
 
-    def _disconnect(self, callback_function: CallbackFunc) -> None:
-        self._signal.disconnect(self._slots[callback_function])
-        del self._slots[callback_function]
+    def remove(self, index: Union[int, slice]) -> None:
+        r"""Remove the slots at the given position."""
+        slot_functions = list(self.slot_functions)
+        del slot_functions[index]
+        self.slot_functions = tuple(slot_functions)
 
     def _create_slot_function(self, callback_function: CallbackFunc) -> CallbackFunc:
         """Adapt the callback to the parameter types of the qt signal."""
@@ -161,10 +211,9 @@ class _BaseQtSignal:
             return _extend_callback_parameters(callback_function, missing_parameters_indices)
 
     def _get_missing_parameters_indices(self, callback_function: CallbackFunc) -> List[int]:
-        signature = inspect.signature(callback_function)
         missing_parameters_indices = list(range(len(self.parameter_types)))
         missing_annotation = False
-        for callback_parameter in signature.parameters.values():
+        for callback_parameter in _get_signature_parameters(callback_function):
             if callback_parameter.kind in (
                 # inspect.Parameter.POSITIONAL_OR_KEYWORD,
                 inspect.Parameter.POSITIONAL_ONLY,
@@ -221,6 +270,8 @@ class BaseSignal(MutableSequence[Callback]):
         self.allow_calling = False
         self._initial_callbacks: List[Callback] = []
         self._callbacks: List[CallbackFunc] = []
+        # if the callbacks are coroutine functions computed once when they are connected
+        self._is_coroutines: List[bool] = []
         self._tasks: Set[TaskCallBackFunc] = set()
         self._objs: MutableMapping[View, BaseSignal] = WeakKeyDictionary()
         self.current_view: Optional[ReferenceType[View]] = None
@@ -281,17 +332,16 @@ class BaseSignal(MutableSequence[Callback]):
 
     def insert(self, index: int, callback: Callback) -> None:
         callback_func = self._create_callback_function(callback)
-        # disconnect to connect after with the correct order
-        self._disconnect(*self._callbacks)
         self._initial_callbacks.insert(index, callback)
         self._callbacks.insert(index, callback_func)
-        # connect all the callbacks in the correct order
-        self._connect(*self._callbacks)
+        self._is_coroutines.insert(index, _is_coroutine_callback(callback_func))
+        self._connect(index, callback_func)
 
     def clear(self) -> None:
-        self._disconnect(*self._callbacks)
+        self._disconnect(slice(None))
         self._initial_callbacks.clear()
         self._callbacks.clear()
+        self._is_coroutines.clear()
 
     def append_final_callback(self, callback: CallbackFunc) -> None:
         """Append a callback function as the final callback in the execution sequence.
@@ -335,17 +385,25 @@ class BaseSignal(MutableSequence[Callback]):
         self, index: Union[int, slice], value: Union[Callback, Iterable[Callback]]
     ) -> None:
         if isinstance(index, slice) and isinstance(value, Iterable):
-            self._disconnect(*self._callbacks[index])
-            self._initial_callbacks[index] = value
-            slot_functions = [self._create_callback_function(c) for c in value]
-            self._callbacks[index] = slot_functions
-            self._connect(*slot_functions)
+            values = list(value)
+            positions = range(*index.indices(len(self._callbacks)))
+            if index.step in (None, 1):
+                del self[index]
+                for i, callback in enumerate(values):
+                    self.insert(positions.start + i, callback)
+            elif len(positions) == len(values):
+                for position, callback in zip(positions, values):
+                    self[position] = callback
+            else:
+                msg = (
+                    f"attempt to assign sequence of size {len(values)} "
+                    f"to extended slice of size {len(positions)}"
+                )
+                raise ValueError(msg)
         elif isinstance(index, int) and not isinstance(value, Iterable):
-            self._disconnect(self._callbacks[index])
-            self._initial_callbacks[index] = value
-            slot_function = self._create_callback_function(value)
-            self._callbacks[index] = slot_function
-            self._connect(slot_function)
+            index = index + len(self._callbacks) if index < 0 else index
+            del self[index]
+            self.insert(index, value)
 
     @overload
     def __delitem__(self, index: int) -> None: ...
@@ -353,23 +411,18 @@ class BaseSignal(MutableSequence[Callback]):
     def __delitem__(self, index: slice) -> None: ...
 
     def __delitem__(self, index: Union[int, slice]) -> None:
-        if isinstance(index, int):
-            self._disconnect(self._callbacks[index])
-        else:
-            self._disconnect(*self._callbacks[index])
+        self._disconnect(index)
         del self._initial_callbacks[index]
         del self._callbacks[index]
+        del self._is_coroutines[index]
 
     def __len__(self) -> int:
         return len(self._callbacks)
 
     def __call__(self, *args: Any) -> None:
         if self.allow_calling or len(self._qt_signals) == 0:
-            for callback_function in self._callbacks:
-                if asyncio.iscoroutinefunction(callback_function) or (
-                    hasattr(callback_function, "func")
-                    and asyncio.iscoroutinefunction(callback_function.func)
-                ):
+            for callback_function, is_coroutine in zip(self._callbacks, self._is_coroutines):
+                if is_coroutine:
                     if sys.version_info >= (3, 7):  # noqa: UP036
                         task = asyncio.create_task(callback_function(*args))
                     else:
@@ -381,14 +434,15 @@ class BaseSignal(MutableSequence[Callback]):
         else:
             raise TypeError("'BaseSignal' is not callable")
 
-    def _connect(self, *slot_functions: CallbackFunc) -> None:
+    def _connect(self, index: int, slot_function: CallbackFunc) -> None:
+        r"""Connect the callback function to the signals at the given position."""
         for signal in self._qt_signals:
-            signal.connect(*slot_functions)
+            signal.insert(index, slot_function)
 
-    def _disconnect(self, *slot_functions: CallbackFunc) -> None:
-        r"""Disconnect all the callback functions of the signals."""
+    def _disconnect(self, index: Union[int, slice]) -> None:
+        r"""Disconnect the callback functions at the given position from the signals."""
         for signal_child in self._qt_signals:
-            signal_child.disconnect(*slot_functions)
+            signal_child.remove(index)
 
     def _create_callback_function(self, callback: Callback) -> CallbackFunc:
         """Create a callback function compatible with the signature of the signal.
@@ -408,27 +462,26 @@ class BaseSignal(MutableSequence[Callback]):
         - If it is a list of callback then a function is created calling each callback one
             after the other in the order of the given list.
             Each of the callback have there signature adapted as described above.
+
+        The log of the calls is added only if the debug level of SIGNAL_LOGGER is enabled
+        when the callback is connected, otherwise the emit doesn't pay any logging cost.
         """
         callback_function = None
-        partial_callback: List[CallbackFunc]
+        partial_callback: Optional[List[CallbackFunc]] = None
         if asyncio.iscoroutinefunction(callback):
             callback_function = self._to_partial(callback)
             # TODO: manage signal_log for coroutines
         elif callable(callback):
-            partial_callback = [
-                partial(self._signal_log, callback),
-                self._to_partial(callback),
-            ]
-            callback_function = partial(_call_callback_functions, partial_callback)
+            partial_callback = [self._to_partial(callback)]
         elif isinstance(callback, Iterable):
             if len(callback) == 0:
                 raise ValueError("Can't connect a signal to an empty list")
             elif all(callable(f) for f in callback):
-                partial_callback = [
-                    partial(self._signal_log, callback),
-                    *(self._to_partial(f) for f in callback),
-                ]
-                callback_function = partial(_call_callback_functions, partial_callback)
+                partial_callback = [self._to_partial(f) for f in callback]
+        if callback_function is None and partial_callback is not None:
+            if SIGNAL_LOGGER.isEnabledFor(logging.DEBUG):
+                partial_callback.insert(0, partial(self._signal_log, callback))
+            callback_function = partial(_call_callback_functions, partial_callback)
         if callback_function is None:
             raise ValueError("A signal can be connected only to a callable object")
         else:
@@ -436,8 +489,8 @@ class BaseSignal(MutableSequence[Callback]):
 
     def _to_partial(self, callback: CallbackFunc) -> CallbackFunc:
         """Return a partial with eventually view, parent_view, main_view, model assigned."""
-        signature = inspect.signature(callback)
-        if len(signature.parameters) == 0:
+        parameters = _get_signature_parameters(callback)
+        if len(parameters) == 0:
             return callback
         else:
             default_kwargs = {
@@ -452,7 +505,8 @@ class BaseSignal(MutableSequence[Callback]):
             index_positional_arg = 0
             missing_parameters_indices = list(range(len(self._parameter_types)))
             missing_annotation = False
-            for arg_name, callback_parameter in signature.parameters.items():
+            for callback_parameter in parameters:
+                arg_name = callback_parameter.name
                 if (
                     callback_parameter.kind == inspect.Parameter.KEYWORD_ONLY
                     and callback_parameter.default == inspect.Parameter.empty
@@ -12,9 +12,10 @@ from typing import Optional
 
 
 class _RunnableEmmiter(QObject):
-    r"""Object with a finished signal for a runnable."""
+    r"""Object with the finished and progressed signals for a runnable."""
 
     finished = Signal()
+    progressed = Signal()
 
 
 class _TaskRunnable(QRunnable):
@@ -25,10 +26,18 @@ class _TaskRunnable(QRunnable):
         self.setAutoDelete(True)
 
     def run(self) -> None:
-        self._task.run()
+        self._task.set_progress_callback(self._emit_progressed)
+        try:
+            self._task.run()
+        finally:
+            self._task.set_progress_callback(None)
         with contextlib.suppress(RuntimeError):
             self.emitter.finished.emit()
 
+    def _emit_progressed(self) -> None:
+        with contextlib.suppress(RuntimeError):
+            self.emitter.progressed.emit()
+
 
 class Worker(QObject):
     r"""Run the tasks."""
@@ -47,17 +56,24 @@ class Worker(QObject):
         r"""Check if all the tasks are finished therefore emit the finished signal."""
         if self.tasks is not None:
             nb_finished = self.tasks.count_finished()
-            if self._nb_runnables > 1:
-                self.progress.emit(nb_finished)
+            if self._nb_runnables > 1 or self.tasks.reports_progress:
+                self.progress.emit(self.tasks.get_progress_value())
             if self.tasks.is_sequential and nb_finished < self._nb_runnables:
                 thread_pool = QThreadPool.globalInstance()
                 runnable = _TaskRunnable(self.tasks[nb_finished])
                 runnable.emitter.finished.connect(self._task_finished)
+                runnable.emitter.progressed.connect(self._task_progressed)
                 thread_pool.start(runnable)
             elif nb_finished == self._nb_runnables:
                 self.tasks.close_log()
                 self.finished.emit()
 
+    @Slot()
+    def _task_progressed(self) -> None:
+        r"""Emit the progress signal if the task reports its progress."""
+        if self.tasks is not None and self.tasks.reports_progress:
+            self.progress.emit(self.tasks.get_progress_value())
+
     def run(self) -> None:
         r"""Run all the tasks in multiple threads or in one if the tasks are sequential."""
         self._clear()
@@ -67,11 +83,13 @@ class Worker(QObject):
             if self.tasks.is_sequential:
                 runnable = _TaskRunnable(self.tasks[0])
                 runnable.emitter.finished.connect(self._task_finished)
+                runnable.emitter.progressed.connect(self._task_progressed)
                 thread_pool.start(runnable)
             else:
                 for task in self.tasks:
                     runnable = _TaskRunnable(task)
                     runnable.emitter.finished.connect(self._task_finished)
+                    runnable.emitter.progressed.connect(self._task_progressed)
                     thread_pool.start(runnable)
 
     @Slot()
@@ -69,12 +69,16 @@ def save_before_exit(*, main_view: MainView, model: AnyModel) -> bool:
 
 def undo(*, main_view: MainView, model: AnyModel) -> None:
     model.undo()
-    tools.update_all_views(main_view, reset_pagination=True)
+    tools.update_views_of_data_sources(
+        main_view, model.get_modified_data_sources(), reset_pagination=True
+    )
 
 
 def redo(*, main_view: MainView, model: AnyModel) -> None:
     model.redo()
-    tools.update_all_views(main_view, reset_pagination=True)
+    tools.update_views_of_data_sources(
+        main_view, model.get_modified_data_sources(), reset_pagination=True
+    )
 
 
 def forced_exit(*, main_view: MainView, force_close: bool) -> None:
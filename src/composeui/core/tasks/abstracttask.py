@@ -4,7 +4,7 @@ import logging
 import traceback
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
 
 class TaskStatus(Enum):
@@ -17,7 +17,14 @@ class TaskStatus(Enum):
 
 
 class AbstractTask(ABC):
-    r"""Definition of a task to run in another thread."""
+    r"""Definition of a task to run in another thread.
+
+    A task reporting its progress sets reports_progress to True and calls set_progress while
+    running. It can also stop when is_canceled becomes True and return False to be canceled.
+    """
+
+    # if the task reports its progress with set_progress
+    reports_progress: bool = False
 
     def __init__(self, capture_exceptions_as_errors: bool = False) -> None:
         self._status: TaskStatus = TaskStatus.NOT_STARTED
@@ -27,6 +34,9 @@ class AbstractTask(ABC):
         self._logger: logging.Logger = logging.getLogger(__name__)
         self._is_debug: bool = False
         self.is_canceled: bool = False
+        # fraction of the work done by the running task
+        self.progress: float = 0.0
+        self._progress_callback: Optional[Callable[[], None]] = None
 
     @property
     def status(self) -> TaskStatus:
@@ -58,6 +68,16 @@ class AbstractTask(ABC):
     def set_logger(self, logger: logging.Logger) -> None:
         self._logger = logger
 
+    def set_progress_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        r"""Set the function called when the progress of the task changes."""
+        self._progress_callback = callback
+
+    def set_progress(self, progress: float) -> None:
+        r"""Set the fraction of the work done and notify it."""
+        self.progress = min(max(progress, 0.0), 1.0)
+        if self._progress_callback is not None:
+            self._progress_callback()
+
     def run(self) -> bool:
         r"""Run the task, print errors and update the status."""
         if self._logger is None:
@@ -68,6 +88,7 @@ class AbstractTask(ABC):
         else:
             self.error_message = ""
             self.warning_message = ""
+            self.progress = 0.0
             self._status = TaskStatus.RUNNING
             try:
                 is_success = self._run()
@@ -83,8 +104,13 @@ class AbstractTask(ABC):
                 self._status = TaskStatus.FAILED
                 is_success = False
             else:
+                # the flag is set by another thread while the task is running
+                is_canceled: bool = self.is_canceled
                 if self.error_message != "":
                     self._status = TaskStatus.FAILED
+                elif is_canceled and is_success is False:
+                    # the task has stopped because it has been canceled while running
+                    self._status = TaskStatus.CANCELED
                 elif self.warning_message != "":
                     self._status = TaskStatus.WARNING
                 else:
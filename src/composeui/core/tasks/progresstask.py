@@ -27,7 +27,7 @@ def run(*, view: ProgressView[T]) -> None:
 
 def progress(*, view: ProgressView[T]) -> None:
     if view.tasks is not None:
-        view.value = view.tasks.count_finished()
+        view.value = view.tasks.get_progress_value()
 
 
 def finished(*, view: ProgressView[T]) -> None:
@@ -43,6 +43,9 @@ def update_progress_range(view: Progress[T], is_about_to_run: bool = False) -> N
     view.minimum = 0
     if view.tasks is None:
         raise ValueError("The tasks must be set first.")
+    elif view.tasks.reports_progress:
+        view.is_percentage_visible = True
+        view.maximum = 100
     elif len(view.tasks) > 1:
         view.is_percentage_visible = True
         view.maximum = len(view.tasks)
@@ -74,10 +74,21 @@ class Tasks(Sequence[T_co]):
                 # can't break because a task may have failed
         return _status
 
+    @property
+    def reports_progress(self) -> bool:
+        r"""Check if there is only one task and it reports its progress."""
+        return len(self._tasks) == 1 and self._tasks[0].reports_progress
+
     def count_finished(self) -> int:
         r"""Count the number of tasks finished."""
         return sum(task.is_finished for task in self._tasks)
 
+    def get_progress_value(self) -> int:
+        r"""Get the percentage of the task reporting its progress or the number of finished."""
+        if self.reports_progress:
+            return 100 if self._tasks[0].is_finished else int(100 * self._tasks[0].progress)
+        return self.count_finished()
+
     def run(self) -> bool:
         is_success = False
         for task in self._tasks:
@@ -91,8 +102,11 @@ class Tasks(Sequence[T_co]):
         raise NotImplementedError
 
     def cancel(self) -> None:
+        r"""Cancel the tasks not started and the running tasks reporting their progress."""
         for task in self._tasks:
-            if task.status == TaskStatus.NOT_STARTED:
+            if task.status == TaskStatus.NOT_STARTED or (
+                task.status == TaskStatus.RUNNING and task.reports_progress
+            ):
                 task.is_canceled = True
 
     def clear(self) -> None:
@@ -1,6 +1,7 @@
 r"""Common tools."""
 
 from composeui import linkedtablefigure
+from composeui.core.updatescheduler import UpdateOptions, UpdateScheduler
 from composeui.core.views.view import View
 from composeui.form import form
 from composeui.form.abstractformitems import AbstractFormItems
@@ -16,19 +17,57 @@ from composeui.mainview.views.messageview import MessageView, MessageViewType
 
 from typing_extensions import OrderedDict
 
+import contextlib
 from collections import deque
-from typing import List, Optional, Set, Tuple
+from typing import Callable, Generator, List, Optional, Set, Tuple
 
 
 def update_all_views(main_view: MainView, reset_pagination: bool = False) -> None:
     r"""Update all the views."""
     # call the slots associated with the update all signal
     main_view.update_all()
-    views = deque(main_view.children.values())
-    while len(views) > 0:
-        view = views.pop()
-        views.extendleft(view.children.values())
-        _update_view(view, reset_pagination=reset_pagination)
+    views: List[View] = []
+    children = deque(main_view.children.values())
+    while len(children) > 0:
+        view = children.pop()
+        children.extendleft(view.children.values())
+        views.append(view)
+    _update_scheduler.schedule(
+        views, UpdateOptions(reset_pagination=reset_pagination), with_dependencies=False
+    )
+
+
+def update_views_of_data_sources(
+    main_view: MainView, data_sources: Optional[Set[str]], reset_pagination: bool = False
+) -> None:
+    r"""Update the views reading the given data sources and the views depending on them.
+
+    The data sources of a view are the ones of its items (see get_data_sources). The views
+    with unknown data sources are always updated and all the views are updated if the data
+    sources are None.
+    """
+    if data_sources is None:
+        update_all_views(main_view, reset_pagination=reset_pagination)
+        return
+    # call the slots associated with the update all signal
+    main_view.update_all()
+    views: List[View] = []
+    children = deque(main_view.children.values())
+    while len(children) > 0:
+        view = children.pop()
+        children.extendleft(view.children.values())
+        view_data_sources = _get_data_sources(view)
+        if view_data_sources is None or not view_data_sources.isdisjoint(data_sources):
+            views.append(view)
+    _update_scheduler.schedule(views, UpdateOptions(reset_pagination=reset_pagination))
+
+
+def _get_data_sources(view: View) -> Optional[Set[str]]:
+    r"""Get the data sources read by the view or None if they are unknown."""
+    items = getattr(view, "items", None)
+    if isinstance(items, (AbstractTableItems, AbstractTreeItems, AbstractFormItems)):
+        return items.get_data_sources()
+    return None
 
 
 def update_view_with_dependencies(
@@ -38,20 +77,34 @@ def update_view_with_dependencies(
     reset_pagination: bool = False,
 ) -> None:
     r"""Update the given view and the views which depends on it."""
-    dependencies = deque([view])
-    updated_dependencies: Set[View] = set()
-    while len(dependencies) > 0:
-        dependent_view = dependencies.popleft()
-        _update_view(
-            dependent_view,
+    _update_scheduler.schedule(
+        [view],
+        UpdateOptions(
             keep_selection=keep_selection,
             before_validation=before_validation,
             reset_pagination=reset_pagination,
-        )
-        updated_dependencies.add(dependent_view)
-        for dependent_child_view in dependent_view.dependencies:
-            if dependent_child_view not in updated_dependencies:
-                dependencies.append(dependent_child_view)
+        ),
+    )
+
+
+@contextlib.contextmanager
+def batch_updates() -> Generator[None, None, None]:
+    r"""Update the views once at the end of the block instead of at each request."""
+    with _update_scheduler.batch():
+        yield
+
+
+def defer_updates(call_later: Optional[Callable[[Callable[[], None]], None]]) -> None:
+    r"""Update the views using the given function, e.g. at the next event loop iteration.
+
+    If call_later is None, the views are updated immediately again.
+    """
+    _update_scheduler.set_call_later(call_later)
+
+
+def flush_updates() -> None:
+    r"""Apply the pending updates of the views synchronously."""
+    _update_scheduler.flush()
 
 
 def _update_view(
@@ -112,6 +165,18 @@ def _update_view(
         view.block_signals = False
 
 
+def _update_view_with_options(view: View, options: UpdateOptions) -> None:
+    _update_view(
+        view,
+        keep_selection=options.keep_selection,
+        before_validation=options.before_validation,
+        reset_pagination=options.reset_pagination,
+    )
+
+
+_update_scheduler = UpdateScheduler(_update_view_with_options)
+
+
 def find_focus_table(view: View) -> Optional[View]:
     r"""Find the table with the focus."""
     if isinstance(view, View):
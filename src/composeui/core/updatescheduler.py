@@ -0,0 +1,150 @@
+r"""Scheduler of the updates of the views."""
+
+from composeui.core.views.view import View
+
+import contextlib
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Generator, Iterable, List, Optional
+
+
+@dataclass(frozen=True)
+class UpdateOptions:
+    r"""Options of the update of a view.
+
+    - if keep_selection is true, the current selection is preserved.
+    - if before_validation is true, the view is not updated (see tools.update_view).
+    - if reset_pagination is true, the view is moved to the last page.
+    """
+
+    keep_selection: bool = False
+    before_validation: bool = False
+    reset_pagination: bool = False
+
+    def merge(self, other: "UpdateOptions") -> "UpdateOptions":
+        r"""Merge the options of two updates of the same view."""
+        return UpdateOptions(
+            keep_selection=self.keep_selection or other.keep_selection,
+            # the view is updated if one of the updates needs it
+            before_validation=self.before_validation and other.before_validation,
+            reset_pagination=self.reset_pagination or other.reset_pagination,
+        )
+
+
+class UpdateScheduler:
+    r"""Collect the views to update and update each of them once.
+
+    The scheduled views are updated in the order of their dependencies: a view is updated
+    after the views it depends on.
+    Without a function to call later, the updates are flushed immediately, except inside a
+    `batch` where they are flushed at the end of the outermost batch. If a function to call
+    later is given, the updates are flushed by this function, for example at the next
+    iteration of the event loop as done by the Qt apps run with defer_updates (see
+    QtBaseApp.run).
+    `flush` can be called at any moment to apply the pending updates synchronously, for
+    example in the tests or before reading the state of an updated view.
+    """
+
+    def __init__(self, update_view: Callable[[View, UpdateOptions], None]) -> None:
+        self._update_view = update_view
+        self._pending: Dict[View, UpdateOptions] = {}
+        self._batch_depth = 0
+        self._is_flushing = False
+        self._is_flush_scheduled = False
+        self._call_later: Optional[Callable[[Callable[[], None]], None]] = None
+
+    def set_call_later(
+        self, call_later: Optional[Callable[[Callable[[], None]], None]]
+    ) -> None:
+        r"""Set the function used to flush the updates later or None to flush immediately."""
+        self._call_later = call_later
+
+    def schedule(
+        self,
+        views: Iterable[View],
+        options: UpdateOptions = UpdateOptions(),  # noqa: B008
+        with_dependencies: bool = True,
+    ) -> None:
+        r"""Schedule the update of the views and eventually of the views depending on them."""
+        views_to_update = deque(views)
+        visited = set()
+        while len(views_to_update) > 0:
+            view = views_to_update.popleft()
+            if view in visited:
+                continue
+            visited.add(view)
+            if view in self._pending:
+                self._pending[view] = self._pending[view].merge(options)
+            else:
+                self._pending[view] = options
+            if with_dependencies:
+                views_to_update.extend(view.dependencies)
+        self._request_flush()
+
+    @contextlib.contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        r"""Collect the updates and flush them at the end of the outermost batch."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._request_flush()
+
+    def flush(self) -> None:
+        r"""Update all the pending views in the order of their dependencies."""
+        if self._is_flushing:
+            # the views scheduled during the flush are updated by the current flush
+            return
+        self._is_flushing = True
+        try:
+            while len(self._pending) > 0:
+                pending, self._pending = self._pending, {}
+                for view in self._sort_by_dependencies(list(pending)):
+                    self._update_view(view, pending[view])
+        finally:
+            self._is_flushing = False
+
+    def _request_flush(self) -> None:
+        if self._batch_depth > 0 or len(self._pending) == 0:
+            return
+        if self._call_later is None:
+            self.flush()
+        elif not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            self._call_later(self._scheduled_flush)
+
+    def _scheduled_flush(self) -> None:
+        self._is_flush_scheduled = False
+        self.flush()
+
+    @staticmethod
+    def _sort_by_dependencies(views: List[View]) -> List[View]:
+        r"""Sort the views to have each view after the views it depends on.
+
+        The order of the given views is kept when there is no dependency between them and
+        the views of a cycle of dependencies are left in this order.
+        """
+        positions = {view: i for i, view in enumerate(views)}
+        nb_parents = [0] * len(views)
+        for view in views:
+            for dependent_view in view.dependencies:
+                if dependent_view in positions and dependent_view is not view:
+                    nb_parents[positions[dependent_view]] += 1
+        ready = [i for i, nb in enumerate(nb_parents) if nb == 0]
+        sorted_views: List[View] = []
+        while len(ready) > 0:
+            view = views[heapq.heappop(ready)]
+            sorted_views.append(view)
+            for dependent_view in view.dependencies:
+                if dependent_view in positions and dependent_view is not view:
+                    position = positions[dependent_view]
+                    nb_parents[position] -= 1
+                    if nb_parents[position] == 0:
+                        heapq.heappush(ready, position)
+        if len(sorted_views) < len(views):
+            # the views in a cycle of dependencies
+            is_sorted = set(sorted_views)
+            sorted_views.extend(view for view in views if view not in is_sorted)
+        return sorted_views
@@ -18,7 +18,7 @@ from typing_extensions import OrderedDict, Self
 
 import itertools as it
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Set, Tuple, Union
 
 
 class AbstractFormItems(ABC, Generic[AnyModel, AnyFormView]):
@@ -27,6 +27,16 @@ class AbstractFormItems(ABC, Generic[AnyModel, AnyFormView]):
         self._view: AnyFormView = view
         self.combobox_items: Dict[str, AbstractComboboxItems] = {}
 
+    def get_data_sources(self) -> Optional[Set[str]]:
+        """Get the data sources read by the items.
+
+        The data sources are for example the names of the tables or of the fields of the root
+        as reported by the history of the stores. They are used to update only the views
+        whose data have been modified by an undo/redo.
+        Return None if they are unknown, then the view is always updated.
+        """
+        return None
+
     def get_label(self, field: str, parent_fields: Tuple[str, ...] = ()) -> str:
         """Get the label for the item of the form with the given field."""
         return field.replace("_", " ").title()
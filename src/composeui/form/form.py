@@ -57,9 +57,13 @@ def update_text(
     if view.items is not None:
         if with_update:
             with model.record_history():
-                return view.items.set_value(view.field_name, view.text, view.parent_fields)
+                return _notify_change(
+                    model, view.items.set_value(view.field_name, view.text, view.parent_fields)
+                )
         else:
-            view.items.set_value(view.field_name, view.text, view.parent_fields)
+            _notify_change(
+                model, view.items.set_value(view.field_name, view.text, view.parent_fields)
+            )
     return False
 
 
@@ -75,9 +79,14 @@ def update_vector(
     if view.items is not None:
         if with_update:
             with model.record_history():
-                return view.items.set_value(view.field_name, view.values, view.parent_fields)
+                return _notify_change(
+                    model,
+                    view.items.set_value(view.field_name, view.values, view.parent_fields),
+                )
         else:
-            view.items.set_value(view.field_name, view.values, view.parent_fields)
+            _notify_change(
+                model, view.items.set_value(view.field_name, view.values, view.parent_fields)
+            )
     return False
 
 
@@ -93,9 +102,14 @@ def update_value(
     if view.items is not None:
         if with_update:
             with model.record_history():
-                return view.items.set_value(view.field_name, view.value, view.parent_fields)
+                return _notify_change(
+                    model,
+                    view.items.set_value(view.field_name, view.value, view.parent_fields),
+                )
         else:
-            view.items.set_value(view.field_name, view.value, view.parent_fields)
+            _notify_change(
+                model, view.items.set_value(view.field_name, view.value, view.parent_fields)
+            )
     return False
 
 
@@ -111,16 +125,22 @@ def update_current_index(
     if view.items is not None:
         if with_update:
             with model.record_history():
-                return view.items.set_current_index(
+                return _notify_change(
+                    model,
+                    view.items.set_current_index(
+                        view.field_name,
+                        view.current_index,
+                        view.parent_fields,
+                    ),
+                )
+        else:
+            _notify_change(
+                model,
+                view.items.set_current_index(
                     view.field_name,
                     view.current_index,
                     view.parent_fields,
-                )
-        else:
-            view.items.set_current_index(
-                view.field_name,
-                view.current_index,
-                view.parent_fields,
+                ),
             )
     return False
 
@@ -135,7 +155,9 @@ def open_select_path_view(
         view.text = str(path)
         if view.items is not None:
             with model.record_history():
-                return view.items.set_value(view.field_name, view.text, view.parent_fields)
+                return _notify_change(
+                    model, view.items.set_value(view.field_name, view.text, view.parent_fields)
+                )
     return False
 
 
@@ -153,10 +175,13 @@ def set_field_available(*, view: CheckBoxView[AnyFormItems], model: AnyModel) ->
     """Set if the field is available or not."""
     if view.items is not None:
         with model.record_history():
-            view.items.set_field_available(
-                view.field_name,
-                view.is_checked,
-                view.parent_fields,
+            _notify_change(
+                model,
+                view.items.set_field_available(
+                    view.field_name,
+                    view.is_checked,
+                    view.parent_fields,
+                ),
             )
     return False
 
@@ -181,6 +206,13 @@ def update_apply_form(*, view: FormView[AnyFormItems], model: AnyModel) -> None:
             update_apply_form(view=child_view, model=model)
 
 
+def _notify_change(model: AnyModel, is_ok: bool) -> bool:
+    """Notify the model of the modification if the value has been set."""
+    if is_ok:
+        model.notify_change()
+    return is_ok
+
+
 def update_infos(
     master_view: FormView[AnyFormItems],
     *,
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 
 class AbstractHistory(ABC):
@@ -27,6 +27,14 @@ class AbstractHistory(ABC):
         """
         return None
 
+    def get_modified_data_sources(self) -> Optional[Set[str]]:
+        """Get the data sources modified by the last undo/redo.
+
+        The data sources are for example the names of the tables or of the fields of the root.
+        Return None if they are unknown.
+        """
+        return None
+
     @abstractmethod
     def undo(self) -> None:
         """Undo the last modification on the store."""
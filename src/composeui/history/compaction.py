@@ -0,0 +1,84 @@
+"""Remove the old actions of the logs of a history by batches."""
+
+import typing
+from typing import Callable, ClassVar, Optional, Sequence
+
+if typing.TYPE_CHECKING:
+    from composeui.store.sqlitestore import SqliteStore
+
+
+class HistoryCompactor:
+    """Remove the actions exceeding the capacity of a history by batches.
+
+    The pruning is deferred until `prune_interval` actions exceed the capacity, so the
+    recording of an action usually only appends to the logs and the cost of the deletion is
+    shared by the actions of a batch.
+    If `call_later` is set, a complete batch is removed by this function outside of the
+    recording, for example at the next iteration of the event loop as done by the Qt apps
+    (see QtBaseApp.run), otherwise it is removed at the end of the recording.
+    The pruning uses a connection of the store between two transactions of the history, so it
+    never waits for a lock. The freed pages are then given back to the file system with an
+    incremental vacuum if the auto_vacuum pragma of the store is incremental (see
+    JsonHistory), otherwise they are reused by the next actions.
+    """
+
+    # number of actions exceeding the capacity before they are removed
+    prune_interval = 10
+    # function used to remove a complete batch later or None to remove it immediately
+    call_later: ClassVar[Optional[Callable[[Callable[[], None]], None]]] = None
+
+    def __init__(self, store: "SqliteStore", log_tables: Sequence[str]) -> None:
+        self._store = store
+        self._log_tables = tuple(log_tables)
+        self._first_idx: Optional[int] = None
+        self._max_idx: Optional[int] = None
+        self._is_flush_scheduled = False
+
+    def compact(self, max_idx: int) -> None:
+        """Remove the actions with an index lower or equal to the given one.
+
+        The actions are removed once the batch is complete, eventually later (see
+        call_later).
+        """
+        if max_idx <= 0:
+            return
+        if self._first_idx is None or self._max_idx is None:
+            self._first_idx = max_idx
+            self._max_idx = max_idx
+        else:
+            self._max_idx = max(self._max_idx, max_idx)
+        if self._max_idx - self._first_idx + 1 >= self.prune_interval:
+            call_later = type(self).call_later
+            if call_later is None:
+                self.flush()
+            elif not self._is_flush_scheduled:
+                self._is_flush_scheduled = True
+                call_later(self._flush_later)
+
+    def flush(self) -> None:
+        """Remove the pending actions now."""
+        max_idx = self._max_idx
+        if max_idx is None:
+            return
+        self.clear()
+        with self._store.get_connection() as db_conn:
+            for table in self._log_tables:
+                db_conn.execute(
+                    f"""--sql
+                    DELETE FROM {table} WHERE idx<=:max_idx
+                    """,
+                    {"max_idx": max_idx},
+                )
+            db_conn.commit()
+            # each step of the vacuum is a row of the result
+            db_conn.execute("PRAGMA incremental_vacuum").fetchall()
+
+    def _flush_later(self) -> None:
+        """Remove the pending actions, called by call_later."""
+        self._is_flush_scheduled = False
+        self.flush()
+
+    def clear(self) -> None:
+        """Forget the pending actions, for example because the history has been cleared."""
+        self._first_idx = None
+        self._max_idx = None
@@ -0,0 +1,100 @@
+"""Compute and apply the differences between two json compatible structures.
+
+A patch is a list of operations inspired by the JSON Patch format (RFC 6902):
+    - {"op": "add", "path": [...], "value": ...}
+    - {"op": "remove", "path": [...]}
+    - {"op": "replace", "path": [...], "value": ...}
+
+The path is the list of the keys of the dictionaries and the indices of the lists to go from
+the root of the structure to the modified value. An empty path is the root itself.
+"""
+
+from typing_extensions import TypeAlias
+
+from typing import Any, Dict, List, Tuple, Union
+
+JsonPath: TypeAlias = List[Union[str, int]]
+Patch: TypeAlias = List[Dict[str, Any]]
+
+
+def make_patch(source: Any, target: Any) -> Patch:
+    """Make the patch to transform the source into the target."""
+    patch: Patch = []
+    _make_patch(source, target, [], patch)
+    return patch
+
+
+def apply_patch(state: Any, patch: Patch) -> Tuple[Any, Patch]:
+    """Apply the patch to the given state.
+
+    The state is modified in place, use the returned state because the root can be replaced.
+    Returns the new state and the inverse patch to go back to the given state.
+    """
+    inverse_patch: Patch = []
+    for operation in patch:
+        op = operation["op"]
+        path = operation["path"]
+        if len(path) == 0:
+            inverse_patch.append({"op": "replace", "path": [], "value": state})
+            state = operation["value"]
+            continue
+        parent = state
+        for key in path[:-1]:
+            parent = parent[_get_key(parent, key)]
+        key = path[-1]
+        if op == "add":
+            if isinstance(parent, list):
+                parent.insert(key, operation["value"])
+            else:
+                parent[key] = operation["value"]
+            inverse_patch.append({"op": "remove", "path": path})
+        elif op == "remove":
+            key = _get_key(parent, key)
+            inverse_patch.append({"op": "add", "path": path, "value": parent.pop(key)})
+        elif op == "replace":
+            key = _get_key(parent, key)
+            inverse_patch.append({"op": "replace", "path": path, "value": parent[key]})
+            parent[key] = operation["value"]
+        else:
+            msg = f"Unknown operation '{op}' in the patch"
+            raise ValueError(msg)
+    inverse_patch.reverse()
+    return state, inverse_patch
+
+
+def _make_patch(source: Any, target: Any, path: JsonPath, patch: Patch) -> None:
+    if type(source) is not type(target):
+        patch.append({"op": "replace", "path": path, "value": target})
+    elif isinstance(source, dict):
+        for key, value in source.items():
+            if key in target:
+                _make_patch(value, target[key], [*path, key], patch)
+            else:
+                patch.append({"op": "remove", "path": [*path, key]})
+        for key, value in target.items():
+            if key not in source:
+                patch.append({"op": "add", "path": [*path, key], "value": value})
+    elif isinstance(source, list):
+        nb_common_items = min(len(source), len(target))
+        for index in range(nb_common_items):
+            _make_patch(source[index], target[index], [*path, index], patch)
+        # remove from the end to keep the indices valid
+        for index in range(len(source) - 1, nb_common_items - 1, -1):
+            patch.append({"op": "remove", "path": [*path, index]})
+        for index in range(nb_common_items, len(target)):
+            patch.append({"op": "add", "path": [*path, index], "value": target[index]})
+    elif source != target:
+        patch.append({"op": "replace", "path": path, "value": target})
+
+
+def _get_key(container: Any, key: Union[str, int]) -> Any:
+    """Get the key of the container.
+
+    The keys of the dictionaries are converted to strings when the patch is saved as json,
+    so the original key is searched if the key is not found.
+    """
+    if isinstance(container, dict) and key not in container:
+        for container_key in container:
+            if str(container_key) == str(key):
+                return container_key
+    return key
@@ -1,12 +1,16 @@
+from composeui.history import jsondiff
 from composeui.history.abstracthistory import AbstractHistory
+from composeui.history.compaction import HistoryCompactor
 from composeui.store.sqlitestore import SqliteStore
 
 from typing_extensions import Literal, TypeAlias
 
+import json
 import sqlite3
 import typing
+import zlib
 from pathlib import Path
-from typing import Any, Optional, TypeVar
+from typing import Any, Optional, Set, Tuple, TypeVar
 
 if typing.TYPE_CHECKING:
     from composeui.store.jsonstore import JsonStore
@@ -17,14 +21,46 @@ T = TypeVar("T")
 
 
 class JsonHistory(AbstractHistory):
+    """History of a JsonStore.
 
-    def __init__(self, store: "JsonStore[T]") -> None:
+    Only the differences between the states of the root are saved (see jsondiff) except
+    every `checkpoint_interval` actions where the whole state is saved.
+    The differences are computed from the state of the root serialized when the recording
+    starts or before an undo/redo, so the modifications done without recording are not
+    saved with the next action.
+
+    If the store tracks its changes, the state of the root is kept after each action and
+    serialized again only when the version of the root has moved. So an action without a
+    notified modification is skipped without serializing the root. Set
+    `detect_untracked_changes` to serialize the root at each action like without tracking, to
+    also save the modifications not notified.
+
+    The states and the patches are saved compressed with zlib and the actions exceeding the
+    capacity are removed by batches (see HistoryCompactor).
+    """
+
+    # level of compression of the saved states and patches
+    compression_level = 1
+    # if the version of a root tracking its changes is not trusted to detect its modifications
+    detect_untracked_changes = False
+
+    def __init__(self, store: "JsonStore[T]", checkpoint_interval: int = 20) -> None:
         self._store = store
+        self._checkpoint_interval = checkpoint_interval
+        self._state: Optional[Any] = None
+        self._state_version = -1
+        self._modified_data_sources: Optional[Set[str]] = None
         self._history_store = SqliteStore(with_history=False)
+        self._compactor = HistoryCompactor(self._history_store, ["_CUI_UNDO_LOG"])
         self.create_tables()
 
     def create_tables(self) -> None:
         with self._history_store.get_connection() as db_conn:
+            if db_conn.execute("SELECT count(*) FROM sqlite_master").fetchone()[0] == 0:
+                # the pages freed by the removal of the old actions are given back to the file
+                # system (see HistoryCompactor), the vacuum of the empty database applies it
+                db_conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                db_conn.execute("VACUUM")
             db_conn.execute(
                 "CREATE TABLE IF NOT EXISTS _CUI_INDEX(h_id PRIMARY KEY, current_idx)"
             )
@@ -34,7 +70,8 @@ class JsonHistory(AbstractHistory):
                 CREATE TABLE IF NOT EXISTS _CUI_UNDO_LOG(
                     c_id INTEGER PRIMARY KEY NOT NULL,
                     idx INTEGER, -- index of an action
-                    state_json TEXT
+                    state_json BLOB, -- compressed json or text for the old histories
+                    is_patch INTEGER DEFAULT 0 -- state_json is a patch or the whole state
                 )
                 """
             )
@@ -43,80 +80,82 @@ class JsonHistory(AbstractHistory):
                 CREATE TABLE IF NOT EXISTS _CUI_REDO_LOG(
                     c_id INTEGER PRIMARY KEY NOT NULL,
                     idx INTEGER,
-                    state_json TEXT
+                    state_json BLOB,
+                    is_patch INTEGER DEFAULT 0
                 )
                 """
             )
+            # add the column for the histories saved before the patches
+            for log_name in ("undo", "redo"):
+                columns = db_conn.execute(f"PRAGMA table_info(_CUI_{log_name.upper()}_LOG)")
+                if "is_patch" not in (row["name"] for row in columns):
+                    db_conn.execute(
+                        f"""--sql
+                        ALTER TABLE _CUI_{log_name.upper()}_LOG
+                        ADD COLUMN is_patch INTEGER DEFAULT 0
+                        """
+                    )
             db_conn.commit()
 
     def open_history(self, filepath: Optional[Path]) -> None:
         assert filepath is not None
+        self._compactor.clear()
         self._history_store.open_study(filepath)
+        self.create_tables()
+        self._state = None
 
     def save_history(self, filepath: Path) -> None:
+        self._compactor.flush()
         self._history_store.save_study(filepath)
 
     def get_extension(self) -> Optional[str]:
         return self._history_store.get_extension()
 
     def clear_history(self) -> None:
+        self._compactor.clear()
         self._history_store.clear_study()
         self.create_tables()
+        self._state = None
+
+    def get_modified_data_sources(self) -> Optional[Set[str]]:
+        """Get the fields of the root modified by the last undo/redo.
+
+        Return None if the whole root has been replaced.
+        """
+        return self._modified_data_sources
 
     def undo(self) -> None:
         """Undo the last modification on the store."""
-        with self._history_store.get_connection() as db_conn:
-            current_idx = self._get_current_idx(db_conn)
-            state_json = self._get_state_json(current_idx, "undo", db_conn)
-            if state_json is not None:
-                # remove the state from the undo log
-                db_conn.execute(
-                    """--sql
-                    DELETE FROM _CUI_UNDO_LOG WHERE idx=:current_idx
-                    """,
-                    {"current_idx": current_idx},
-                )
-                # decrement the index of the history
-                self._decrement_current_idx(db_conn)
-                # set the current state to the redo log
-                self._set_state_json(self._get_current_idx(db_conn), "redo", db_conn)
-                # apply the state
-                self._store.root = self._store.from_json(state_json)
-                db_conn.commit()
+        self._apply("undo", "redo")
 
     def redo(self) -> None:
         """Redo the last undo modification on the store."""
-        with self._history_store.get_connection() as db_conn:
-            current_idx = self._get_current_idx(db_conn)
-            state_json = self._get_state_json(current_idx, "redo", db_conn)
-            if state_json is not None:
-                # remove the state from the redo log
-                db_conn.execute(
-                    """--sql
-                    DELETE FROM _CUI_REDO_LOG WHERE idx=:current_idx
-                    """,
-                    {"current_idx": current_idx},
-                )
-                # increment the index
-                self._increment_current_idx(db_conn)
-                # set the current state to the undo log
-                self._set_state_json(self._get_current_idx(db_conn), "undo", db_conn)
-                # apply the state
-                self._store.root = self._store.from_json(state_json)
-                db_conn.commit()
+        self._apply("redo", "undo")
 
     def start_recording(self) -> None:
         """Start recording the history."""
         with self._history_store.get_connection() as db_conn:
             self._increment_current_idx(db_conn)
-            self._set_state_json(self._get_current_idx(db_conn), "undo", db_conn)
             db_conn.commit()
+        self._get_current_state()
 
     def stop_recording(self) -> None:
         """Stop recording the history."""
         with self._history_store.get_connection() as db_conn:
             current_idx = self._get_current_idx(db_conn)
-            if self._has_state_changed(current_idx, db_conn):
+            if (
+                self._is_version_trusted()
+                and self._state is not None
+                and self._state_version == self._store.get_version()
+            ):
+                # the root has not been modified, it doesn't need to be serialized
+                new_state = old_state = self._state
+                undo_patch: jsondiff.Patch = []
+            else:
+                new_state = self._store.to_builtins()
+                old_state = self._state if self._state is not None else new_state
+                undo_patch = jsondiff.make_patch(new_state, old_state)
+            if len(undo_patch) > 0:
                 # The log of the redo need to be deleted because the future have been modified
                 # so the redo log contains an outdated timeline
                 db_conn.execute(
@@ -124,55 +163,125 @@ class JsonHistory(AbstractHistory):
                     DELETE FROM _CUI_REDO_LOG
                     """
                 )
-                # Remove the old actions to not exceed the capacity of the history
-                db_conn.execute(
-                    f"""--sql
-                    DELETE FROM _CUI_UNDO_LOG
-                    WHERE idx<={self._get_current_idx(db_conn) - self.get_capacity()}
-                    """
-                )
+                if current_idx % self._checkpoint_interval == 0:
+                    self._set_state_json(current_idx, "undo", old_state, False, db_conn)
+                else:
+                    self._set_state_json(current_idx, "undo", undo_patch, True, db_conn)
+                self._set_state(new_state)
             else:
                 # the state don't changed so it doesn't need to be saved
+                self._decrement_current_idx(db_conn)
+            db_conn.commit()
+        if len(undo_patch) > 0:
+            # Remove the old actions to not exceed the capacity of the history
+            self._compactor.compact(current_idx - self.get_capacity())
+
+    def _apply(self, log_name: LogName, inverse_log_name: LogName) -> None:
+        """Apply the last state of the given log and save the inverse into the other log."""
+        self._compactor.flush()
+        with self._history_store.get_connection() as db_conn:
+            current_idx = self._get_current_idx(db_conn)
+            state_json = self._get_state_json(current_idx, log_name, db_conn)
+            modified_data_sources: Optional[Set[str]] = set()
+            if state_json is not None:
+                state_data, is_patch = state_json
+                # remove the state from the log
                 db_conn.execute(
-                    """--sql
-                    DELETE FROM _CUI_UNDO_LOG WHERE idx = :current_idx
+                    f"""--sql
+                    DELETE FROM _CUI_{log_name.upper()}_LOG WHERE idx=:current_idx
                     """,
                     {"current_idx": current_idx},
                 )
-                self._decrement_current_idx(db_conn)
-            db_conn.commit()
+                # move the index of the history
+                if log_name == "undo":
+                    self._decrement_current_idx(db_conn)
+                else:
+                    self._increment_current_idx(db_conn)
+                current_state = self._get_current_state()
+                new_idx = self._get_current_idx(db_conn)
+                is_checkpoint = inverse_log_name == "undo" and (
+                    new_idx % self._checkpoint_interval == 0
+                )
+                if is_checkpoint:
+                    self._set_state_json(new_idx, "undo", current_state, False, db_conn)
+                if is_patch:
+                    new_state, inverse_patch = jsondiff.apply_patch(current_state, state_data)
+                else:
+                    new_state = state_data
+                    inverse_patch = jsondiff.make_patch(new_state, current_state)
+                modified_data_sources = _get_modified_fields(inverse_patch)
+                # set the current state to the other log
+                if not is_checkpoint:
+                    self._set_state_json(
+                        new_idx, inverse_log_name, inverse_patch, True, db_conn
+                    )
+                # apply the state
+                self._store.root = self._store.from_json(json.dumps(new_state))
+                self._set_state(new_state)
+                db_conn.commit()
+            self._modified_data_sources = modified_data_sources
+
+    def _get_current_state(self) -> Any:
+        """Get the state of the root, serialized again if it may have been modified."""
+        if (
+            self._state is None
+            or not self._is_version_trusted()
+            or self._state_version != self._store.get_version()
+        ):
+            self._set_state(self._store.to_builtins())
+        return self._state
+
+    def _is_version_trusted(self) -> bool:
+        """Check if the version of the root is used to know if the root has been modified."""
+        return self._store.track_changes and not self.detect_untracked_changes
+
+    def _set_state(self, state: Any) -> None:
+        """Set the state of the root at the current version of the root."""
+        self._state = state
+        self._state_version = self._store.get_version()
 
     def _get_state_json(
         self, current_idx: int, log_name: LogName, db_conn: sqlite3.Connection
-    ) -> Optional[Any]:
+    ) -> Optional[Tuple[Any, bool]]:
+        """Get the saved state or patch and if it is a patch."""
         result = db_conn.execute(
             f"""--sql
-            SELECT state_json
+            SELECT state_json, is_patch
             FROM _CUI_{log_name.upper()}_LOG
             WHERE idx = :current_idx
             """,
             {"current_idx": current_idx},
         ).fetchone()
         if result is not None:
-            return result[0]
+            state_json = result[0]
+            if isinstance(state_json, bytes):
+                state_json = zlib.decompress(state_json)
+            return json.loads(state_json), bool(result[1])
         return None
 
     def _set_state_json(
-        self, current_idx: int, log_name: LogName, db_conn: sqlite3.Connection
+        self,
+        current_idx: int,
+        log_name: LogName,
+        state_data: Any,
+        is_patch: bool,
+        db_conn: sqlite3.Connection,
     ) -> None:
+        """Save the state or the patch to the given log."""
         db_conn.execute(
             f"""--sql
-            INSERT INTO _CUI_{log_name.upper()}_LOG(idx, state_json)
-            VALUES(:current_idx, :state_json)
+            INSERT INTO _CUI_{log_name.upper()}_LOG(idx, state_json, is_patch)
+            VALUES(:current_idx, :state_json, :is_patch)
             """,
-            {"current_idx": current_idx, "state_json": self._store.to_json()},
+            {
+                "current_idx": current_idx,
+                "state_json": zlib.compress(
+                    json.dumps(state_data).encode(), self.compression_level
+                ),
+                "is_patch": int(is_patch),
+            },
         )
 
-    def _has_state_changed(self, current_idx: int, db_conn: sqlite3.Connection) -> bool:
-        current_state = self._store.to_json()
-        old_state = self._get_state_json(current_idx, "undo", db_conn)
-        return old_state != current_state
-
     def _get_current_idx(self, db_conn: sqlite3.Connection) -> int:
         result = db_conn.execute(
             """--sql
@@ -202,3 +311,13 @@ class JsonHistory(AbstractHistory):
             WHERE h_id=1
             """
         )
+
+
+def _get_modified_fields(patch: jsondiff.Patch) -> Optional[Set[str]]:
+    """Get the fields of the root modified by the patch or None if the root is replaced."""
+    modified_fields = set()
+    for operation in patch:
+        if len(operation["path"]) == 0:
+            return None
+        modified_fields.add(str(operation["path"][0]))
+    return modified_fields
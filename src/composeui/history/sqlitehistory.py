@@ -1,11 +1,13 @@
 from composeui.history.abstracthistory import AbstractHistory
+from composeui.history.compaction import HistoryCompactor
 
 from typing_extensions import Literal, TypeAlias
 
+import re
 import sqlite3
 import typing
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 if typing.TYPE_CHECKING:
     from composeui.store.sqlitestore import SqliteStore
@@ -13,10 +15,23 @@ if typing.TYPE_CHECKING:
 
 LogName: TypeAlias = Literal["undo", "redo"]
 
+# table modified by a command generated by the triggers
+_COMMAND_TABLE_PATTERN = re.compile(r"^(?:DELETE FROM|INSERT INTO|UPDATE) ([^\s(]+)")
+
 
 class SqliteHistory(AbstractHistory):
+    """History of a SqliteStore.
+
+    The commands to undo/redo are saved by temporary triggers and the actions exceeding the
+    capacity are removed by batches (see HistoryCompactor).
+    """
+
     def __init__(self, store: "SqliteStore") -> None:
         self._store = store
+        self._compactor = HistoryCompactor(store, ["_CUI_UNDO_LOG"])
+        self._modified_data_sources: Optional[Set[str]] = None
+        # tables whose commands can't be grouped for a version of the schema
+        self._ungrouped_tables: Optional[Tuple[int, Set[str]]] = None
 
     def open_history(self, filepath: Optional[Path]) -> None:
         self.create_tables()
@@ -33,76 +48,47 @@ class SqliteHistory(AbstractHistory):
                 """
             )
             db_conn.execute("INSERT OR IGNORE INTO _CUI_INDEX VALUES(1, 0, 1)")
-            db_conn.execute(
-                """--sql
-                CREATE TABLE IF NOT EXISTS _CUI_UNDO_LOG(
-                    c_id INTEGER PRIMARY KEY NOT NULL,
-                    idx INTEGER, -- index of an action
-                    ord INTEGER, -- order of the action for a given index
-                    cmd TEXT
+            for log_name in ("undo", "redo"):
+                # the commands of an action are ordered by c_id which always increases
+                db_conn.execute(
+                    f"""--sql
+                    CREATE TABLE IF NOT EXISTS _CUI_{log_name.upper()}_LOG(
+                        c_id INTEGER PRIMARY KEY NOT NULL,
+                        idx INTEGER, -- index of an action
+                        cmd TEXT
+                    )
+                    """
                 )
-                """
-            )
-            db_conn.execute(
-                """--sql
-                CREATE TABLE IF NOT EXISTS _CUI_REDO_LOG(
-                    c_id INTEGER PRIMARY KEY NOT NULL,
-                    idx INTEGER,
-                    ord INTEGER,
-                    cmd TEXT
+                db_conn.execute(
+                    f"""--sql
+                    CREATE INDEX IF NOT EXISTS _CUI_{log_name.upper()}_LOG_IDX
+                    ON _CUI_{log_name.upper()}_LOG(idx)
+                    """
                 )
-                """
-            )
             self._add_all_triggers("undo", db_conn)
             self._add_all_triggers("redo", db_conn)
             db_conn.commit()
 
+    def flush_compaction(self) -> None:
+        """Remove now the old actions waiting for the end of their batch."""
+        self._compactor.flush()
+
+    def clear_history(self) -> None:
+        """Forget the old actions waiting for their removal since the database is replaced."""
+        self._compactor.clear()
+        self._ungrouped_tables = None
+
+    def get_modified_data_sources(self) -> Optional[Set[str]]:
+        """Get the tables modified by the last undo/redo."""
+        return self._modified_data_sources
+
     def undo(self) -> None:
         """Undo the last index of the history."""
-        with self._store.get_connection() as db_conn:
-            self._active_triggers("redo", True, db_conn)
-            current_idx = self._get_current_idx(db_conn)
-            try:
-                commands = self._get_commands(current_idx, "undo", db_conn)
-                if len(commands) > 0:
-                    # decrement the index of the history
-                    self._decrement_current_idx(db_conn)
-                for c_id, cmd in commands:
-                    # apply the command
-                    db_conn.execute(cmd)
-                    # remove the command from the undo log
-                    db_conn.execute(
-                        """--sql
-                        DELETE FROM _CUI_UNDO_LOG WHERE c_id=:c_id
-                        """,
-                        {"c_id": c_id},
-                    )
-                db_conn.commit()
-            finally:
-                self._active_triggers("redo", False, db_conn)
+        self._replay("undo", "redo")
 
     def redo(self) -> None:
         """Redo the last index of the history."""
-        with self._store.get_connection() as db_conn:
-            self._active_triggers("undo", True, db_conn)
-            current_idx = self._get_current_idx(db_conn)
-            try:
-                commands = self._get_commands(current_idx, "redo", db_conn)
-                if len(commands) > 0:
-                    self._increment_current_idx(db_conn)
-                for c_id, cmd in commands:
-                    # apply the command
-                    db_conn.execute(cmd)
-                    # remove the command from the undo log
-                    db_conn.execute(
-                        """--sql
-                        DELETE FROM _CUI_REDO_LOG WHERE c_id=:c_id
-                        """,
-                        {"c_id": c_id},
-                    )
-                db_conn.commit()
-            finally:
-                self._active_triggers("undo", False, db_conn)
+        self._replay("redo", "undo")
 
     def start_recording(self) -> None:
         """Start recording the history."""
@@ -123,17 +109,86 @@ class SqliteHistory(AbstractHistory):
                     DELETE FROM _CUI_REDO_LOG
                     """
                 )
-                # Remove the old actions to not exceed the capacity of the history
-                db_conn.execute(
-                    f"""--sql
-                    DELETE FROM _CUI_UNDO_LOG
-                    WHERE idx<={self._get_current_idx(db_conn) - self.get_capacity()}
-                    """
-                )
+                current_idx = self._get_current_idx(db_conn)
             else:
                 # no commands have been recorded the index doesn't need to be incremented
                 self._decrement_current_idx(db_conn)
+                current_idx = None
             db_conn.commit()
+        if current_idx is not None:
+            # Remove the old actions to not exceed the capacity of the history
+            self._compactor.compact(current_idx - self.get_capacity())
+
+    def _replay(self, log_name: LogName, inverse_log_name: LogName) -> None:
+        """Apply the commands of the last index of the given log.
+
+        The commands are executed as one script in a single transaction with the update of
+        the index and the removal of the commands from the log, while the triggers save the
+        inverse commands into the other log.
+        The consecutive deletions and insertions in the same table are grouped to compile
+        the statement, and so the triggers of the table, once for many rows. The tables with
+        triggers of the user or referenced by foreign keys are not grouped, because the order
+        in which their triggers and their cascades see the rows would change.
+        """
+        self._compactor.flush()
+        with self._store.get_connection() as db_conn:
+            self._active_triggers(inverse_log_name, True, db_conn)
+            current_idx = self._get_current_idx(db_conn)
+            try:
+                commands = self._get_commands(current_idx, log_name, db_conn)
+                self._modified_data_sources = set()
+                for cmd in commands:
+                    match = _COMMAND_TABLE_PATTERN.match(cmd)
+                    if match is not None:
+                        self._modified_data_sources.add(match.group(1))
+                if len(commands) > 0:
+                    operator = "-" if log_name == "undo" else "+"
+                    script = [
+                        "BEGIN",
+                        # the rows deleted by a cascade can be restored before their parent
+                        "PRAGMA defer_foreign_keys = ON",
+                        f"""--sql
+                        UPDATE _CUI_INDEX
+                        SET current_idx = current_idx {operator} 1
+                        WHERE h_id=1
+                        """,
+                        *_group_commands(commands, self._get_ungrouped_tables(db_conn)),
+                        f"DELETE FROM _CUI_{log_name.upper()}_LOG WHERE idx={current_idx}",
+                        "COMMIT",
+                    ]
+                    try:
+                        db_conn.executescript(";\n".join(script) + ";")
+                    except sqlite3.Error:
+                        db_conn.rollback()
+                        raise
+                    self._store.notify_table_change(self._modified_data_sources)
+            finally:
+                self._active_triggers(inverse_log_name, False, db_conn)
+
+    def _get_ungrouped_tables(self, db_conn: sqlite3.Connection) -> Set[str]:
+        """Get the tables with triggers of the user or referenced by foreign keys.
+
+        The names are in lower case and computed again only if the schema changed.
+        """
+        schema_version = int(db_conn.execute("PRAGMA schema_version").fetchone()[0])
+        if self._ungrouped_tables is not None and self._ungrouped_tables[0] == schema_version:
+            return self._ungrouped_tables[1]
+        # the triggers of the history are temporary so they are not in sqlite_master
+        ungrouped_tables = {
+            str(row[0]).lower()
+            for row in db_conn.execute(
+                """--sql
+                SELECT tbl_name FROM sqlite_master WHERE type='trigger'
+                """
+            )
+        }
+        for table in self._get_all_tables(db_conn):
+            ungrouped_tables.update(
+                str(row["table"]).lower()
+                for row in db_conn.execute(f"PRAGMA foreign_key_list({table})")
+            )
+        self._ungrouped_tables = (schema_version, ungrouped_tables)
+        return ungrouped_tables
 
     def _increment_current_idx(self, db_conn: sqlite3.Connection) -> None:
         db_conn.execute(
@@ -167,18 +222,18 @@ class SqliteHistory(AbstractHistory):
 
     def _get_commands(
         self, current_idx: int, log_name: LogName, db_conn: sqlite3.Connection
-    ) -> List[Tuple[int, str]]:
+    ) -> List[str]:
         """Get the commands of the last index of the history."""
         result = db_conn.execute(
             f"""--sql
-            SELECT c_id, cmd
+            SELECT cmd
             FROM _CUI_{log_name.upper()}_LOG
             WHERE idx = :current_idx
-            ORDER BY ord DESC
+            ORDER BY c_id DESC
             """,
             {"current_idx": current_idx},
         ).fetchall()
-        return [(int(row[0]), str(row[1])) for row in result]
+        return [str(row[0]) for row in result]
 
     def _has_commands(self, log_name: LogName, db_conn: sqlite3.Connection) -> bool:
         """Get the commands of the last index of the history."""
@@ -188,7 +243,6 @@ class SqliteHistory(AbstractHistory):
                 SELECT 1
                 FROM _CUI_{log_name.upper()}_LOG
                 WHERE idx = :current_idx
-                ORDER BY ord
                 LIMIT 1
             )
             """,
@@ -215,8 +269,41 @@ class SqliteHistory(AbstractHistory):
         )
 
     def _add_all_triggers(self, log_name: LogName, db_conn: sqlite3.Connection) -> None:
+        """Add the triggers of all the tables if the schema changed since their creation.
+
+        The version of the schema used to create the triggers is saved in a temporary table,
+        so like the temporary triggers, it is specific to the connection.
+        """
+        schema_version = int(db_conn.execute("PRAGMA schema_version").fetchone()[0])
+        try:
+            result = db_conn.execute(
+                """--sql
+                SELECT schema_version FROM _CUI_TRIGGERS WHERE log_name=:log_name
+                """,
+                {"log_name": log_name},
+            ).fetchone()
+        except sqlite3.OperationalError:
+            db_conn.execute(
+                """--sql
+                CREATE TEMPORARY TABLE IF NOT EXISTS _CUI_TRIGGERS(
+                    log_name TEXT PRIMARY KEY NOT NULL,
+                    schema_version INTEGER
+                )
+                """
+            )
+            result = None
+        if result is not None and int(result[0]) == schema_version:
+            return
         for table in self._get_all_tables(db_conn):
             self._add_triggers(table, log_name, db_conn)
+        db_conn.execute(
+            """--sql
+            INSERT OR REPLACE INTO _CUI_TRIGGERS(log_name, schema_version)
+            VALUES(:log_name, :schema_version)
+            """,
+            {"log_name": log_name, "schema_version": schema_version},
+        )
+        db_conn.commit()
 
     def _add_triggers(
         self, table: str, log_name: LogName, db_conn: sqlite3.Connection
@@ -229,52 +316,33 @@ class SqliteHistory(AbstractHistory):
         self, table: str, log_name: LogName, db_conn: sqlite3.Connection
     ) -> None:
         cmd = f"'DELETE FROM {table} WHERE ROWID='||NEW.ROWID"
-        db_conn.execute(
-            f"""--sql
-            CREATE TEMPORARY TRIGGER IF NOT EXISTS _{table}_after_insert_{log_name.lower()}_log
-            AFTER INSERT ON {table}
-            WHEN (SELECT 1 FROM _CUI_INDEX WHERE h_id=1 AND triggers='{log_name}')
-            BEGIN
-                INSERT INTO _CUI_{log_name.upper()}_LOG(idx,  ord, cmd)
-                VALUES(
-                    (SELECT current_idx FROM _CUI_INDEX WHERE h_id=1),
-                    COALESCE((
-                        SELECT MAX(ord) + 1 FROM _CUI_{log_name.upper()}_LOG
-                        WHERE idx=(SELECT current_idx FROM _CUI_INDEX WHERE h_id=1)
-                    ), 0),
-                    {cmd}
-                );
-            END;
-            """
+        self._add_log_trigger(
+            table, "AFTER INSERT", "insert", log_name, cmd=cmd, db_conn=db_conn
         )
-        db_conn.commit()
 
     def _add_after_update_trigger(
         self, table: str, log_name: LogName, db_conn: sqlite3.Connection
     ) -> None:
+        # only the modified columns are restored and the updates without modification
+        # are not logged
         columns = self._get_columns(table, db_conn)
-        cmd = f"'UPDATE {table} SET "
-        cmd += ", ".join(f"{column}='||QUOTE(OLD.{column})||'" for column in columns)
-        cmd += " WHERE ROWID='||OLD.ROWID"
-        db_conn.execute(
-            f"""--sql
-            CREATE TEMPORARY TRIGGER IF NOT EXISTS _{table}_after_update_{log_name.lower()}_log
-            AFTER UPDATE ON {table}
-            WHEN (SELECT 1 FROM _CUI_INDEX WHERE h_id=1 AND triggers='{log_name}')
-            BEGIN
-                INSERT INTO _CUI_{log_name.upper()}_LOG(idx, ord, cmd)
-                VALUES(
-                    (SELECT current_idx FROM _CUI_INDEX WHERE h_id=1),
-                    COALESCE((
-                        SELECT MAX(ord) + 1 FROM _CUI_{log_name.upper()}_LOG
-                        WHERE idx=(SELECT current_idx FROM _CUI_INDEX WHERE h_id=1)
-                    ), 0),
-                    {cmd}
-                );
-            END;
-            """
+        cmd = f"'UPDATE {table} SET '||SUBSTR("
+        cmd += "||".join(
+            f"CASE WHEN OLD.{column} IS NOT NEW.{column} "
+            f"THEN ',{column}='||QUOTE(OLD.{column}) ELSE '' END"
+            for column in columns
+        )
+        cmd += ", 2)||' WHERE ROWID='||OLD.ROWID"
+        condition = " OR ".join(f"OLD.{column} IS NOT NEW.{column}" for column in columns)
+        self._add_log_trigger(
+            table,
+            "AFTER UPDATE",
+            "update",
+            log_name,
+            cmd=cmd,
+            condition=f"AND ({condition})",
+            db_conn=db_conn,
         )
-        db_conn.commit()
 
     def _add_after_delete_trigger(
         self, table: str, log_name: LogName, db_conn: sqlite3.Connection
@@ -285,25 +353,41 @@ class SqliteHistory(AbstractHistory):
         cmd += ") VALUES("
         cmd += ",".join(f"'||quote(OLD.{column})||'" for column in columns)
         cmd += ")'"
+        self._add_log_trigger(
+            table, "BEFORE DELETE", "delete", log_name, cmd=cmd, db_conn=db_conn
+        )
+
+    def _add_log_trigger(
+        self,
+        table: str,
+        event: str,
+        event_name: str,
+        log_name: LogName,
+        *,
+        cmd: str,
+        condition: str = "",
+        db_conn: sqlite3.Connection,
+    ) -> None:
+        """Add a trigger saving the command to revert the event into the given log.
+
+        The index of the history and the activation of the triggers are read in one lookup
+        of the primary key of _CUI_INDEX.
+        The trigger is replaced because the columns of the table may have been modified.
+        """
+        name = f"_{table}_after_{event_name}_{log_name.lower()}_log"
+        db_conn.execute(f"DROP TRIGGER IF EXISTS temp.{name}")
         db_conn.execute(
             f"""--sql
-            CREATE TEMPORARY TRIGGER IF NOT EXISTS _{table}_after_delete_{log_name.lower()}_log
-            BEFORE DELETE ON {table}
-            WHEN (SELECT 1 FROM _CUI_INDEX WHERE h_id=1 AND triggers='{log_name}')
+            CREATE TEMPORARY TRIGGER {name}
+            {event} ON {table}
             BEGIN
-                INSERT INTO _CUI_{log_name.upper()}_LOG(idx, ord, cmd)
-                VALUES(
-                    (SELECT current_idx FROM _CUI_INDEX WHERE h_id=1),
-                    COALESCE((
-                        SELECT MAX(ord) + 1 FROM _CUI_{log_name.upper()}_LOG
-                        WHERE idx=(SELECT current_idx FROM _CUI_INDEX WHERE h_id=1)
-                    ), 0),
-                    {cmd}
-                );
+                INSERT INTO _CUI_{log_name.upper()}_LOG(idx, cmd)
+                SELECT current_idx, {cmd}
+                FROM _CUI_INDEX
+                WHERE h_id=1 AND triggers='{log_name}' {condition};
             END;
             """
         )
-        db_conn.commit()
 
     def _get_columns(self, table: str, db_conn: sqlite3.Connection) -> List[str]:
         result = db_conn.execute(
@@ -333,3 +417,46 @@ class SqliteHistory(AbstractHistory):
                 """
             ).fetchall()
         return [str(row[0]) for row in result]
+
+
+def _group_commands(
+    commands: List[str], ungrouped_tables: Set[str], max_group_size: int = 500
+) -> List[str]:
+    """Group the consecutive commands deleting or inserting rows of the same table.
+
+    The commands are the ones generated by the triggers of SqliteHistory:
+        - "DELETE FROM table WHERE ROWID=rowid"
+        - "INSERT INTO table(columns) VALUES(values)"
+    The commands of the given tables (in lower case) are kept one by one.
+    """
+    groups: List[Tuple[Optional[str], List[str]]] = []
+    for cmd in commands:
+        prefix: Optional[str] = None
+        values = cmd
+        match = _COMMAND_TABLE_PATTERN.match(cmd)
+        is_groupable = match is not None and match.group(1).lower() not in ungrouped_tables
+        if is_groupable and cmd.startswith("DELETE FROM ") and " WHERE ROWID=" in cmd:
+            prefix, _, values = cmd.rpartition("=")
+        elif is_groupable and cmd.startswith("INSERT INTO ") and ") VALUES(" in cmd:
+            columns, _, values = cmd.partition(") VALUES(")
+            prefix, values = columns + ") VALUES", values[:-1]
+        if (
+            prefix is None
+            or len(groups) == 0
+            or groups[-1][0] != prefix
+            or len(groups[-1][1]) >= max_group_size
+        ):
+            groups.append((prefix, [values]))
+        else:
+            groups[-1][1].append(values)
+    grouped_commands = []
+    for prefix, group_values in groups:
+        if prefix is None:
+            grouped_commands.extend(group_values)
+        elif prefix.startswith("DELETE"):
+            grouped_commands.append(f"{prefix} IN ({','.join(group_values)})")
+        else:
+            grouped_commands.append(
+                prefix + ",".join(f"({values})" for values in group_values)
+            )
+    return grouped_commands
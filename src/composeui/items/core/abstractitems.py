@@ -1,4 +1,5 @@
 from composeui.commontypes import AnyItemsView, AnyModel
+from composeui.items.core.itemsutils import RowChange, RowChangeType
 from composeui.items.core.textfinder import TextFinder
 
 from typing_extensions import OrderedDict
@@ -6,7 +7,7 @@ from typing_extensions import OrderedDict
 import math
 import typing
 from abc import ABC, abstractmethod
-from typing import Generator, Generic, List, Optional, Tuple, TypeVar
+from typing import Generator, Generic, List, Optional, Set, Tuple, TypeVar
 
 if typing.TYPE_CHECKING:
     from composeui.items.core.views.itemsview import ItemsView
@@ -15,6 +16,9 @@ V = TypeVar("V", bound="ItemsView")
 
 
 class AbstractItems(ABC, Generic[V, AnyModel]):
+    # maximum number of row changes kept before the views are fully updated
+    max_row_changes = 100
+
     def __init__(self, view: V, model: AnyModel, *, title: str = "") -> None:
         self._view: V = view
         self._model: AnyModel = model
@@ -23,6 +27,7 @@ class AbstractItems(ABC, Generic[V, AnyModel]):
         self.filter_column_indices: Tuple[int, ...] = ()
         self._dependencies: List[AbstractItems[AnyItemsView, AnyModel]] = []
         self._is_view_selection_suspended = False
+        self._row_changes: Optional[List[RowChange]] = []
 
     def get_dependencies(self) -> Tuple["AbstractItems[AnyItemsView, AnyModel]", ...]:
         """Get the items that can be used to generate the data of the current items.
@@ -66,6 +71,82 @@ class AbstractItems(ABC, Generic[V, AnyModel]):
         """
         self._is_view_selection_suspended = is_suspended
 
+    def get_data_sources(self) -> Optional[Set[str]]:
+        """Get the data sources read by the items.
+
+        The data sources are for example the names of the tables or of the fields of the root
+        as reported by the history of the stores. They are used to update only the views
+        whose data have been modified by an undo/redo.
+        Return None if they are unknown, then the view is always updated.
+        """
+        return None
+
+    def notify_row_inserted(self, row: int, parent_rows: Tuple[int, ...] = ()) -> None:
+        """Notify the views that a row has been inserted at the given position."""
+        self._add_row_change(RowChange(RowChangeType.INSERT, row, parent_rows))
+
+    def notify_row_removed(self, row: int, parent_rows: Tuple[int, ...] = ()) -> None:
+        """Notify the views that the row at the given position has been removed."""
+        self._add_row_change(RowChange(RowChangeType.REMOVE, row, parent_rows))
+
+    def notify_row_moved(
+        self,
+        from_row: int,
+        to_row: int,
+        from_parent_rows: Tuple[int, ...] = (),
+        to_parent_rows: Tuple[int, ...] = (),
+    ) -> None:
+        """Notify the views that a row has been moved to another position."""
+        self._add_row_change(
+            RowChange(RowChangeType.MOVE, from_row, from_parent_rows, to_row, to_parent_rows)
+        )
+
+    def notify_data_changed(self, row: int, parent_rows: Tuple[int, ...] = ()) -> None:
+        """Notify the views that the data of the row at the given position have changed."""
+        self._add_row_change(RowChange(RowChangeType.DATA, row, parent_rows))
+
+    def take_row_changes(self) -> Optional[List[RowChange]]:
+        """Get the row changes notified since the last call and forget them.
+
+        The changes are notified by the methods modifying the rows (insert, remove, move,
+        set_data, ...) with the notify methods, as done by SimpleTableItems. The views use
+        them to update only the modified rows. An empty list means the changes are unknown
+        and None that there are too many changes, in both cases the views are fully updated.
+        """
+        row_changes, self._row_changes = self._row_changes, []
+        return row_changes
+
+    def invalidate_row_changes(self) -> None:
+        """Forget the notified row changes, the views are fully updated at their next update.
+
+        Called when the rows have been modified without being notified, e.g. by an undo.
+        """
+        self._row_changes = None
+
+    def _add_row_change(self, row_change: RowChange) -> None:
+        if self._row_changes is not None:
+            if len(self._row_changes) < self.max_row_changes:
+                self._row_changes.append(row_change)
+            else:
+                self._row_changes = None
+
+    def _get_unmatched_mask(self, columns: List[List[str]]) -> List[bool]:
+        """Get for each row if none of the values of the given columns matches the filter.
+
+        The columns are the displayed data of the filtered columns, with the same rows.
+        """
+        if len(columns) == 0:
+            return []
+        is_unmatched = [True] * len(columns[0])
+        for values in columns:
+            is_unmatched = [
+                is_row_unmatched and not is_matching
+                for is_row_unmatched, is_matching in zip(
+                    is_unmatched, self.filter_manager.match_values(values)
+                )
+            ]
+        return is_unmatched
+
     @abstractmethod
     def get_nb_columns(self) -> int:
         """Get the number of columns."""
@@ -32,19 +32,21 @@ def copy_items(*, view: ITableTreeView, model: AnyModel) -> None:
 def paste_items(*, view: ITableTreeView, main_view: MainView, model: AnyModel) -> None:
     """Paste the data of the selected items."""
     if view.items is not None and not is_sorting_enabled(view, main_view):
-        copy_paste_manager = CopyPasteItems(view.items)
-        try:
-            with model.record_history():
-                copy_paste_manager.paste()
-        except ValueError as e:
-            error_message = str(e)
-            if model.is_debug:
-                error_message += "\n" + traceback.format_exc()
-            tools.display_error_message(main_view, error_message)
-        else:
-            view.failed_highlight(copy_paste_manager.paste_failed)
-            view.successful_highlight(copy_paste_manager.paste_successful)
-            tools.update_view_with_dependencies(view)
+        with tools.batch_updates():
+            copy_paste_manager = CopyPasteItems(view.items)
+            try:
+                with model.record_history():
+                    model.notify_change()
+                    copy_paste_manager.paste()
+            except ValueError as e:
+                error_message = str(e)
+                if model.is_debug:
+                    error_message += "\n" + traceback.format_exc()
+                tools.display_error_message(main_view, error_message)
+            else:
+                view.failed_highlight(copy_paste_manager.paste_failed)
+                view.successful_highlight(copy_paste_manager.paste_successful)
+                tools.update_view_with_dependencies(view)
 
 
 def is_sorting_enabled(view: ITableTreeView, main_view: MainView) -> bool:
@@ -1,7 +1,7 @@
 from typing_extensions import TypeAlias
 
 import enum
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 
 class FloatDelegateProps:
@@ -43,6 +43,7 @@ class ComboBoxDelegateProps:
 
 
 DelegateProps: TypeAlias = Union[ComboBoxDelegateProps, FloatDelegateProps, IntDelegateProps]
+SortKey: TypeAlias = Tuple[int, Union[float, str]]
 
 
 class BackgroundType(enum.Flag):
@@ -52,3 +53,44 @@ class BackgroundType(enum.Flag):
 
     NONE = 0
     STRIPED = enum.auto()
+
+
+class RowChangeType(enum.Enum):
+    """Define the type of a change of the rows."""
+
+    INSERT = enum.auto()
+    REMOVE = enum.auto()
+    MOVE = enum.auto()
+    DATA = enum.auto()
+
+
+class RowChange:
+    """Change of a row of the items notified to the views.
+
+    The row is given by its position before the change. For a move, the destination is the
+    position of the row after the move.
+    """
+
+    __slots__ = ["change_type", "parent_rows", "row", "to_parent_rows", "to_row"]
+
+    def __init__(
+        self,
+        change_type: RowChangeType,
+        row: int,
+        parent_rows: Tuple[int, ...] = (),
+        to_row: int = -1,
+        to_parent_rows: Tuple[int, ...] = (),
+    ) -> None:
+        self.change_type = change_type
+        self.row = row
+        self.parent_rows = parent_rows
+        self.to_row = to_row
+        self.to_parent_rows = to_parent_rows
+
+
+def get_sort_key(value: Any) -> SortKey:
+    """Get the key to sort a value: the numbers first by value then the texts."""
+    try:
+        return (0, float(value))
+    except (ValueError, TypeError):
+        return (1, "" if value is None else str(value))
@@ -39,13 +39,13 @@ class ComboBoxDelegate(QItemDelegate):
         editor.setEditable(True)
         model = self.table.model()
         if isinstance(model, (TreeItemModel, TableItemModel)):
-            source_index = model.mapToSource(index)
             delegate_props = None
             if isinstance(self.items, AbstractTableItems):
                 delegate_props = self.items.get_delegate_props(index.column(), row=index.row())
-            else:
+            elif isinstance(model, TreeItemModel):
+                rows = model.get_position(index)
                 delegate_props = self.items.get_delegate_props(
-                    index.column(), row=index.row(), parent_rows=source_index.internalPointer()
+                    index.column(), row=rows[-1], parent_rows=rows[:-1]
                 )
             if delegate_props is not None and isinstance(
                 delegate_props, ComboBoxDelegateProps
@@ -79,9 +79,12 @@ class FloatDelegate(QItemDelegate):
         if isinstance(self.items, AbstractTableItems):
             delegate_props = self.items.get_delegate_props(index.column(), row=index.row())
         else:
-            delegate_props = self.items.get_delegate_props(
-                index.column(), row=index.row(), parent_rows=index.internalPointer()
-            )
+            model = index.model()
+            if isinstance(model, TreeItemModel):
+                rows = model.get_position(index)
+                delegate_props = self.items.get_delegate_props(
+                    index.column(), row=rows[-1], parent_rows=rows[:-1]
+                )
         if delegate_props is not None and isinstance(delegate_props, FloatDelegateProps):
             editor = QLineEdit(parent)
             validator = DoubleValidator()
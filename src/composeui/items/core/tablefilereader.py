@@ -0,0 +1,177 @@
+r"""Read the csv, excel and json files of a table by chunks of rows."""
+
+from composeui.items.core.views.itemsview import FormatExtension
+
+import contextlib
+
+with contextlib.suppress(ImportError, ModuleNotFoundError):
+    from openpyxl import load_workbook
+    from openpyxl.utils.exceptions import InvalidFileException
+with contextlib.suppress(ImportError, ModuleNotFoundError):
+    from xlrd.biffh import XLRDError
+
+import json
+import math
+import zipfile
+from pathlib import Path
+from typing import Any, Iterator, List, Tuple
+
+with contextlib.suppress(ImportError, ModuleNotFoundError):
+    import pandas as pd
+
+
+class TableFileReader:
+    r"""Read a table file by chunks of rows without loading the whole file.
+
+    Each chunk is a DataFrame with the columns of the file given with the fraction of the file
+    read so far. At least one chunk is given, empty if the file has no rows.
+    - the csv files are read with pandas by chunks.
+    - the excel files are read row by row with openpyxl in read-only mode, the old .xls files
+        are read at once with xlrd.
+    - the json files containing a list of records (as exported by the tables) are decoded
+        record by record, the line-delimited json files are read with pandas by chunks, the
+        other json files are read at once.
+    """
+
+    def __init__(
+        self, filepath: Path, extension: FormatExtension, chunk_size: int = 10000
+    ) -> None:
+        self._filepath = filepath
+        self._extension = extension
+        self._chunk_size = chunk_size
+
+    def iter_chunks(self) -> Iterator[Tuple["pd.DataFrame", float]]:
+        r"""Iterate over the chunks of rows and the fraction of the file read."""
+        if self._extension == FormatExtension.CSV:
+            yield from self._iter_csv_chunks()
+        elif self._extension == FormatExtension.EXCEL:
+            yield from self._iter_excel_chunks()
+        elif self._extension == FormatExtension.JSON:
+            yield from self._iter_json_chunks()
+        else:
+            msg = f"The extension '{self._filepath.suffix}' is not supported yet"
+            raise ValueError(msg)
+
+    def _iter_csv_chunks(self) -> Iterator[Tuple["pd.DataFrame", float]]:
+        # TODO: Add option to choose the separator
+        file_size = self._filepath.stat().st_size
+        with open(self._filepath, "rb") as f:
+            for table_df in pd.read_csv(f, sep=";", chunksize=self._chunk_size):
+                yield table_df, f.tell() / max(file_size, 1)
+
+    def _iter_excel_chunks(self) -> Iterator[Tuple["pd.DataFrame", float]]:
+        f = open(self._filepath, "rb")  # noqa: SIM115
+        try:
+            # the file is given opened to not depend on its extension like pandas
+            workbook = load_workbook(f, read_only=True, data_only=True)
+        except (InvalidFileException, zipfile.BadZipFile):
+            f.close()
+            try:
+                yield pd.read_excel(self._filepath, engine="xlrd"), 1.0
+            except XLRDError:
+                # old versions of pandas don't manage the bad extension
+                # with openpyxl so it fallback to xlrd which don't know how
+                # to read .xlsx files
+                msg = "Change the extension of the file to .xlsx"
+                raise ValueError(msg) from None
+            return
+        try:
+            worksheet = workbook.worksheets[0]
+            nb_rows = worksheet.max_row or 1
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                raise pd.errors.EmptyDataError("No columns to parse from file")
+            columns = [
+                f"Unnamed: {i}" if name is None else name for i, name in enumerate(header)
+            ]
+            nb_read_rows = 1
+            chunk: List[Tuple[Any, ...]] = []
+            for row in rows:
+                # the empty cells are read as nan like pandas
+                chunk.append(tuple(math.nan if value is None else value for value in row))
+                if len(chunk) == self._chunk_size:
+                    nb_read_rows += len(chunk)
+                    yield pd.DataFrame(chunk, columns=columns), nb_read_rows / nb_rows
+                    chunk = []
+            if len(chunk) > 0 or nb_read_rows == 1:
+                yield pd.DataFrame(chunk, columns=columns), 1.0
+        finally:
+            workbook.close()
+            f.close()
+
+    def _iter_json_chunks(self) -> Iterator[Tuple["pd.DataFrame", float]]:
+        with open(self._filepath, encoding="utf-8") as f:
+            first_line = f.readline()
+        text_start = first_line.lstrip()
+        if text_start.startswith("["):
+            yield from self._iter_json_records_chunks()
+        elif text_start.startswith("{") and _is_json_record(text_start):
+            file_size = self._filepath.stat().st_size
+            with open(self._filepath, "rb") as f:
+                for table_df in pd.read_json(f, lines=True, chunksize=self._chunk_size):
+                    yield table_df, f.tell() / max(file_size, 1)
+        else:
+            yield pd.read_json(self._filepath), 1.0
+
+    def _iter_json_records_chunks(self) -> Iterator[Tuple["pd.DataFrame", float]]:
+        r"""Decode the records of a json list one by one from blocks of text."""
+        file_size = self._filepath.stat().st_size
+        decoder = json.JSONDecoder()
+        nb_read_chars = 0
+        records: List[Any] = []
+        with open(self._filepath, encoding="utf-8") as f:
+            text = f.read(_BLOCK_SIZE).lstrip()
+            # skip the opening bracket
+            position = 1
+            is_finished = False
+            while not is_finished:
+                position = _skip_separators(text, position)
+                if position < len(text) and text[position] == "]":
+                    is_finished = True
+                    continue
+                try:
+                    record, end = decoder.raw_decode(text, position)
+                except json.JSONDecodeError:
+                    block = f.read(_BLOCK_SIZE)
+                    if block == "":
+                        # the list is truncated or malformed
+                        msg = "Expected object or value"
+                        raise json.JSONDecodeError(msg, text, position) from None
+                    # keep the beginning of the record and read the next block
+                    nb_read_chars += position
+                    text = text[position:] + block
+                    position = 0
+                    continue
+                records.append(record)
+                position = end
+                if len(records) == self._chunk_size:
+                    yield (
+                        pd.DataFrame.from_records(records),
+                        (nb_read_chars + position) / max(file_size, 1),
+                    )
+                    records = []
+        if len(records) > 0 or nb_read_chars + position <= 1:
+            yield pd.DataFrame.from_records(records), 1.0
+
+
+# number of characters read at once from the json files
+_BLOCK_SIZE = 1 << 20
+
+
+def _skip_separators(text: str, position: int) -> int:
+    r"""Skip the whitespaces and the commas between the records of a json list."""
+    while position < len(text) and (text[position].isspace() or text[position] == ","):
+        position += 1
+    return position
+
+
+def _is_json_record(line: str) -> bool:
+    r"""Check if the line is a record of a line-delimited json file."""
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(record, dict) and not any(
+        isinstance(value, (dict, list)) for value in record.values()
+    )
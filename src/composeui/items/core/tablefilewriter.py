@@ -0,0 +1,145 @@
+r"""Write the csv, excel, json, markdown and html files of a table by chunks of rows."""
+
+from composeui.items.core.views.itemsview import FormatExtension
+
+import contextlib
+
+with contextlib.suppress(ImportError, ModuleNotFoundError):
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+from pathlib import Path
+from typing import IO, Any, Generator, List, Optional
+
+with contextlib.suppress(ImportError, ModuleNotFoundError):
+    import pandas as pd
+
+
+class TableFileWriter:
+    r"""Write a table file by chunks of rows without building the whole table.
+
+    The chunks are given by column like the data blocks of the table items and are written
+    before the next one is given.
+    - the csv, json, markdown and html files are written with pandas chunk by chunk. The
+        json file is a list of records.
+    - the excel files are written row by row with openpyxl in write-only mode.
+    The markdown and html formats of the numbers depend on the values of each chunk, so the
+    columns can be aligned differently between two chunks.
+    """
+
+    def __init__(
+        self,
+        filepath: Path,
+        extension: FormatExtension,
+        column_names: List[str],
+        sheet_name: str = "Table",
+    ) -> None:
+        self._filepath = filepath
+        self._extension = extension
+        self._column_names = column_names
+        self._sheet_name = sheet_name
+        self._file: Optional[IO[str]] = None
+        self._workbook: Optional[Workbook] = None
+        self._nb_chunks = 0
+        self._has_records = False
+        # end of the file written when it's closed
+        self._footer = ""
+
+    @contextlib.contextmanager
+    def open(self) -> Generator[None, None, None]:
+        r"""Open the file to write the chunks and complete it at the end."""
+        if self._extension not in (
+            FormatExtension.CSV,
+            FormatExtension.EXCEL,
+            FormatExtension.JSON,
+            FormatExtension.MARKDOWN,
+            FormatExtension.HTML,
+        ):
+            msg = f"The extension '{self._filepath.suffix}' is not supported yet"
+            raise ValueError(msg)
+        self._nb_chunks = 0
+        self._has_records = False
+        self._footer = ""
+        if self._extension == FormatExtension.EXCEL:
+            self._open_workbook()
+            try:
+                yield
+                if self._workbook is not None:
+                    self._workbook.save(self._filepath)
+            finally:
+                self._workbook = None
+            return
+        self._file = open(self._filepath, "w", newline="")  # noqa: SIM115
+        try:
+            if self._extension == FormatExtension.JSON:
+                self._file.write("[")
+                self._footer = "]"
+            yield
+            if self._nb_chunks == 0:
+                self.write_chunk([[] for _ in self._column_names])
+            self._file.write(self._footer)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def write_chunk(self, values_by_column: List[List[Any]]) -> None:
+        r"""Write the rows of the chunk given by column in the order of the column names."""
+        if self._extension == FormatExtension.EXCEL:
+            self._write_excel_chunk(values_by_column)
+        elif self._file is not None:
+            table_df = pd.DataFrame(dict(enumerate(values_by_column)))
+            table_df.columns = pd.Index(self._column_names)
+            if self._extension == FormatExtension.CSV:
+                table_df.to_csv(self._file, sep=";", index=False, header=self._nb_chunks == 0)
+            elif self._extension == FormatExtension.JSON:
+                try:
+                    records = table_df.to_json(orient="records", index=False)[1:-1]
+                except ValueError:
+                    msg = (
+                        f"The current version of pandas '{pd.__version__}' "
+                        "is too old to export in json"
+                    )
+                    raise ValueError(msg) from None
+                if records != "":
+                    if self._has_records:
+                        self._file.write(",")
+                    self._file.write(records)
+                    self._has_records = True
+            elif self._extension == FormatExtension.MARKDOWN:
+                table_md = table_df.to_markdown(index=False)
+                if self._nb_chunks == 0:
+                    self._file.write(table_md)
+                elif table_df.shape[0] > 0:
+                    # the rows without the header and the alignment row
+                    self._file.write("\n" + table_md.split("\n", 2)[2])
+            elif self._extension == FormatExtension.HTML:
+                table_html = table_df.to_html(index=False)
+                body_start = table_html.index("<tbody>\n") + len("<tbody>\n")
+                body_end = table_html.rindex("  </tbody>")
+                if self._nb_chunks == 0:
+                    self._file.write(table_html[:body_end])
+                    self._footer = table_html[body_end:]
+                else:
+                    self._file.write(table_html[body_start:body_end])
+        self._nb_chunks += 1
+
+    def _open_workbook(self) -> None:
+        self._workbook = Workbook(write_only=True)
+        worksheet = self._workbook.create_sheet(self._sheet_name)
+        # the header has the same style as the one written by pandas
+        side = Side(style="thin")
+        header = []
+        for column_name in self._column_names:
+            cell = WriteOnlyCell(worksheet, value=column_name)
+            cell.font = Font(bold=True)
+            cell.border = Border(left=side, right=side, top=side, bottom=side)
+            cell.alignment = Alignment(horizontal="center", vertical="top")
+            header.append(cell)
+        worksheet.append(header)
+
+    def _write_excel_chunk(self, values_by_column: List[List[Any]]) -> None:
+        if self._workbook is not None:
+            worksheet = self._workbook.worksheets[0]
+            for row in zip(*values_by_column):
+                worksheet.append(row)
@@ -5,13 +5,13 @@ Transform a table items into a tree items to manipulate it indistinguishably fro
 from composeui.commontypes import AnyItemsView, AnyModel
 from composeui.items.core.abstractitems import AbstractItems
 from composeui.items.core.itemsconverter import ItemsConverter
-from composeui.items.core.itemsutils import BackgroundType, DelegateProps
+from composeui.items.core.itemsutils import BackgroundType, DelegateProps, RowChange
 from composeui.items.tree.abstracttreeitems import AbstractTreeItems
 
 from typing_extensions import OrderedDict, Self
 
 import typing
-from typing import Any, Generator, List, Optional, Tuple
+from typing import Any, Generator, List, Optional, Set, Tuple
 
 if typing.TYPE_CHECKING:
     from composeui.items.table.abstracttableitems import AbstractTableItems
@@ -34,6 +34,18 @@ class TableToTreeItems(AbstractTreeItems[AnyModel]):
     def add_dependency(self, dependency: "AbstractItems[AnyItemsView, AnyModel]") -> None:
         self._table_items.add_dependency(dependency)
 
+    def get_data_sources(self) -> Optional[Set[str]]:
+        return self._table_items.get_data_sources()
+
+    def take_row_changes(self) -> Optional[List[RowChange]]:
+        return self._table_items.take_row_changes()
+
+    def invalidate_row_changes(self) -> None:
+        self._table_items.invalidate_row_changes()
+
+    def _add_row_change(self, row_change: RowChange) -> None:
+        self._table_items._add_row_change(row_change)  # noqa: SLF001
+
     def is_view_selection_suspended(self) -> bool:
         return self._table_items.is_view_selection_suspended()
 
@@ -1,7 +1,19 @@
 r"""Find a pattern into a string."""
 
+import operator
 import re
-from typing import Pattern
+from typing import Callable, List, Optional, Pattern, Sequence, Tuple
+
+# the operators of the comparisons, the longest first to be matched before their prefix
+_COMPARISON_OPERATORS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+# the function comparing a value with a bound and the bound
+_Comparison = Tuple[Callable[[float, float], bool], float]
 
 
 class TextFinder:
@@ -11,11 +23,11 @@ class TextFinder:
         self._internal_pattern: str = ""
         self._is_regex_valid: bool = True
         self._is_comparison_valid: bool = True
-        self._comparison_type: int = 0
+        # the comparisons which must all be true for a pattern like "> 3 and < 10"
+        self._comparisons: List[_Comparison] = []
         self._match_case = False
         self._use_regex = False
         self.match_whole_word = False
-        self._comparison_operator = {1: ">=", 2: "<=", 3: ">", 4: "<"}
 
     @property
     def has_pattern(self) -> bool:
@@ -57,13 +69,13 @@ class TextFinder:
         self._update_internal_pattern()
 
     def match(self, value: str) -> bool:
-        if not self._match_case:
-            value = value.lower()
         # match using operator greater/less than
-        if self._comparison_type > 0 and not self.use_regex:
+        if len(self._comparisons) > 0 and not self.use_regex:
             return self._match_with_operator(value)
+        if not self._match_case:
+            value = value.lower()
         # match using in/==/regex
-        elif self.match_whole_word and not self._use_regex:
+        if self.match_whole_word and not self._use_regex:
             return self._internal_pattern == value
         elif self.match_whole_word and self._use_regex:
             return self._internal_pattern_re.fullmatch(value) is not None
@@ -72,20 +84,49 @@ class TextFinder:
         else:
             return self._internal_pattern in value
 
-    def _match_with_operator(self, value: str) -> bool:
-        try:
-            float(value)
-        except (ValueError, TypeError):
-            return False
+    def match_values(self, values: Sequence[str]) -> List[bool]:
+        r"""Check if each value matches the pattern, like match but for a whole column.
+
+        The matching function is chosen once for all the values, so it is much faster than
+        calling match for each value.
+        """
+        if len(self._comparisons) > 0 and not self.use_regex:
+            return self._match_values_with_operator(values)
+        if not self._match_case:
+            values = [value.lower() for value in values]
+        if self.match_whole_word and not self._use_regex:
+            pattern = self._internal_pattern
+            return [value == pattern for value in values]
+        elif self.match_whole_word and self._use_regex:
+            fullmatch = self._internal_pattern_re.fullmatch
+            return [fullmatch(value) is not None for value in values]
+        elif self._use_regex:
+            search = self._internal_pattern_re.search
+            return [search(value) is not None for value in values]
         else:
-            operator = self._comparison_operator[self._comparison_type]
-            is_matching: bool = eval(f"{value}{operator}{self._internal_pattern}", None, None)
-            return is_matching
+            pattern = self._internal_pattern
+            return [pattern in value for value in values]
+
+    def _match_with_operator(self, value: str) -> bool:
+        number = _to_float(value)
+        return number is not None and all(
+            compare(number, bound) for compare, bound in self._comparisons
+        )
+
+    def _match_values_with_operator(self, values: Sequence[str]) -> List[bool]:
+        numbers = [_to_float(value) for value in values]
+        for compare, bound in self._comparisons:
+            # the numbers not matching a comparison are discarded
+            numbers = [
+                number if number is not None and compare(number, bound) else None
+                for number in numbers
+            ]
+        return [number is not None for number in numbers]
 
     def _update_internal_pattern(self) -> None:
         r"""Update the internal pattern according to the options."""
         self._is_comparison_valid = True
-        self._comparison_type = 0
+        self._comparisons = []
         if self._match_case:
             self._internal_pattern = self._pattern
         else:
@@ -99,16 +140,40 @@ class TextFinder:
             else:
                 self._is_regex_valid = True
         else:
-            for comparison_type, comparison_char in self._comparison_operator.items():
-                internal_patter = self._internal_pattern.strip()
-                if internal_patter.startswith(comparison_char):
-                    internal_pattern = internal_patter[len(comparison_char) :].strip()
-                    try:
-                        float(internal_pattern)
-                    except (ValueError, TypeError):
-                        self._is_comparison_valid = False
-                    else:
-                        self._is_comparison_valid = True
-                        self._comparison_type = comparison_type
-                        self._internal_pattern = internal_pattern
-                    break
+            self._update_comparisons()
+
+    def _update_comparisons(self) -> None:
+        r"""Parse the comparisons of the pattern if it starts with an operator.
+
+        The comparisons are separated by "and", for example ">= 3 and < 10".
+        If one of them is not valid, the pattern is used as a text.
+        """
+        comparisons: List[_Comparison] = []
+        for text in re.split(
+            r"\s+and\s+", self._internal_pattern.strip(), flags=re.IGNORECASE
+        ):
+            comparison = _parse_comparison(text)
+            if comparison is None:
+                # a text starting without an operator is not a comparison
+                self._is_comparison_valid = len(comparisons) == 0 and not text.startswith(
+                    tuple(_COMPARISON_OPERATORS)
+                )
+                return
+            comparisons.append(comparison)
+        self._comparisons = comparisons
+
+
+def _parse_comparison(text: str) -> Optional[_Comparison]:
+    r"""Get the operator and the number of the comparison or None if it is not valid."""
+    for operator_text, compare in _COMPARISON_OPERATORS.items():
+        if text.startswith(operator_text):
+            bound = _to_float(text[len(operator_text) :].strip())
+            return None if bound is None else (compare, bound)
+    return None
+
+
+def _to_float(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
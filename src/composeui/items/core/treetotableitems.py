@@ -13,7 +13,7 @@ from composeui.items.tree.abstracttreeitems import AbstractTreeItems
 
 from typing_extensions import OrderedDict
 
-from typing import Any, Generator, List, Optional, Tuple
+from typing import Any, Generator, List, Optional, Set, Tuple
 
 
 class TreeToTableItems(AbstractTableItems[AnyModel]):
@@ -35,6 +35,9 @@ class TreeToTableItems(AbstractTableItems[AnyModel]):
     def add_dependency(self, dependency: "AbstractItems[AnyItemsView, AnyModel]") -> None:
         self._tree_items.add_dependency(dependency)
 
+    def get_data_sources(self) -> Optional[Set[str]]:
+        return self._tree_items.get_data_sources()
+
     def is_view_selection_suspended(self) -> bool:
         return self._tree_items.is_view_selection_suspended()
 
@@ -1,15 +1,11 @@
 from composeui.commontypes import AnyDetailTableItems, AnyMasterTableItems
 from composeui.core.tasks.abstracttask import AbstractTask
+from composeui.items.core.tablefilereader import TableFileReader
 from composeui.items.core.views.itemsview import FormatExtension
 
-import contextlib
+import json
 from pathlib import Path
-from typing import Optional
-
-with contextlib.suppress(ImportError, ModuleNotFoundError):
-    from openpyxl.utils.exceptions import InvalidFileException
-with contextlib.suppress(ImportError, ModuleNotFoundError):
-    from xlrd.biffh import XLRDError
+from typing import Any, Dict, List, Optional
 
 try:
     import pandas as pd
@@ -20,6 +16,19 @@ else:
 
 
 class ImportFileLinkedTableTask(AbstractTask):
+    r"""Import a file in a master table and its detail table by chunks of rows.
+
+    The rows of a chunk are grouped by the columns of the master table: the new master rows
+    are inserted at once with insert_rows and set_block, then the rows of each group are
+    appended to the detail rows of its master row with append_detail_block. The rows of a
+    master row split between two chunks are added to the same master row. The progress is
+    reported after each chunk and the import stops between two chunks if the task is canceled.
+    If the import fails or is canceled after the items have been modified,
+    is_partially_imported is set to True so that the caller undoes the import with the history.
+    """
+
+    reports_progress = True
+
     def __init__(
         self,
         master_items: AnyMasterTableItems,
@@ -34,147 +43,166 @@ class ImportFileLinkedTableTask(AbstractTask):
         self._filepath = filepath
         self._is_cleaning = is_cleaning
         self._extension = extension
+        # number of rows read and inserted at once
+        self.chunk_size = 10000
+        # if the items have been modified before a failure or a cancellation
+        self.is_partially_imported = False
 
     def _run(self) -> Optional[bool]:
         if not _HAS_PANDAS:
             raise ValueError("Can't import the linked table without pandas installed.")
+        reader = TableFileReader(self._filepath, self._extension, self.chunk_size)
+        master_column_indices = self._master_items.get_exported_column_indices()
+        master_column_names: List[str] = []
+        detail_columns: List[int] = []
+        # the master row of each index of the master table already imported
+        master_rows: Dict[Any, int] = {}
+        master_nb_rows = 0
+        warning_messages: List[str] = []
+        self.is_partially_imported = False
+        is_modified = False
+        is_finished = False
         try:
-            # TODO: Add option to choose the separator
-            if self._extension == FormatExtension.CSV:
-                table_df = pd.read_csv(self._filepath, sep=";")
-            elif self._extension == FormatExtension.EXCEL:
-                try:
-                    table_df = pd.read_excel(self._filepath, engine="openpyxl")
-                except InvalidFileException:
-                    try:
-                        table_df = pd.read_excel(self._filepath, engine="xlrd")
-                    except XLRDError:
-                        # old versions of pandas don't manage the bad extension
-                        # with openpyxl so it fallback to xlrd which don't know how
-                        # to read .xlsx files
-                        self.error_message = "Change the extension of the file to .xlsx"
+            for chunk_index, (table_df, progress) in enumerate(reader.iter_chunks()):
+                if chunk_index == 0:
+                    # check if the file is not empty
+                    if table_df.shape[0] == 0 or table_df.shape[1] == 0:
+                        self.error_message = (
+                            "The parsing of the file failed or the file is empty"
+                        )
                         return False
-            elif self._extension == FormatExtension.JSON:
-                table_df = pd.read_json(self._filepath)
-            else:
-                self.error_message = (
-                    f"The extension '{self._filepath.suffix}' is not supported yet"
-                )
-                return False
-        except (pd.errors.ParserError, pd.errors.EmptyDataError):
-            self.error_message = "Unable to read the file due to an incorrect format"
-            return False
-        else:
-            # check if the file is not empty
-            if table_df.shape[0] == 0 or table_df.shape[1] == 0:
-                self.error_message = "The parsing of the file failed or the file is empty"
-                return False
-            # Get the exported column indices of the master table and check if they are ok
-            master_column_indices = self._master_items.get_exported_column_indices()
-            if len(master_column_indices) == 0:
-                self.error_message = "The exported column indices of the master table is empty"
-                return False
-            elif min(master_column_indices) < 0:
-                self.error_message = (
-                    "The exported column indices of the master table has an index < 0: "
-                    f"{master_column_indices}"
-                )
-                return False
-            elif max(master_column_indices) > self._master_items.get_nb_columns():
-                self.error_message = (
-                    "The exported column indices of the master table has an index greater "
-                    f"than the number of columns: {master_column_indices}"
-                )
-                return False
-            # Get the column names of the table corresponding to the master table
-            # The lines of the master table are duplicated to be able to be exported
-            # along with the detail table
-            master_column_names = list(table_df.columns[: len(master_column_indices)])
-            # The columns of the master table are used as an index to simplify the separation
-            # of the detail table by the lines of the master table
-            table_df = table_df.set_index(master_column_names)
-            # If the user choose to clean the table then all the lines of the master table
-            # are removed otherwise the insertion is after the last row of the master table
-            if self._is_cleaning:
-                self._master_items.remove_all()
-                master_nb_rows = 0
-            else:
-                master_nb_rows = self._master_items.get_nb_rows()
-            # The values for the master are extracted
-            # Pandas manage differently when the index has one column or multiple columns
-            if len(master_column_indices) == 1:
-                master_values = {
-                    (master_nb_rows + i): {master_column_indices[0]: value}
-                    for i, value in enumerate(table_df.index.unique())
-                }
-            else:
-                master_values = {
-                    (master_nb_rows + i): dict(zip(master_column_indices, list(values)))
-                    for i, values in enumerate(table_df.index.unique())
-                }
-            warning_messages = []
-            # Iteration over the lines of the master table
-            for master_row, values in master_values.items():
-                # insertion of the row and set the data for each column
-                self._master_items.insert(master_row)
-                for master_column, value in values.items():
-                    is_ok = self._master_items.set_data(master_row, master_column, value)
-                    if not is_ok:
+                    # Check if the exported column indices of the master table are ok
+                    if not self._check_master_column_indices(master_column_indices):
+                        return False
+                    # Get the column names of the table corresponding to the master table
+                    # The lines of the master table are duplicated to be able to be exported
+                    # along with the detail table
+                    master_column_names = list(table_df.columns[: len(master_column_indices)])
+                    # The columns of the detail table are the ones after the columns of the
+                    # master table
+                    detail_columns = self._detail_items.get_exported_column_indices()
+                    nb_detail_columns = table_df.shape[1] - len(master_column_names)
+                    if nb_detail_columns < len(detail_columns):
                         warning_messages.append(
-                            f"- Failed to set '{value}' at {master_row, master_column} "
-                            "of the master table"
+                            f"- Missing {len(detail_columns) - nb_detail_columns} column(s) "
+                            "in the given file"
                         )
-                try:
-                    # To avoid to modify the selection of the view the selection is suspended
-                    # The selection is modified here to enable the different items of the
-                    # detail table which is dependent of the selection of the master table
-                    self._master_items.set_view_selection_suspend_status(True)
-                    self._master_items.set_selected_rows([master_row])
-                    # Extract the detail table for an index of the master table
-                    detail_df = table_df.loc[tuple(values.values())]
-                    detail_nb_rows = self._detail_items.get_nb_rows()
-                    if len(detail_df.shape) == 2:
-                        detail_df_nb_rows = detail_df.shape[0]
-                        detail_df_nb_cols = detail_df.shape[1]
+                        detail_columns = detail_columns[:nb_detail_columns]
+                    # If the user choose to clean the table then all the lines of the master
+                    # table are removed otherwise the insertion is after the last row of the
+                    # master table
+                    is_modified = True
+                    if self._is_cleaning:
+                        self._master_items.remove_all()
+                        master_nb_rows = 0
                     else:
-                        detail_df_nb_rows = 1
-                        detail_df_nb_cols = detail_df.shape[0]
-                    # Iteration over the lines of the detail pandas table
-                    for i in range(detail_df_nb_rows):
-                        # Insertion of the line and set the data for each column which has been
-                        # choosen to be exported
-                        detail_row = detail_nb_rows + i
-                        self._detail_items.insert(detail_row)
-                        for j, detail_column in enumerate(
-                            self._detail_items.get_exported_column_indices()
-                        ):
-                            if j >= detail_df_nb_cols:
-                                nb_missing_columns = (
-                                    len(self._detail_items.get_exported_column_indices())
-                                    - detail_df_nb_cols
-                                )
-                                warning_messages.append(
-                                    f"- Missing {nb_missing_columns} column(s) "
-                                    "in the given file"
-                                )
-                                break
-                            if len(detail_df.shape) == 1:
-                                value = detail_df.iloc[j]
-                            else:
-                                value = detail_df.iloc[i, j]
-                            is_ok = self._detail_items.set_data(
-                                detail_row, detail_column, value
-                            )
-                            if not is_ok:
-                                warning_messages.append(
-                                    f"- Failed to set '{value}' at {detail_row, detail_column}"
-                                    " of the detail table"
-                                )
-                finally:
-                    # Even if the insertion on the detail table failed the selection
-                    # of the master table view is restored
-                    self._master_items.set_view_selection_suspend_status(False)
+                        master_nb_rows = self._master_items.get_nb_rows()
+                self._import_chunk(
+                    table_df,
+                    master_column_names=master_column_names,
+                    master_column_indices=master_column_indices,
+                    detail_columns=detail_columns,
+                    master_nb_rows=master_nb_rows,
+                    master_rows=master_rows,
+                    warning_messages=warning_messages,
+                )
                 # The warning messages are added to be displayed to the user
                 # but the number of messages are limited to avoid having an illisible message
                 self.warning_message = "\n".join(warning_messages[:10])
+                self.set_progress(progress)
+                if self.is_canceled:
+                    return False
+            is_finished = True
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, json.JSONDecodeError):
+            self.error_message = "Unable to read the file due to an incorrect format"
+            if is_modified:
+                self.error_message += (
+                    f" after importing {len(master_rows)} master row(s), the import is undone"
+                )
+            return False
+        finally:
+            # the rows imported before a failure or a cancellation are undone by the caller
+            self.is_partially_imported = is_modified and not is_finished
+        return True
+
+    def _check_master_column_indices(self, master_column_indices: List[int]) -> bool:
+        if len(master_column_indices) == 0:
+            self.error_message = "The exported column indices of the master table is empty"
+            return False
+        elif min(master_column_indices) < 0:
+            self.error_message = (
+                "The exported column indices of the master table has an index < 0: "
+                f"{master_column_indices}"
+            )
+            return False
+        elif max(master_column_indices) > self._master_items.get_nb_columns():
+            self.error_message = (
+                "The exported column indices of the master table has an index greater "
+                f"than the number of columns: {master_column_indices}"
+            )
+            return False
         return True
+
+    def _import_chunk(
+        self,
+        table_df: "pd.DataFrame",
+        *,
+        master_column_names: List[str],
+        master_column_indices: List[int],
+        detail_columns: List[int],
+        master_nb_rows: int,
+        master_rows: Dict[Any, int],
+        warning_messages: List[str],
+    ) -> None:
+        r"""Import the rows of a chunk grouped by the columns of the master table."""
+        # The rows of the file are grouped by the values of the master table once, the groups
+        # are numbered in the order of their first row
+        nb_master_columns = len(master_column_names)
+        groups = table_df.groupby(master_column_names, sort=False, dropna=False)
+        group_positions: List[List[int]] = [[] for _ in range(groups.ngroups)]
+        for position, group_number in enumerate(groups.ngroup().tolist()):
+            group_positions[group_number].append(position)
+        master_columns_values = [
+            table_df.iloc[:, j].tolist() for j in range(nb_master_columns)
+        ]
+        keys = [
+            tuple(column_values[positions[0]] for column_values in master_columns_values)
+            for positions in group_positions
+        ]
+        # All the new rows of the master table are inserted at once
+        new_keys = [key for key in keys if key not in master_rows]
+        first_new_row = master_nb_rows + len(master_rows)
+        master_rows.update(
+            {key: master_row for master_row, key in enumerate(new_keys, start=first_new_row)}
+        )
+        if len(new_keys) > 0:
+            self._master_items.insert_rows(first_new_row, len(new_keys))
+            master_values = [list(values) for values in zip(*new_keys)]
+            for master_row, master_column in self._master_items.set_block(
+                first_new_row, master_column_indices, master_values
+            ):
+                value = new_keys[master_row - first_new_row][
+                    master_column_indices.index(master_column)
+                ]
+                warning_messages.append(
+                    f"- Failed to set '{value}' at {master_row, master_column} "
+                    "of the master table"
+                )
+        # The rows of each group are appended to the detail rows of its master row
+        detail_columns_values = [
+            table_df.iloc[:, nb_master_columns + j].tolist()
+            for j in range(len(detail_columns))
+        ]
+        for key, positions in zip(keys, group_positions):
+            detail_values = [
+                [column_values[position] for position in positions]
+                for column_values in detail_columns_values
+            ]
+            for index, detail_column in self._detail_items.append_detail_block(
+                self._master_items, master_rows[key], detail_columns, detail_values
+            ):
+                value = detail_values[detail_columns.index(detail_column)][index]
+                warning_messages.append(
+                    f"- Failed to set '{value}' at {index, detail_column} of the detail rows "
+                    f"of the master row {master_rows[key]}"
+                )
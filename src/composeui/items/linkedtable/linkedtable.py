@@ -36,15 +36,24 @@ def import_clicked(
                 filepath_extension,
             )
             task.is_debug = model.is_debug
+            model.start_recording_history()
             progresspopup.display_view(
                 main_view,
                 tasks=Tasks((task,), print_to_std=True),
                 finished_slots=[
+                    model.stop_recording_history,
+                    partial(undo_partial_import, task, model),
                     partial(tools.update_view_with_dependencies, view.master_table),
                 ],
             )
 
 
+def undo_partial_import(task: ImportFileLinkedTableTask, model: AnyModel) -> None:
+    """Undo the rows imported before the failure to read the rest of the file."""
+    if task.is_partially_imported:
+        model.undo()
+
+
 def export_clicked(
     *,
     view: LinkedTableView[AnyMasterTableItems, AnyDetailTableItems],
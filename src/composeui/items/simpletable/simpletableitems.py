@@ -1,5 +1,10 @@
 from composeui.commontypes import AnyModel
-from composeui.items.core.itemsutils import DelegateProps, FloatDelegateProps
+from composeui.items.core.itemsutils import (
+    DelegateProps,
+    FloatDelegateProps,
+    SortKey,
+    get_sort_key,
+)
 from composeui.items.table.abstracttableitems import AbstractTableItems
 from composeui.store.sqlitestore import SqliteStore
 
@@ -8,7 +13,9 @@ from typing_extensions import OrderedDict, Self, TypedDict
 import itertools as it
 import sqlite3
 import typing
-from typing import Any, Dict, List, Optional
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 if typing.TYPE_CHECKING:
     from composeui.items.table.tableview import TableView
@@ -23,6 +30,150 @@ class _TableInfo(TypedDict):
     pk: str
 
 
+class _RowIdIndex:
+    """Bidirectional mapping between the ROWID and the row index of the rows of a table.
+
+    The ROWIDs are stored in an array in the order of the table so getting the ROWID of a row
+    is O(1). When the table is ordered by the ROWID, the array is sorted and the row of a ROWID
+    is found with a binary search. Otherwise, a dictionary is built lazily after each
+    modification of the order.
+    """
+
+    def __init__(self, row_ids: Iterable[int] = (), is_sorted: bool = True) -> None:
+        self._row_ids = array("q", row_ids)
+        self._is_sorted = is_sorted
+        self._rows: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._row_ids)
+
+    def get_id(self, row: int) -> int:
+        """Get the ROWID of the given row."""
+        if 0 <= row < len(self._row_ids):
+            return self._row_ids[row]
+        raise IndexError("index out of range")
+
+    def get_ids(self, row_start: int, row_end: int) -> Sequence[int]:
+        """Get the ROWIDs of the rows from row_start to row_end (excluded)."""
+        return self._row_ids[row_start:row_end]
+
+    def get_row(self, rid: int) -> int:
+        """Get the row of the given ROWID."""
+        if self._is_sorted:
+            row = bisect_left(self._row_ids, rid)
+            if row < len(self._row_ids) and self._row_ids[row] == rid:
+                return row
+            raise IndexError("index out of range")
+        if self._rows is None:
+            self._rows = {row_id: row for row, row_id in enumerate(self._row_ids)}
+        try:
+            return self._rows[rid]
+        except KeyError:
+            raise IndexError("index out of range") from None
+
+    def insert(self, row: int, rid: int) -> None:
+        """Insert the ROWID at the given row.
+
+        If the table is ordered by the ROWID, the row is ignored and the ROWID is inserted at
+        its sorted position.
+        """
+        if self._is_sorted:
+            row = bisect_left(self._row_ids, rid)
+        self._row_ids.insert(row, rid)
+        self._rows = None
+
+    def insert_many(self, row: int, rids: Sequence[int]) -> int:
+        """Insert the sorted ROWIDs from the given row and return the row of the first one.
+
+        If the table is ordered by the ROWID, the row is ignored and the ROWIDs are inserted at
+        the sorted position of the first one, they must be greater than the other ROWIDs.
+        """
+        if self._is_sorted and len(rids) > 0:
+            row = bisect_left(self._row_ids, rids[0])
+        self._row_ids[row:row] = array("q", rids)
+        self._rows = None
+        return row
+
+    def remove(self, rid: int) -> None:
+        """Remove the given ROWID."""
+        del self._row_ids[self.get_row(rid)]
+        self._rows = None
+
+    def move(self, from_row: int, to_row: int) -> None:
+        """Move the ROWID at from_row to to_row."""
+        rid = self._row_ids.pop(from_row)
+        self._row_ids.insert(to_row, rid)
+        self._rows = None
+
+
+class _PageCache:
+    """Cache of the displayed data of a table by pages of rows.
+
+    The pages are loaded on demand with the given function and the least recently used pages
+    are removed when the number of pages exceeds the given maximum.
+    A page contains the displayed data of all the columns of its rows by column.
+    """
+
+    def __init__(
+        self,
+        page_size: int,
+        max_pages: int,
+        load_page: Callable[[int, int], List[List[str]]],
+    ) -> None:
+        if page_size <= 0 or max_pages <= 0:
+            raise ValueError("The page size and the maximum number of pages must be positive")
+        self._page_size = page_size
+        self._max_pages = max_pages
+        self._load_page = load_page
+        self._pages: OrderedDict[int, List[List[str]]] = OrderedDict()
+
+    def get_block(
+        self, row_start: int, row_end: int, columns: Sequence[int]
+    ) -> List[List[str]]:
+        """Get the data of the rows from row_start to row_end (excluded) by column."""
+        block: List[List[str]] = [[] for _ in columns]
+        if row_start >= row_end:
+            return block
+        for page_index in range(
+            row_start // self._page_size, (row_end - 1) // self._page_size + 1
+        ):
+            page = self._get_page(page_index)
+            page_start = page_index * self._page_size
+            start = max(row_start - page_start, 0)
+            end = row_end - page_start
+            for block_column, column in zip(block, columns):
+                block_column.extend(page[column][start:end])
+        return block
+
+    def invalidate(self, row_start: int, row_end: Optional[int] = None) -> None:
+        """Remove the pages containing the rows from row_start to row_end (excluded).
+
+        If row_end is None, all the pages after row_start are removed.
+        """
+        first_page = row_start // self._page_size
+        for page_index in list(self._pages):
+            if page_index >= first_page and (
+                row_end is None or page_index <= (row_end - 1) // self._page_size
+            ):
+                del self._pages[page_index]
+
+    def clear(self) -> None:
+        """Remove all the pages."""
+        self._pages.clear()
+
+    def _get_page(self, page_index: int) -> List[List[str]]:
+        page = self._pages.get(page_index)
+        if page is None:
+            page_start = page_index * self._page_size
+            page = self._load_page(page_start, page_start + self._page_size)
+            self._pages[page_index] = page
+            while len(self._pages) > self._max_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_index)
+        return page
+
+
 class SimpleTableItems(AbstractTableItems[AnyModel]):
     """Implement an AbstractTableItems for an sqlite table.
 
@@ -35,8 +186,17 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
         automatically like `point 1`, `point 2`, ... at each insertion
     - By default the table can't be modified, to activate the insertion/removing/modification
         the argument `is_read_only` can be set to false.
+    - By default all the displayed data are cached in memory. For very large tables, the
+        argument `page_size` activates a cache by pages of rows loaded on demand. At most
+        `max_cached_pages` pages are kept in memory.
+    - The rows, their ROWIDs and their displayed data are cached. The modifications of the
+        table done outside of the items must be notified with notify_table_change of the store
+        to update the cache.
     """
 
+    # maximum number of ROWIDs in the query selecting a block of rows of an ordered table
+    max_selected_row_ids = 5000
+
     def __init__(
         self,
         view: "TableView[Self]",
@@ -47,6 +207,9 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
         order_column: Optional[str] = None,
         increment_columns: Optional[List[str]] = None,
         is_read_only: bool = True,
+        *,
+        page_size: Optional[int] = None,
+        max_cached_pages: int = 20,
     ) -> None:
         super().__init__(view, model, title=table_name.capitalize())
         self._store = store
@@ -54,6 +217,7 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
         self._is_read_only = is_read_only
         self._db_table_name: str = table_name
         self._db_table_infos = self._get_column_infos()
+        self._is_sql_view = self._get_sql_type() == "view"
         self._column_names = list(self._db_table_infos)
         if order_column is not None and order_column not in self._column_names:
             msg = f"Order column is not a column of the table '{table_name}'"
@@ -69,83 +233,76 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
                     raise ValueError(msg)
             self._column_names = list(columns)
         self._column_titles = columns
-        self._cached_data = self.get_all_datas()
+        self._cached_data: List[List[str]] = []
+        self._page_cache: Optional[_PageCache] = None
+        if page_size is not None:
+            self._page_cache = _PageCache(page_size, max_cached_pages, self._select_block)
+        self._row_ids = _RowIdIndex()
+        self._cache_version = -1
+        self.update_cache()
+
+    def get_data_sources(self) -> Optional[Set[str]]:
+        """Get the name of the table or None if it is an sql view of unknown tables."""
+        if self._is_sql_view:
+            return None
+        return {self._db_table_name}
 
     def get_cached_data(self) -> Optional[List[List[str]]]:
+        """Get the cached data or None if the cache by pages is used."""
+        if self._page_cache is not None:
+            return None
+        self._check_cache()
         return self._cached_data
 
     def update_cache(self) -> None:
-        self._cached_data = self.get_all_datas()
+        """Update the cached data and the mapping between the ROWIDs and the rows.
+
+        Both are built from the same query.
+        The modifications done through the items (insert, remove, move, set_data) update the
+        cache in place and are notified to the store and to the views with their rows (see
+        take_row_changes). The cache is updated again only when the version of the table in
+        the store shows a modification done elsewhere like an undo/redo or an import.
+
+        With the cache by pages, only the ROWIDs are selected and the pages are reloaded on
+        demand.
+        """
+        self._cache_version = self._store.get_table_version(self._get_version_table())
+        if self._page_cache is not None:
+            self._page_cache.clear()
+            self._row_ids = _RowIdIndex(
+                self._select_all_row_ids(), is_sorted=self._order_column is None
+            )
+            return
+        result = self._select_all_rows()
+        self._cached_data = self._to_display_columns(result)
+        self._row_ids = _RowIdIndex(
+            (int(row[-1]) for row in result), is_sorted=self._order_column is None
+        )
+
+    def _check_cache(self) -> None:
+        """Update the cache if the table has been modified outside of the items."""
+        if self._cache_version != self._store.get_table_version(self._get_version_table()):
+            self.update_cache()
+            # the rows notified before can't be mapped to the rows of the updated cache
+            self.invalidate_row_changes()
+
+    def _notify_change(self) -> None:
+        """Notify the store of a modification of the table whose cache is already updated."""
+        self._cache_version = self._store.notify_table_change([self._db_table_name])
+
+    def _get_version_table(self) -> Optional[str]:
+        """Get the table whose version is checked or None for a view of unknown tables."""
+        if self._is_sql_view:
+            return None
+        return self._db_table_name
 
     def get_id_from_row(self, row: int) -> Any:
-        if self._order_column is None:
-            with self._store.get_connection() as db_conn:
-                result = db_conn.execute(
-                    f"""--sql
-                    SELECT ROWID
-                    FROM {self._db_table_name}
-                    ORDER BY ROWID LIMIT 1 OFFSET :row
-                    """,
-                    {"row": row},
-                ).fetchone()
-            if result is not None:
-                return int(result[0])
-        else:
-            with self._store.get_connection() as db_conn:
-                result = db_conn.execute(
-                    f"""--sql
-                    SELECT ROWID
-                    FROM {self._db_table_name}
-                    WHERE {self._order_column} = :row
-                    """,
-                    {"row": row},
-                ).fetchone()
-            if result is not None:
-                return int(result[0])
-        raise IndexError("index out of range")
+        self._check_cache()
+        return self._row_ids.get_id(row)
 
     def get_row_from_id(self, rid: Any) -> int:
-        if self._order_column is None:
-            with self._store.get_connection() as db_conn:
-                result = db_conn.execute(
-                    f"""--sql
-                    SELECT
-                        CASE
-                            -- Check if the rowid exists
-                            WHEN EXISTS(
-                                SELECT 1 FROM {self._db_table_name}
-                                WHERE ROWID = :row_id
-                            )
-                            THEN(
-                                -- if the rowid exists the count the number of rows that
-                                -- have a rowid less than the given rowid since the ROWID
-                                -- column is used to order the column
-                                SELECT COUNT(*)
-                                FROM {self._db_table_name}
-                                WHERE ROWID < :row_id
-                            )
-                        ELSE
-                            -- if the rowid is missing then return NULL to raise an IndexError
-                            NULL
-                        END
-                    """,
-                    {"row_id": rid},
-                ).fetchone()
-            if result is not None and result[0] is not None:
-                return int(result[0])
-        else:
-            with self._store.get_connection() as db_conn:
-                result = db_conn.execute(
-                    f"""--sql
-                    SELECT {self._order_column}
-                    FROM {self._db_table_name}
-                    WHERE ROWID=:row_id
-                    """,
-                    {"row_id": rid},
-                ).fetchone()
-            if result is not None:
-                return int(result[0])
-        raise IndexError("index out of range")
+        self._check_cache()
+        return self._row_ids.get_row(rid)
 
     def get_column_names(self) -> List[str]:
         """Get the names of the column and add the ROWID column in debug mode."""
@@ -177,14 +334,12 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
             raise IndexError(msg)
 
     def get_nb_rows(self) -> int:
-        """Get the number of rows of the table."""
-        with self._store.get_connection() as db_conn:
-            result = db_conn.execute(
-                f"SELECT COUNT(*) FROM {self._db_table_name}",
-            ).fetchone()
-            if result is not None:
-                return int(result[0])
-        return 0
+        """Get the number of rows of the table.
+
+        The number of rows is maintained with the mapping between the ROWIDs and the rows.
+        """
+        self._check_cache()
+        return len(self._row_ids)
 
     def insert(self, row: int) -> Optional[int]:
         """Insert a row in the table and returns eventually the next selected row.
@@ -195,6 +350,7 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
         If `order_column` has been provided then the rows after the given row will
         be incremented to keep the order of the table.
         """
+        self._check_cache()
         with self._store.get_connection() as db_conn:
             if self._order_column is not None:
                 # Update the order of all rows after the new row.
@@ -243,11 +399,95 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
                     {"rowid": cursor.lastrowid},
                 )
             db_conn.commit()
-        self.update_cache()
+        self._row_ids.insert(row, cursor.lastrowid)
+        self.notify_row_inserted(self._insert_cached_row(cursor.lastrowid))
+        self._notify_change()
+        return row
+
+    def insert_rows(self, row: int, count: int) -> Optional[int]:
+        """Insert count rows with the default values in one transaction.
+
+        The inserted rows are selected at once to be added to the cache.
+        """
+        if count <= 0:
+            return row
+        self._check_cache()
+        with self._store.get_connection() as db_conn:
+            max_rowid = db_conn.execute(
+                f"SELECT IFNULL(MAX(ROWID), 0) FROM {self._db_table_name}"
+            ).fetchone()[0]
+            if self._order_column is not None:
+                db_conn.execute(
+                    f"""
+                    UPDATE {self._db_table_name}
+                    SET {self._order_column}={self._order_column}+:count
+                    WHERE {self._order_column} >= :row
+                    """,
+                    {"row": row, "count": count},
+                )
+            try:
+                db_conn.executemany(
+                    f"INSERT INTO {self._db_table_name} DEFAULT VALUES", [()] * count
+                )
+            except sqlite3.IntegrityError as e:
+                db_conn.rollback()
+                if "NOT NULL constraint failed" in e.args[0]:
+                    raise ValueError(
+                        "Having default values for all the columns are mandatory "
+                        "to use a SimpleTable"
+                    ) from None
+                else:
+                    raise
+            inserted_rowids = [
+                int(result[0])
+                for result in db_conn.execute(
+                    f"""
+                    SELECT ROWID FROM {self._db_table_name}
+                    WHERE ROWID > :max_rowid ORDER BY ROWID
+                    """,
+                    {"max_rowid": max_rowid},
+                )
+            ]
+            if self._order_column is not None:
+                db_conn.executemany(
+                    f"""
+                    UPDATE {self._db_table_name}
+                    SET {self._order_column}=:row
+                    WHERE ROWID=:rowid
+                    """,
+                    (
+                        {"rowid": rowid, "row": inserted_row}
+                        for inserted_row, rowid in enumerate(inserted_rowids, start=row)
+                    ),
+                )
+            for increment_column in self._increment_columns:
+                db_conn.executemany(
+                    f"""
+                    UPDATE {self._db_table_name}
+                    SET {increment_column}=(
+                        SELECT {increment_column}
+                        FROM {self._db_table_name}
+                        WHERE ROWID=:rowid
+                    ) || ' ' || :rowid WHERE ROWID=:rowid
+                    """,
+                    ({"rowid": rowid} for rowid in inserted_rowids),
+                )
+            db_conn.commit()
+        cached_row = self._row_ids.insert_many(row, inserted_rowids)
+        if self._page_cache is not None:
+            self._page_cache.invalidate(cached_row)
+        else:
+            inserted_columns = self._select_block(cached_row, cached_row + count)
+            for cached_column, inserted_values in zip(self._cached_data, inserted_columns):
+                cached_column[cached_row:cached_row] = inserted_values
+        for inserted_row in range(cached_row, cached_row + count):
+            self.notify_row_inserted(inserted_row)
+        self._notify_change()
         return row
 
     def _remove_by_id(self, rid: Any) -> None:
         """Remove the row with the give id."""
+        self._check_cache()
         with self._store.get_connection() as db_conn:
             row = None
             if self._order_column is not None:
@@ -267,30 +507,178 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
                     {"row": row},
                 )
             db_conn.commit()
-        self.update_cache()
+        cached_row = self.get_row_from_id(rid)
+        self._row_ids.remove(rid)
+        if self._page_cache is not None:
+            self._page_cache.invalidate(cached_row)
+        for cached_column in self._cached_data:
+            del cached_column[cached_row]
+        self.notify_row_removed(cached_row)
+        self._notify_change()
 
     def get_data_by_id(self, rid: Any, column: int) -> str:
         """Get the data to be displayed by the UI at the given row id and column."""
         value = self.get_edit_data_by_id(rid, column)
         return self._get_display_value(value, column)
 
+    def get_data_block(
+        self, row_start: int, row_end: int, columns: Sequence[int]
+    ) -> List[List[str]]:
+        """Get the displayed data of the rows from row_start to row_end (excluded).
+
+        The block is selected with only one query or taken from the cache by pages.
+        """
+        self._check_cache()
+        row_start = max(row_start, 0)
+        row_end = min(row_end, len(self._row_ids))
+        if self._page_cache is not None:
+            return self._page_cache.get_block(row_start, row_end, columns)
+        return self._select_block(row_start, row_end, columns)
+
+    def _select_block(
+        self, row_start: int, row_end: int, columns: Optional[Sequence[int]] = None
+    ) -> List[List[str]]:
+        """Select the displayed data of the rows from row_start to row_end (excluded).
+
+        By default, all the columns are selected.
+        """
+        if columns is None:
+            columns = range(len(self.get_column_names()))
+        result = self._select_rows(row_start, row_end, columns)
+        return [
+            [self._get_display_value(row[index], column) for row in result]
+            for index, column in enumerate(columns)
+        ]
+
+    def get_edit_data_block(
+        self, row_start: int, row_end: int, columns: Sequence[int]
+    ) -> List[List[Any]]:
+        """Get the edited data of the rows from row_start to row_end (excluded) at once."""
+        self._check_cache()
+        result = self._select_rows(max(row_start, 0), row_end, columns)
+        edited_columns = []
+        for index, column in enumerate(columns):
+            _, column_type, default_value = self._get_edit_column_infos(column)
+            edited_columns.append(
+                [self._to_edit_value(row[index], column_type, default_value) for row in result]
+            )
+        return edited_columns
+
+    def _select_rows(
+        self, row_start: int, row_end: int, columns: Sequence[int]
+    ) -> List[sqlite3.Row]:
+        """Select the stored values of the rows from row_start to row_end (excluded).
+
+        Without order column, the rows are selected from the ROWID of the first row.
+        Otherwise, the values of the order column may have gaps, so the rows are selected by
+        their ROWIDs and put back in the order of the mapping between the ROWIDs and the rows.
+        """
+        row_end = min(row_end, len(self._row_ids))
+        if row_start >= row_end:
+            return []
+        select_columns = ",".join(self._get_sql_column_name(column) for column in columns)
+        with self._store.get_connection() as db_conn:
+            if self._order_column is None:
+                result = db_conn.execute(
+                    f"""--sql
+                    SELECT {select_columns}
+                    FROM {self._db_table_name}
+                    WHERE ROWID >= :first_row_id
+                    ORDER BY ROWID
+                    LIMIT :nb_rows
+                    """,
+                    {
+                        "first_row_id": self._row_ids.get_id(row_start),
+                        "nb_rows": row_end - row_start,
+                    },
+                ).fetchall()
+            else:
+                row_ids = self._row_ids.get_ids(row_start, row_end)
+                rows_by_id: Dict[int, sqlite3.Row] = {}
+                for chunk_start in range(0, len(row_ids), self.max_selected_row_ids):
+                    chunk = row_ids[chunk_start : chunk_start + self.max_selected_row_ids]
+                    # the ROWIDs are integers so they can be safely written in the query
+                    for selected_row in db_conn.execute(
+                        f"""--sql
+                        SELECT {select_columns}, ROWID
+                        FROM {self._db_table_name}
+                        WHERE ROWID IN ({",".join(str(rid) for rid in chunk)})
+                        """
+                    ):
+                        rows_by_id[int(selected_row[-1])] = selected_row
+                try:
+                    result = [rows_by_id[rid] for rid in row_ids]
+                except KeyError:
+                    raise IndexError("index out of range") from None
+        return result
+
     def get_all_datas(self) -> List[List[str]]:
         """Get all the data of the table."""
+        return self._to_display_columns(self._select_all_rows())
+
+    def _select_all_rows(self) -> List[sqlite3.Row]:
+        """Select all the rows of the table with the ROWID as the last column."""
+        columns = range(len(self.get_column_names()))
+        select_columns = ",".join(self._get_sql_column_name(column) for column in columns)
         with self._store.get_connection() as db_conn:
-            columns = self.get_column_names()
             order_column = "ROWID"
             if self._order_column is not None:
                 order_column = self._order_column
+            return db_conn.execute(
+                f"""--sql
+                SELECT {select_columns}, ROWID
+                FROM {self._db_table_name}
+                ORDER BY {order_column}
+                """
+            ).fetchall()
+
+    def _select_all_row_ids(self) -> List[int]:
+        """Select the ROWIDs of all the rows of the table in the order of the table."""
+        order_column = "ROWID"
+        if self._order_column is not None:
+            order_column = self._order_column
+        with self._store.get_connection() as db_conn:
             result = db_conn.execute(
                 f"""--sql
-                SELECT {','.join(columns)}, ROWID
+                SELECT ROWID
                 FROM {self._db_table_name}
                 ORDER BY {order_column}
                 """
             ).fetchall()
+        return [int(row[0]) for row in result]
+
+    def _select_row(self, rid: Any) -> List[str]:
+        """Select the displayed values of the row with the given ROWID."""
+        columns = range(len(self._cached_data))
+        select_columns = ",".join(self._get_sql_column_name(column) for column in columns)
+        with self._store.get_connection() as db_conn:
+            result = db_conn.execute(
+                f"""--sql
+                SELECT {select_columns}
+                FROM {self._db_table_name}
+                WHERE ROWID=:row_id
+                """,
+                {"row_id": rid},
+            ).fetchone()
+        if result is None:
+            raise IndexError("index out of range")
+        return [self._get_display_value(result[column], column) for column in columns]
+
+    def _insert_cached_row(self, rid: Any) -> int:
+        """Insert the row with the given ROWID into the cache at its row and return it."""
+        row = self.get_row_from_id(rid)
+        if self._page_cache is not None:
+            self._page_cache.invalidate(row)
+            return row
+        for cached_column, display_value in zip(self._cached_data, self._select_row(rid)):
+            cached_column.insert(row, display_value)
+        return row
+
+    def _to_display_columns(self, result: Sequence[Sequence[Any]]) -> List[List[str]]:
+        """Transform the selected rows into columns of displayed values."""
         return [
             [self._get_display_value(row[column], column) for row in result]
-            for column, _ in enumerate(columns)
+            for column in range(len(self.get_column_names()))
         ]
 
     def _get_display_value(self, value: Any, column: int) -> str:
@@ -300,22 +688,21 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
             or (not self._model.is_debug and column < self.get_nb_columns())
         ):
             column_type = self._db_table_infos[self._column_names[column]]["type"]
-            if column_type == "REAL":
+            if column_type == "REAL" and isinstance(value, (int, float)):
                 return self.display_float(value, 2)
         if value is not None:
             return str(value)
         return ""
 
+    def _get_sql_column_name(self, column: int) -> str:
+        """Get the name of the sqlite column of the given column of the table."""
+        if self._model.is_debug and column == self.get_nb_columns() - 1:
+            return "ROWID"
+        return self._column_names[column]
+
     def get_edit_data_by_id(self, rid: Any, column: int) -> Any:
         """Get the data as stored in the sqlite table for the given row id and column."""
-        if self._model.is_debug and column == self.get_nb_columns() - 1:
-            column_name = "ROWID"
-            column_type = "INTEGER"
-            default_value = None
-        else:
-            column_name = self._column_names[column]
-            column_type = self._db_table_infos[column_name]["type"]
-            default_value = self._db_table_infos[column_name]["dflt_value"]
+        column_name, column_type, default_value = self._get_edit_column_infos(column)
         statement = f"""
                 SELECT {column_name}
                 FROM {self._db_table_name}
@@ -324,22 +711,57 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
         with self._store.get_connection() as db_conn:
             result = db_conn.execute(statement, {"rid": rid}).fetchone()
         if result is not None:
-            value = result[0]
-            if column_type == "INTEGER":
-                value = self.to_int_value(value, default=self.to_int_value(default_value))
-                if value is None:
-                    return ""
-            elif column_type == "REAL":
-                value = self.to_float_value(value, default=self.to_float_value(default_value))
-                if value is None:
-                    return ""
-            elif column_type != "TEXT":
-                # msg = f"Unknown column type {column_type}"
-                # raise ValueError(msg)
-                value = str(value)
-            return value
+            return self._to_edit_value(result[0], column_type, default_value)
         return None
 
+    def get_sort_keys(self, column: int) -> List[SortKey]:
+        """Get the keys to sort the rows by the given column with only one query."""
+        # the keys must be given in the order of the cached rows
+        self._check_cache()
+        column_name, column_type, default_value = self._get_edit_column_infos(column)
+        order_column = "ROWID"
+        if self._order_column is not None:
+            order_column = self._order_column
+        with self._store.get_connection() as db_conn:
+            result = db_conn.execute(
+                f"""--sql
+                SELECT {column_name}
+                FROM {self._db_table_name}
+                ORDER BY {order_column}
+                """
+            ).fetchall()
+        return [
+            get_sort_key(self._to_edit_value(row[0], column_type, default_value))
+            for row in result
+        ]
+
+    def _get_edit_column_infos(self, column: int) -> Tuple[str, str, Any]:
+        """Get the name, the type and the default value of the sql column."""
+        if self._model.is_debug and column == self.get_nb_columns() - 1:
+            return "ROWID", "INTEGER", None
+        column_name = self._column_names[column]
+        return (
+            column_name,
+            self._db_table_infos[column_name]["type"],
+            self._db_table_infos[column_name]["dflt_value"],
+        )
+
+    def _to_edit_value(self, value: Any, column_type: str, default_value: Any) -> Any:
+        """Convert the value stored in the sqlite table to the edited value."""
+        if column_type == "INTEGER":
+            value = self.to_int_value(value, default=self.to_int_value(default_value))
+            if value is None:
+                return ""
+        elif column_type == "REAL":
+            value = self.to_float_value(value, default=self.to_float_value(default_value))
+            if value is None:
+                return ""
+        elif column_type != "TEXT":
+            # msg = f"Unknown column type {column_type}"
+            # raise ValueError(msg)
+            value = str(value)
+        return value
+
     def move(self, from_row: int, to_row: int) -> bool:
         """Move the id from the given from_row to the given to_row.
 
@@ -351,6 +773,7 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
         False.
         """
         if self._order_column is not None:
+            self._check_cache()
             with self._store.get_connection() as db_conn:
                 # put the item at the beginning of the table
                 db_conn.execute(
@@ -389,7 +812,13 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
                     {"row": to_row},
                 )
                 db_conn.commit()
-            self.update_cache()
+            self._row_ids.move(from_row, to_row)
+            if self._page_cache is not None:
+                self._page_cache.invalidate(min(from_row, to_row), max(from_row, to_row) + 1)
+            for cached_column in self._cached_data:
+                cached_column.insert(to_row, cached_column.pop(from_row))
+            self.notify_row_moved(from_row, to_row)
+            self._notify_change()
             return True
         return super().move(from_row, to_row)
 
@@ -402,32 +831,10 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
 
         """
         column_name = self._column_names[column]
-        column_type = self._db_table_infos[column_name]["type"]
-        default_value = self._db_table_infos[column_name]["dflt_value"]
-        if column_type == "INTEGER":
-            if (
-                self.to_int_value(
-                    value,
-                    default=self.to_int_value(default_value),
-                )
-                is None
-            ):
-                return False
-        elif column_type == "REAL":
-            if (
-                self.to_float_value(
-                    value,
-                    default=self.to_float_value(default_value),
-                )
-                is None
-            ):
-                return False
-        elif column_type == "TEXT":
-            value = str(value)
-        else:
-            # msg = f"Unknown column type {column_type}"
-            # raise ValueError(msg)
-            value = str(value)
+        casted_value = self._cast_value(value, column_name)
+        if casted_value is None:
+            return False
+        self._check_cache()
         if self._order_column is not None:
             order_column = self._order_column
         else:
@@ -441,15 +848,80 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
             db_conn.execute(
                 statement,
                 {
-                    "value": value,
+                    "value": casted_value,
                     "order_column": order_column,
                     "row_id": rid,
                 },
             )
             db_conn.commit()
-        self._cached_data[column][self.get_row_from_id(rid)] = value
+        row = self.get_row_from_id(rid)
+        if self._page_cache is not None:
+            self._page_cache.invalidate(row, row + 1)
+        else:
+            for cached_column, display_value in zip(self._cached_data, self._select_row(rid)):
+                cached_column[row] = display_value
+        self.notify_data_changed(row)
+        self._notify_change()
         return True
 
+    def set_block(
+        self, row_start: int, columns: Sequence[int], values: Sequence[Sequence[Any]]
+    ) -> List[Tuple[int, int]]:
+        """Set the data of the rows from row_start for the given columns in one transaction.
+
+        The values are casted like in set_data_by_id, the values which can't be casted are
+        not set and returned with the invalid items.
+        """
+        self._check_cache()
+        invalid_items: List[Tuple[int, int]] = []
+        row_end = row_start + max((len(column_values) for column_values in values), default=0)
+        # the ROWIDs are resolved once for all the columns
+        row_ids = self._row_ids.get_ids(row_start, row_end)
+        if row_start < 0 or len(row_ids) != row_end - row_start:
+            raise IndexError("index out of range")
+        with self._store.get_connection() as db_conn:
+            for column, column_values in zip(columns, values):
+                column_name = self._column_names[column]
+                casted_values: List[Dict[str, Any]] = []
+                for row, (value, row_id) in enumerate(
+                    zip(column_values, row_ids), start=row_start
+                ):
+                    casted_value = self._cast_value(value, column_name)
+                    if casted_value is None:
+                        invalid_items.append((row, column))
+                    else:
+                        casted_values.append({"value": casted_value, "row_id": row_id})
+                db_conn.executemany(
+                    f"""
+                    UPDATE {self._db_table_name}
+                    SET {column_name} = :value
+                    WHERE ROWID=:row_id
+                    """,
+                    casted_values,
+                )
+            db_conn.commit()
+        if self._page_cache is not None:
+            self._page_cache.invalidate(row_start, row_end)
+        else:
+            for cached_column, block_column in zip(
+                self._cached_data, self._select_block(row_start, row_end)
+            ):
+                cached_column[row_start:row_end] = block_column
+        for row in range(row_start, row_end):
+            self.notify_data_changed(row)
+        self._notify_change()
+        return invalid_items
+
+    def _cast_value(self, value: Any, column_name: str) -> Any:
+        """Cast the value according to the type of the sqlite column or None if it fails."""
+        column_type = self._db_table_infos[column_name]["type"]
+        default_value = self._db_table_infos[column_name]["dflt_value"]
+        if column_type == "INTEGER":
+            return self.to_int_value(value, default=self.to_int_value(default_value))
+        elif column_type == "REAL":
+            return self.to_float_value(value, default=self.to_float_value(default_value))
+        return str(value)
+
     def is_editable(self, row: int, column: int) -> bool:
         return self._is_editable(column)
 
@@ -479,6 +951,17 @@ class SimpleTableItems(AbstractTableItems[AnyModel]):
                 return FloatDelegateProps()
         return super().get_delegate_props(column, row=row)
 
+    def _get_sql_type(self) -> Optional[str]:
+        """Get the type of the sql object of the table: 'table' or 'view'."""
+        with self._store.get_connection() as db_conn:
+            result = db_conn.execute(
+                """--sql
+                SELECT type FROM sqlite_master WHERE name=:name
+                """,
+                {"name": self._db_table_name},
+            ).fetchone()
+        return str(result[0]) if result is not None else None
+
     def _get_column_infos(self) -> Dict[str, _TableInfo]:
         """Extract column informations from the sqlite table needed to implement the items."""
         with self._store.get_connection() as db_conn:
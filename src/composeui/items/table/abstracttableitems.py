@@ -1,14 +1,19 @@
 from composeui.commontypes import AnyItemsView, AnyModel
 from composeui.items.core.abstractitems import AbstractItems
 from composeui.items.core.itemsconverter import ItemsConverter
-from composeui.items.core.itemsutils import BackgroundType, DelegateProps
+from composeui.items.core.itemsutils import (
+    BackgroundType,
+    DelegateProps,
+    SortKey,
+    get_sort_key,
+)
 from composeui.items.core.paginationnavigator import PaginationNavigator
 
 from typing_extensions import OrderedDict
 
 import typing
 from abc import abstractmethod
-from typing import Any, Iterator, List, Optional, cast
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, cast
 
 if typing.TYPE_CHECKING:
     from composeui.items.core.tabletotreeitems import TableToTreeItems
@@ -102,6 +107,36 @@ class AbstractTableItems(AbstractItems[AnyItemsView, AnyModel]):
         """
         return ""
 
+    def get_data_block(
+        self, row_start: int, row_end: int, columns: Sequence[int]
+    ) -> List[List[str]]:
+        """Get the displayed data of the rows from row_start to row_end (excluded).
+
+        The data are returned by column like get_cached_data, in the order of the given
+        columns. The rows after the last row of the table are ignored.
+
+        The method is implemented using the method get_data.
+        When performance is crucial you should reimplement the method to get the block of
+        data at once. For example, with one SELECT instead of one SELECT by item.
+        """
+        rows = range(max(row_start, 0), min(row_end, self.get_nb_rows()))
+        return [[self.get_data(row, column) for row in rows] for column in columns]
+
+    def get_edit_data_block(
+        self, row_start: int, row_end: int, columns: Sequence[int]
+    ) -> List[List[Any]]:
+        """Get the edited data of the rows from row_start to row_end (excluded).
+
+        The data are returned by column like get_data_block, in the order of the given
+        columns. The rows after the last row of the table are ignored.
+
+        The method is implemented using the method get_edit_data.
+        When performance is crucial you should reimplement the method to get the block of
+        data at once.
+        """
+        rows = range(max(row_start, 0), min(row_end, self.get_nb_rows()))
+        return [[self.get_edit_data(row, column) for row in rows] for column in columns]
+
     def get_all_datas(self) -> List[List[str]]:
         """Get all the displayed data of the table.
 
@@ -141,6 +176,18 @@ class AbstractTableItems(AbstractItems[AnyItemsView, AnyModel]):
         """
         return row
 
+    def insert_rows(self, row: int, count: int) -> Optional[int]:
+        """Insert count rows at the given row and return the row to be selected afterwards.
+
+        The rows are inserted one by one using the method insert.
+        When performance is crucial you should reimplement the method to insert all the rows
+        at once. For example, with one transaction instead of one by row.
+        """
+        selected_row: Optional[int] = row
+        for inserted_row in range(row, row + count):
+            selected_row = self.insert(inserted_row)
+        return selected_row
+
     def remove(self, row: int) -> Optional[int]:
         """Remove the given row of the table.
 
@@ -199,6 +246,54 @@ class AbstractTableItems(AbstractItems[AnyItemsView, AnyModel]):
         """
         return self.set_data_by_id(self.get_id_from_row(row), column, value)
 
+    def set_block(
+        self, row_start: int, columns: Sequence[int], values: Sequence[Sequence[Any]]
+    ) -> List[Tuple[int, int]]:
+        """Set the data of the rows from row_start for the given columns.
+
+        The values are given by column like get_data_block, in the order of the given columns.
+        Returns the rows and columns of the values which are not valid and have not been set.
+
+        The values are set one by one using the method set_data.
+        When performance is crucial you should reimplement the method to set the block of
+        data at once.
+        """
+        invalid_items: List[Tuple[int, int]] = []
+        for column, column_values in zip(columns, values):
+            for row, value in enumerate(column_values, start=row_start):
+                if not self.set_data(row, column, value):
+                    invalid_items.append((row, column))
+        return invalid_items
+
+    def append_detail_block(
+        self,
+        master_items: "AbstractTableItems[Any]",
+        master_row: int,
+        columns: Sequence[int],
+        values: Sequence[Sequence[Any]],
+    ) -> List[Tuple[int, int]]:
+        """Append rows to the detail rows of a row of the given master table.
+
+        The values are given by column like set_block. Returns the indices of the rows in the
+        given values and the columns of the values which are not valid and have not been set.
+
+        The master row is selected with the selection of its view suspended then the rows are
+        inserted with insert_rows and set_block.
+        When performance is crucial you should reimplement the method to insert the rows of
+        the master row at once, without changing the selection of the master table.
+        """
+        master_items.set_view_selection_suspend_status(True)
+        try:
+            master_items.set_selected_positions([(master_row,)])
+            row_start = self.get_nb_rows()
+            self.insert_rows(row_start, len(values[0]) if len(values) > 0 else 0)
+            return [
+                (row - row_start, column)
+                for row, column in self.set_block(row_start, columns, values)
+            ]
+        finally:
+            master_items.set_view_selection_suspend_status(False)
+
     def set_data_by_id(self, rid: Any, column: int, value: str) -> bool:
         """Set the data at the given row id and column.
 
@@ -217,7 +312,10 @@ class AbstractTableItems(AbstractItems[AnyItemsView, AnyModel]):
         to avoid it.
         """
         with self._model.record_history():
-            return self.set_data(row, column, value)
+            is_ok = self.set_data(row, column, value)
+            if is_ok:
+                self._model.notify_change()
+            return is_ok
 
     def get_edit_data(self, row: int, column: int) -> Any:
         """Get the data displayed during the edition of an item.
@@ -233,6 +331,17 @@ class AbstractTableItems(AbstractItems[AnyItemsView, AnyModel]):
         """
         return self.get_data_by_id(rid, column)
 
+    def get_sort_keys(self, column: int) -> List[SortKey]:
+        """Get the keys to sort the rows by the given column.
+
+        The keys are computed from the edited data, the numbers are sorted by value before
+        the texts. When performance is crucial you should reimplement the method to get the
+        data of the column at once.
+        """
+        return [
+            get_sort_key(self.get_edit_data(row, column)) for row in range(self.get_nb_rows())
+        ]
+
     def is_checked(self, row: int, column: int) -> Optional[bool]:
         """Check if the item is checked or return None if there is no checkbox."""
         return self.is_checked_by_id(self.get_id_from_row(row), column)
@@ -274,7 +383,10 @@ class AbstractTableItems(AbstractItems[AnyItemsView, AnyModel]):
         to avoid it.
         """
         with self._model.record_history():
-            return self.set_checked_by_id(rid, column, value)
+            is_ok = self.set_checked_by_id(rid, column, value)
+            if is_ok:
+                self._model.notify_change()
+            return is_ok
 
     def is_editable(self, row: int, column: int) -> bool:
         """Check if the item is editable."""
@@ -428,6 +540,37 @@ class AbstractTableItems(AbstractItems[AnyItemsView, AnyModel]):
             )
         )
 
+    def get_filter_mask(self) -> List[bool]:
+        """Get for each row if it is filtered or not, like is_filtered.
+
+        This method should not be reimplemented or do it with care.
+
+        The filter is evaluated column by column only for the rows of the current page, using
+        the cached data if any or get_data_block otherwise. It is much faster than calling
+        is_filtered for each row of a large table.
+        """
+        nb_rows = self.get_nb_rows()
+        if self._view.has_pagination:
+            min_row = self.page_navigator.get_current_min_row()
+            max_row = min(self.page_navigator.get_current_max_row() + 1, nb_rows)
+        else:
+            min_row, max_row = 0, nb_rows
+        mask = [True] * nb_rows
+        if max_row <= min_row:
+            return mask
+        if len(self.filter_column_indices) == 0 or not self.filter_manager.has_pattern:
+            mask[min_row:max_row] = [False] * (max_row - min_row)
+            return mask
+        cached_data = self.get_cached_data()
+        if cached_data is not None:
+            columns = [
+                cached_data[column][min_row:max_row] for column in self.filter_column_indices
+            ]
+        else:
+            columns = self.get_data_block(min_row, max_row, self.filter_column_indices)
+        mask[min_row:max_row] = self._get_unmatched_mask(columns)
+        return mask
+
     def is_filtered_by_id(self, rid: Any) -> bool:
         """Check if the row id is filtered or not.
 
@@ -1,12 +1,14 @@
 from composeui.commontypes import AnyTableItems
 from composeui.core.tasks.abstracttask import AbstractTask
+from composeui.items.core.tablefilewriter import TableFileWriter
 from composeui.items.core.views.itemsview import FormatExtension
 
+import contextlib
 from pathlib import Path
 from typing import Generic, Optional
 
 try:
-    import pandas as pd
+    import pandas as pd  # noqa: F401
 except (ImportError, ModuleNotFoundError):
     _HAS_PANDAS = False
 else:
@@ -14,6 +16,15 @@ else:
 
 
 class ExportFileTableTask(AbstractTask, Generic[AnyTableItems]):
+    r"""Export a table in a file by chunks of rows.
+
+    Each chunk is taken from the items and written before taking the next one, the progress
+    is reported after each chunk and the export stops between two chunks if the task is
+    canceled. The file of a canceled export is removed.
+    """
+
+    reports_progress = True
+
     def __init__(
         self,
         items: AnyTableItems,
@@ -24,45 +35,45 @@ class ExportFileTableTask(AbstractTask, Generic[AnyTableItems]):
         self._items: AnyTableItems = items
         self._filepath = filepath
         self._extension = extension
+        # number of rows taken and written at once
+        self.chunk_size = 10000
 
     def _run(self) -> Optional[bool]:
         if not _HAS_PANDAS:
             raise ValueError("Can't export the table without pandas installed.")
-        table_df = self._items.converter().to_dataframe()
+        column_indices = self._items.get_exported_column_indices()
+        column_names = self._items.get_exported_column_names()
+        if len(column_indices) != len(column_names):
+            msg = (
+                "The length of the exported column indices and names are incompatible in "
+                f"'{type(self._items).__name__}'"
+            )
+            raise ValueError(msg)
+        sheet_name = self._items.get_title()
+        if sheet_name == "":
+            sheet_name = "Table"
+        writer = TableFileWriter(self._filepath, self._extension, column_names, sheet_name)
+        nb_rows = self._items.get_nb_rows()
         try:
-            if self._extension == FormatExtension.CSV:
-                table_df.to_csv(self._filepath, sep=";", index=False)
-            elif self._extension == FormatExtension.EXCEL:
-                sheet_name = self._items.get_title()
-                if sheet_name == "":
-                    sheet_name = "Table"
-                with pd.ExcelWriter(self._filepath, engine="openpyxl") as writer:
-                    table_df.to_excel(
-                        writer, engine="openpyxl", sheet_name=sheet_name, index=False
+            with writer.open():
+                for row_start in range(0, nb_rows, self.chunk_size):
+                    writer.write_chunk(
+                        self._items.get_edit_data_block(
+                            row_start, row_start + self.chunk_size, column_indices
+                        )
                     )
-            elif self._extension == FormatExtension.JSON:
-                try:
-                    table_df.to_json(self._filepath, orient="records", index=False)
-                except ValueError:
-                    self.error_message = (
-                        f"The current version of pandas '{pd.__version__}' "
-                        "is too old to export in json"
-                    )
-                    return False
-            elif self._extension == FormatExtension.MARKDOWN:
-                try:
-                    table_df.to_markdown(self._filepath, index=False)
-                except AttributeError:  # old versions of pandas can't manage filepath directly
-                    with open(self._filepath, "w") as f:
-                        table_df.to_markdown(f, index=False)
-            elif self._extension == FormatExtension.HTML:
-                table_df.to_html(self._filepath, index=False)
-            else:
-                self.error_message = (
-                    f"The extension '{self._filepath.suffix}' is not supported yet"
-                )
-                return False
+                    self.set_progress(min(row_start + self.chunk_size, nb_rows) / nb_rows)
+                    if self.is_canceled:
+                        break
         except PermissionError:
             self.error_message = "Can't write into the file if it's already open elsewhere."
             return False
+        except ValueError as e:
+            self.error_message = str(e)
+            return False
+        if self.is_canceled:
+            # the file with only a part of the table is removed
+            with contextlib.suppress(FileNotFoundError):
+                self._filepath.unlink()
+            return False
         return True
@@ -1,16 +1,11 @@
 from composeui.commontypes import AnyTableItems
 from composeui.core.tasks.abstracttask import AbstractTask
+from composeui.items.core.tablefilereader import TableFileReader
 from composeui.items.core.views.itemsview import FormatExtension
 
-import contextlib
-
-with contextlib.suppress(ImportError, ModuleNotFoundError):
-    from openpyxl.utils.exceptions import InvalidFileException
-with contextlib.suppress(ImportError, ModuleNotFoundError):
-    from xlrd.biffh import XLRDError
-
+import json
 from pathlib import Path
-from typing import Generic, Optional
+from typing import Generic, List, Optional
 
 try:
     import pandas as pd
@@ -21,6 +16,16 @@ else:
 
 
 class ImportFileTableTask(AbstractTask, Generic[AnyTableItems]):
+    r"""Import a file in a table by chunks of rows.
+
+    Each chunk is inserted in the items before reading the next one, the progress is reported
+    after each chunk and the import stops between two chunks if the task is canceled.
+    If the import fails or is canceled after the items have been modified,
+    is_partially_imported is set to True so that the caller undoes the import with the history.
+    """
+
+    reports_progress = True
+
     def __init__(
         self,
         items: AnyTableItems,
@@ -33,69 +38,74 @@ class ImportFileTableTask(AbstractTask, Generic[AnyTableItems]):
         self._filepath = filepath
         self._is_cleaning = is_cleaning
         self._extension = extension
+        # number of rows read and inserted at once
+        self.chunk_size = 10000
+        # if the items have been modified before a failure or a cancellation
+        self.is_partially_imported = False
 
     def _run(self) -> Optional[bool]:
         if not _HAS_PANDAS:
             raise ValueError("Can't import the table without pandas installed.")
+        reader = TableFileReader(self._filepath, self._extension, self.chunk_size)
+        column_names = self._items.get_exported_column_names()
+        self.is_partially_imported = False
+        is_modified = False
+        is_finished = False
+        first_row = start_row = 0
         try:
-            if self._extension == FormatExtension.CSV:
-                table_df = pd.read_csv(self._filepath, sep=";")
-            elif self._extension == FormatExtension.EXCEL:
-                try:
-                    table_df = pd.read_excel(self._filepath, engine="openpyxl")
-                except InvalidFileException:
-                    try:
-                        table_df = pd.read_excel(self._filepath, engine="xlrd")
-                    except XLRDError:
-                        # old versions of pandas don't manage the bad extension
-                        # with openpyxl so it fallback to xlrd which don't know how
-                        # to read .xlsx files
-                        self.error_message = "Change the extension of the file to .xlsx"
+            for chunk_index, (table_df, progress) in enumerate(reader.iter_chunks()):
+                table_df_columns = table_df.columns
+                if chunk_index == 0:
+                    # TODO : Add option to choose what to do if the shape is not identical
+                    if not self._check_columns(column_names, list(table_df_columns)):
                         return False
-            elif self._extension == FormatExtension.JSON:
-                table_df = pd.read_json(self._filepath)
-            else:
-                self.error_message = (
-                    f"The extension '{self._filepath.suffix}' is not supported yet"
+                    is_modified = True
+                    if self._is_cleaning:
+                        self._items.remove_all()
+                    first_row = start_row = self._items.get_nb_rows()
+                # insert rows
+                self._items.insert_rows(start_row, table_df.shape[0])
+                # set values
+                self._items.set_block(
+                    start_row,
+                    [column_names.index(column_name) for column_name in table_df_columns],
+                    [table_df[column_name].tolist() for column_name in table_df_columns],
                 )
-                return False
-        except (pd.errors.ParserError, pd.errors.EmptyDataError):
+                start_row += table_df.shape[0]
+                self.set_progress(progress)
+                if self.is_canceled:
+                    return False
+            is_finished = True
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, json.JSONDecodeError):
             self.error_message = "Unable to read the file due to an incorrect format"
+            if is_modified:
+                self.error_message += (
+                    f" after importing {start_row - first_row} row(s), the import is undone"
+                )
             return False
-        else:
-            # TODO : Add option to choose what to do if the shape is not identical
-            column_names = self._items.get_exported_column_names()
-            table_df_columns = table_df.columns
-            unknown_columns = list(set(table_df_columns) - set(column_names))
-            empty_columns = list(set(column_names) - set(table_df_columns))
-            if len(unknown_columns) == 0:
-                if self._is_cleaning:
-                    self._items.remove_all()
-                start_row = self._items.get_nb_rows()
-                # insert rows
-                for row in range(table_df.shape[0]):
-                    self._items.insert(start_row + row)
-                # set values
-                for column_name in table_df_columns:
-                    column = column_names.index(column_name)
-                    for row in range(table_df.shape[0]):
-                        self._items.set_data(
-                            start_row + row, column, table_df[column_name].iloc[row]
-                        )
-                if len(empty_columns) > 0:
-                    msg = "The following columns are missing:\n"
-                    for i in range(min(10, len(empty_columns))):
-                        msg += f"- {empty_columns[i]}\n"
-                    if len(empty_columns) > 10:
-                        msg += "- ...\n"
-                    msg += "Default values are used for those columns."
-                    self.warning_message = msg
-            else:
-                msg = "Can't import a file with the following unknown columns:\n"
-                for i in range(min(10, len(unknown_columns))):
-                    msg += f"- {unknown_columns[i]}\n"
-                if len(unknown_columns) > 10:
-                    msg += "- ..."
-                self.error_message = msg
-                return False
+        finally:
+            # the rows imported before a failure or a cancellation are undone by the caller
+            self.is_partially_imported = is_modified and not is_finished
+        return True
+
+    def _check_columns(self, column_names: List[str], table_df_columns: List[str]) -> bool:
+        r"""Check the columns of the file and warn about the missing ones."""
+        unknown_columns = list(set(table_df_columns) - set(column_names))
+        empty_columns = list(set(column_names) - set(table_df_columns))
+        if len(unknown_columns) > 0:
+            msg = "Can't import a file with the following unknown columns:\n"
+            for i in range(min(10, len(unknown_columns))):
+                msg += f"- {unknown_columns[i]}\n"
+            if len(unknown_columns) > 10:
+                msg += "- ..."
+            self.error_message = msg
+            return False
+        if len(empty_columns) > 0:
+            msg = "The following columns are missing:\n"
+            for i in range(min(10, len(empty_columns))):
+                msg += f"- {empty_columns[i]}\n"
+            if len(empty_columns) > 10:
+                msg += "- ...\n"
+            msg += "Default values are used for those columns."
+            self.warning_message = msg
         return True
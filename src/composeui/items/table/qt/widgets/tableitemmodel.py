@@ -1,6 +1,12 @@
 r"""Item model of a table."""
 
-from composeui.items.core.itemsutils import BackgroundType
+from composeui.items.core.itemsutils import (
+    BackgroundType,
+    RowChange,
+    RowChangeType,
+    SortKey,
+    get_sort_key,
+)
 from composeui.items.table.abstracttableitems import AbstractTableItems
 
 from qtpy.QtCore import Signal  # type: ignore[attr-defined]
@@ -12,6 +18,7 @@ from qtpy.QtCore import (
     QMimeData,
     QModelIndex,
     QObject,
+    QPersistentModelIndex,
     QSortFilterProxyModel,
     Qt,
     QTimer,
@@ -21,7 +28,7 @@ from qtpy.QtGui import QBrush, QColor
 import contextlib
 import pickle
 from functools import partial
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Generator, Iterable, List, Optional, Set, Tuple, Union
 
 
 class TableItemModel(QSortFilterProxyModel):
@@ -35,32 +42,94 @@ class TableItemModel(QSortFilterProxyModel):
         self.setDynamicSortFilter(False)
         self.setSortRole(Qt.InitialSortOrderRole)
         self.modelAboutToBeReset.connect(self.update_cache)
+        # filter status of each source row, computed at once when the filter is evaluated
+        self._filter_mask: Optional[List[bool]] = None
+        # keys to sort the source rows by each sorted column, computed at once
+        self._sort_keys: Dict[int, List[SortKey]] = {}
+        self.source_model.dataChanged.connect(self._clear_sort_keys)
 
     @Slot()
     def update_cache(self) -> None:
         self.source_model.update_cache()
+        self._clear_filter_and_sort_keys()
+
+    @Slot()
+    def _clear_sort_keys(self) -> None:
+        self._sort_keys.clear()
+
+    def _clear_filter_and_sort_keys(self) -> None:
+        self._filter_mask = None
+        self._sort_keys.clear()
+
+    def apply_row_changes(self, row_changes: List[RowChange]) -> bool:
+        r"""Notify the views of the changes of the rows without resetting the model.
+
+        The filter is evaluated again only if some rows can be filtered.
+        Returns False if the changes don't match the items, the model needs to be reset.
+        """
+        self._clear_filter_and_sort_keys()
+        if not self.source_model.apply_row_changes(row_changes):
+            return False
+        if (
+            self.items.filter_manager.has_pattern
+            or self.items.page_navigator.current_nb_pages > 1
+            or self.rowCount() != self.source_model.rowCount()
+        ):
+            self._filter_mask = None
+            self.invalidateFilter()
+        return True
+
+    def dropMimeData(  # noqa: N802
+        self,
+        mime_data: QMimeData,
+        action: Qt.DropAction,
+        row: int,
+        column: int,
+        parent: Union[QModelIndex, QPersistentModelIndex],
+    ) -> bool:
+        """Drop the dragged rows and notify the views of the moved rows."""
+        is_ok = bool(super().dropMimeData(mime_data, action, row, column, parent))
+        row_changes = self.items.take_row_changes()
+        if not (row_changes and self.apply_row_changes(row_changes)):
+            self.beginResetModel()
+            self.endResetModel()
+        return is_ok
 
     def filterAcceptsRow(  # noqa: N802
         self, source_row: int, source_parent: QModelIndex
     ) -> bool:
-        r"""Check if the row is not filtered."""
+        r"""Check if the row is not filtered.
+
+        The filter of all the rows is computed at the first call after a reset.
+        """
+        if self._filter_mask is None:
+            self._filter_mask = self.items.get_filter_mask()
+        if source_row < len(self._filter_mask):
+            return not self._filter_mask[source_row]
         return not self.items.is_filtered(source_row)
 
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        r"""Sort the rows by the given column, the source is not modified meanwhile."""
+        with self.source_model.fixed_size():
+            super().sort(column, order)
+
     def lessThan(  # noqa: N802
         self, source_left: QModelIndex, source_right: QModelIndex
     ) -> bool:
-        r"""Check if the left index is less than the right index."""
-        try:
-            value_left = float(
-                self.items.get_edit_data(source_left.row(), source_left.column())
-            )
-            value_right = float(
-                self.items.get_edit_data(source_right.row(), source_right.column())
-            )
-        except ValueError:
-            return bool(super().lessThan(source_left, source_right))
-        else:
-            return value_left < value_right
+        r"""Check if the left index is less than the right index.
+
+        The keys of all the rows of the column are computed at the first comparison.
+        """
+        column = source_left.column()
+        sort_keys = self._sort_keys.get(column)
+        if sort_keys is None:
+            sort_keys = self._sort_keys[column] = self.items.get_sort_keys(column)
+        left_row, right_row = source_left.row(), source_right.row()
+        if left_row < len(sort_keys) and right_row < len(sort_keys):
+            return sort_keys[left_row] < sort_keys[right_row]
+        return get_sort_key(self.items.get_edit_data(left_row, column)) < get_sort_key(
+            self.items.get_edit_data(right_row, source_right.column())
+        )
 
     def generate_item_selection(
         self, selected_items: Dict[Tuple[int, ...], List[int]]
@@ -79,24 +148,160 @@ class TableItemModel(QSortFilterProxyModel):
 
 
 class _TableItemModel(QAbstractTableModel):
-    r"""Item model for a table."""
+    r"""Item model for a table.
+
+    If the items don't have a cache, the displayed data are fetched by block of rows around
+    the rows painted by the view using AbstractTableItems.get_data_block.
+    """
 
     item_toggled = Signal()
 
+    # number of rows fetched before the first row requested by the view
+    prefetch_margin = 50
+    # number of rows fetched at once
+    prefetch_size = 200
+
     def __init__(
         self, items: AbstractTableItems[Any], parent: Optional[QObject] = None
     ) -> None:
         super().__init__(parent)
         self.items = items
         self.highlight_indices: Set[Tuple[int, int, bool]] = set()
+        self._block_start = 0
+        self._block_data: List[List[str]] = []
+        # number of rows and columns known by the views
+        self._known_nb_rows = self._get_nb_rows()
+        self._known_nb_columns = self.items.get_nb_columns()
+        # number of rows during the notification of the changes of rows or during a sort
+        self._nb_rows: Optional[int] = None
+        # number of columns during a sort
+        self._nb_columns: Optional[int] = None
 
     def update_cache(self) -> None:
         self.items.update_cache()
+        self.clear_block()
+        self._known_nb_rows = self._get_nb_rows()
+        self._known_nb_columns = self.items.get_nb_columns()
+
+    def apply_row_changes(self, row_changes: List[RowChange]) -> bool:
+        r"""Notify the views of the inserted, removed, moved and modified rows.
+
+        The items have already applied the changes to their cache, so the changes are checked
+        against the new number of rows before being notified one by one. Then only the
+        modified rows are marked as changed, at their position after all the changes.
+        Returns False if the changes don't match the items, the model needs to be reset.
+        """
+        previous_nb_rows = self._known_nb_rows
+        nb_rows = previous_nb_rows
+        modified_rows: Set[int] = set()
+        for row_change in row_changes:
+            if row_change.change_type == RowChangeType.INSERT:
+                if not 0 <= row_change.row <= nb_rows:
+                    return False
+                nb_rows += 1
+            elif row_change.change_type == RowChangeType.REMOVE:
+                if not 0 <= row_change.row < nb_rows:
+                    return False
+                nb_rows -= 1
+            elif not 0 <= row_change.row < nb_rows or (
+                row_change.change_type == RowChangeType.MOVE
+                and not 0 <= row_change.to_row < nb_rows
+            ):
+                return False
+            modified_rows = {
+                updated_row
+                for updated_row in (_update_row(row, row_change) for row in modified_rows)
+                if updated_row is not None
+            }
+            if row_change.change_type == RowChangeType.DATA:
+                modified_rows.add(row_change.row)
+        if (
+            nb_rows != self._get_nb_rows()
+            or self.items.get_nb_columns() != self._known_nb_columns
+        ):
+            return False
+        self.clear_block()
+        self._nb_rows = previous_nb_rows
+        try:
+            for row_change in row_changes:
+                self._notify_row_change(row_change)
+        finally:
+            self._nb_rows = None
+        self._known_nb_rows = nb_rows
+        last_column = self._known_nb_columns - 1
+        for first_row, last_row in _iter_row_ranges(modified_rows):
+            self.dataChanged.emit(self.index(first_row, 0), self.index(last_row, last_column))
+        return True
+
+    def _notify_row_change(self, row_change: RowChange) -> None:
+        r"""Notify the views of a change of row, the number of rows is updated accordingly."""
+        assert self._nb_rows is not None
+        row = row_change.row
+        if row_change.change_type == RowChangeType.INSERT:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._nb_rows += 1
+            self.endInsertRows()
+        elif row_change.change_type == RowChangeType.REMOVE:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._nb_rows -= 1
+            self.endRemoveRows()
+        elif row_change.change_type == RowChangeType.MOVE and row != row_change.to_row:
+            # the destination of beginMoveRows is the row before which the row is moved
+            destination = (
+                row_change.to_row + 1 if row_change.to_row > row else row_change.to_row
+            )
+            self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination)
+            self.endMoveRows()
+
+    def clear_block(self) -> None:
+        r"""Clear the block of prefetched data."""
+        self._block_start = 0
+        self._block_data = []
+
+    def _get_block_data(self, row: int, column: int) -> str:
+        r"""Get the displayed data from the prefetched block and fetch it if needed."""
+        if not self._is_in_block(row, column):
+            self._block_start = max(row - self.prefetch_margin, 0)
+            self._block_data = self.items.get_data_block(
+                self._block_start,
+                self._block_start + self.prefetch_size,
+                range(self.items.get_nb_columns()),
+            )
+            if not self._is_in_block(row, column):
+                return self.items.get_data(row, column)
+        return self._block_data[column][row - self._block_start]
+
+    @contextlib.contextmanager
+    def fixed_size(self) -> Generator[None, None, None]:
+        r"""Keep the current number of rows and columns until the end of the context.
+
+        The items are not modified during a sort, so the sizes are not requested again for
+        each index created by the comparisons.
+        """
+        self._nb_rows, self._nb_columns = self.rowCount(), self.columnCount()
+        try:
+            yield
+        finally:
+            self._nb_rows = self._nb_columns = None
+
+    def _is_in_block(self, row: int, column: int) -> bool:
+        r"""Check if the given item is in the block of prefetched data."""
+        return column < len(self._block_data) and (
+            self._block_start <= row < self._block_start + len(self._block_data[column])
+        )
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802, B008
         r"""Get the number of rows under the given parent."""
+        if parent.isValid():
+            return 0
+        if self._nb_rows is not None:
+            return self._nb_rows
+        return self._get_nb_rows()
+
+    def _get_nb_rows(self) -> int:
+        r"""Get the number of rows of the items."""
         cached_data = self.items.get_cached_data()
-        if parent.isValid() or (cached_data is not None and len(cached_data) == 0):
+        if cached_data is not None and len(cached_data) == 0:
             return 0
         return len(cached_data[0]) if cached_data is not None else self.items.get_nb_rows()
 
@@ -104,6 +309,8 @@ class _TableItemModel(QAbstractTableModel):
         r"""Get the number of columns for the children of the given parent."""
         if parent.isValid():
             return 0
+        if self._nb_columns is not None:
+            return self._nb_columns
         cached_data = self.items.get_cached_data()
         return len(cached_data) if cached_data is not None else self.items.get_nb_columns()
 
@@ -117,7 +324,7 @@ class _TableItemModel(QAbstractTableModel):
                 if cached_data is not None:
                     return cached_data[column][row]
                 else:
-                    return self.items.get_data(row, column)
+                    return self._get_block_data(row, column)
             elif role == Qt.EditRole:
                 return self.items.get_edit_data(row, column)
             elif role == Qt.BackgroundRole:
@@ -151,6 +358,7 @@ class _TableItemModel(QAbstractTableModel):
                 value_str = str(value)
                 is_ok = self.items.set_data_with_history(row, column, value_str)
                 if is_ok:
+                    self.clear_block()
                     self.dataChanged.emit(index, index, [Qt.EditRole])
                 return is_ok
             elif role == Qt.CheckStateRole:
@@ -205,7 +413,7 @@ class _TableItemModel(QAbstractTableModel):
         action: Qt.DropAction,
         row: int,
         column: int,
-        parent: QModelIndex,
+        parent: Union[QModelIndex, QPersistentModelIndex],
     ) -> bool:
         """Drop the items currently dragged into a new position."""
         if action == Qt.MoveAction:
@@ -214,9 +422,6 @@ class _TableItemModel(QAbstractTableModel):
             to_row = parent.row()
             for index, from_row in enumerate(rows):
                 is_ok &= self.items.move(from_row, to_row + index)
-            self.beginResetModel()
-            self.update_cache()
-            self.endResetModel()
             return is_ok
         return False
 
@@ -244,3 +449,35 @@ class _TableItemModel(QAbstractTableModel):
                 row, column, _ = infos
                 index = self.index(row, column)
                 self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+
+
+def _update_row(row: int, row_change: RowChange) -> Optional[int]:
+    r"""Get the row after the given change or None if it has been removed."""
+    if row_change.change_type == RowChangeType.INSERT and row >= row_change.row:
+        return row + 1
+    elif row_change.change_type == RowChangeType.REMOVE:
+        if row == row_change.row:
+            return None
+        elif row > row_change.row:
+            return row - 1
+    elif row_change.change_type == RowChangeType.MOVE:
+        if row == row_change.row:
+            return row_change.to_row
+        if row > row_change.row:
+            row -= 1
+        if row >= row_change.to_row:
+            row += 1
+    return row
+
+
+def _iter_row_ranges(rows: Iterable[int]) -> Generator[Tuple[int, int], None, None]:
+    r"""Iterate over the first and last rows of the ranges of consecutive rows."""
+    first_row = last_row = -1
+    for row in sorted(rows):
+        if row != last_row + 1 or first_row < 0:
+            if first_row >= 0:
+                yield first_row, last_row
+            first_row = row
+        last_row = row
+    if first_row >= 0:
+        yield first_row, last_row
@@ -40,12 +40,19 @@ class TableWidget(ItemsWidget):
             self._model.source_model.successful_highlight(items)
 
     def update_view(self) -> None:
-        r"""Update the table."""
+        r"""Update the table.
+
+        If the changes of the rows have been notified by the items, only these changes are
+        notified to the table to keep its selection and its scroll position, otherwise the
+        model is reset.
+        """
         assert self._items is not None, "The items of the table is not defined."
         if self._model is not None:
             self.pagination_view.view.size_changed.emit()
-            self._model.beginResetModel()
-            self._model.endResetModel()
+            row_changes = self._items.take_row_changes()
+            if not (row_changes and self._model.apply_row_changes(row_changes)):
+                self._model.beginResetModel()
+                self._model.endResetModel()
             if isinstance(self.table, _TableView):
                 self.table.horizontalHeader().resizeSections(QHeaderView.ResizeToContents)
 
@@ -62,6 +69,8 @@ class TableWidget(ItemsWidget):
     def _set_items(self, items: AbstractTableItems[Any]) -> None:
         """Set the items."""
         self._items = items
+        # the changes of the rows are relative to the previous state of the table
+        items.take_row_changes()
         self._model = TableItemModel(items)
         self.table.setModel(self._model)
         self._set_delegates()
@@ -148,7 +157,5 @@ class _TableView(QTableView):
         proxy_index = self.indexAt(position)
         model = self.model()
         if isinstance(model, TreeItemModel):
-            index = model.mapToSource(proxy_index)
-            rows = index.internalPointer()
-            column = index.column()
-            self.context_menu_selection = (rows, column)
+            rows = model.get_position(proxy_index)
+            self.context_menu_selection = (rows, proxy_index.column())
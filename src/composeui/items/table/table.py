@@ -22,27 +22,31 @@ AnyTableView: TypeAlias = TableView[AbstractTableItems[Any]]
 def add_clicked(*, view: AnyTableView, model: AnyModel) -> None:
     r"""Add an item in the table."""
     if view.items is not None:
-        new_selected_row: Optional[int] = None
-        selected_rows = view.items.get_selected_rows()
-        if len(selected_rows) > 0:
-            row = selected_rows[-1]
-        else:
-            row = view.items.get_nb_rows() - 1
-        with model.record_history():
-            new_selected_row = view.items.insert(row + 1)
-        # update pagination
-        # update the current page size to get the correct current page
-        # the update of the current page need to be done before the update of the table
-        # to display the correct rows for the new current page
-        pagination.update_current_page_size(view=view.pagination_view, parent_view=view)
-        if new_selected_row is not None:
-            view.items.page_navigator.set_current_page_from_row(new_selected_row)
-        else:
-            view.items.page_navigator.set_current_page_from_row(row + 1)
-        # update table
-        tools.update_view_with_dependencies(view)
-        if new_selected_row is not None:
-            view.items.set_selected_rows([new_selected_row])
+        with tools.batch_updates():
+            new_selected_row: Optional[int] = None
+            selected_rows = view.items.get_selected_rows()
+            if len(selected_rows) > 0:
+                row = selected_rows[-1]
+            else:
+                row = view.items.get_nb_rows() - 1
+            with model.record_history():
+                model.notify_change()
+                new_selected_row = view.items.insert(row + 1)
+            # update pagination
+            # update the current page size to get the correct current page
+            # the update of the current page need to be done before the update of the table
+            # to display the correct rows for the new current page
+            pagination.update_current_page_size(view=view.pagination_view, parent_view=view)
+            if new_selected_row is not None:
+                view.items.page_navigator.set_current_page_from_row(new_selected_row)
+            else:
+                view.items.page_navigator.set_current_page_from_row(row + 1)
+            # update table
+            tools.update_view_with_dependencies(view)
+            # the view must be updated before its selection
+            tools.flush_updates()
+            if new_selected_row is not None:
+                view.items.set_selected_rows([new_selected_row])
 
 
 def remove_clicked(*, view: AnyTableView, main_view: MainView, model: AnyModel) -> None:
@@ -51,27 +55,31 @@ def remove_clicked(*, view: AnyTableView, main_view: MainView, model: AnyModel)
         view.items.get_confirmation_message() == ""
         or tools.ask_confirmation(main_view, view.items.get_confirmation_message())
     ):
-        with model.record_history():
-            new_selected_row: Optional[int] = None
-            for row in sorted(view.items.get_selected_rows(), reverse=True):
-                new_selected_row = view.items.remove(row)
-        # remove the selection to force the update of the current indices
-        # of the linked table
-        view.items.set_selected_rows([])
-        # update pagination
-        # update the current page size to get the correct current page
-        # the update of the current page need to be done before the update of the table
-        # to display the correct rows for the new current page
-        pagination.update_current_page_size(view=view.pagination_view, parent_view=view)
-        if new_selected_row is None:
-            view.items.page_navigator.set_current_page_from_row(0)
-        else:
-            view.items.page_navigator.set_current_page_from_row(new_selected_row)
-        # update table
-        tools.update_view_with_dependencies(view)
-        # select eventually the position given by the remove method
-        if new_selected_row is not None:
-            view.items.set_selected_rows([new_selected_row])
+        with tools.batch_updates():
+            with model.record_history():
+                model.notify_change()
+                new_selected_row: Optional[int] = None
+                for row in sorted(view.items.get_selected_rows(), reverse=True):
+                    new_selected_row = view.items.remove(row)
+            # remove the selection to force the update of the current indices
+            # of the linked table
+            view.items.set_selected_rows([])
+            # update pagination
+            # update the current page size to get the correct current page
+            # the update of the current page need to be done before the update of the table
+            # to display the correct rows for the new current page
+            pagination.update_current_page_size(view=view.pagination_view, parent_view=view)
+            if new_selected_row is None:
+                view.items.page_navigator.set_current_page_from_row(0)
+            else:
+                view.items.page_navigator.set_current_page_from_row(new_selected_row)
+            # update table
+            tools.update_view_with_dependencies(view)
+            # the view must be updated before its selection
+            tools.flush_updates()
+            # select eventually the position given by the remove method
+            if new_selected_row is not None:
+                view.items.set_selected_rows([new_selected_row])
 
 
 def import_clicked(*, view: AnyTableView, main_view: MainView, model: AnyModel) -> None:
@@ -95,6 +103,7 @@ def import_clicked(*, view: AnyTableView, main_view: MainView, model: AnyModel)
                 tasks=Tasks((task,), print_to_std=True),
                 finished_slots=[
                     model.stop_recording_history,
+                    partial(undo_partial_import, task, model),
                     partial(tools.update_view_with_dependencies, view, reset_pagination=True),
                 ],
             )
@@ -105,6 +114,12 @@ def import_clicked(*, view: AnyTableView, main_view: MainView, model: AnyModel)
         )
 
 
+def undo_partial_import(task: ImportFileTableTask[Any], model: AnyModel) -> None:
+    """Undo the rows imported before the failure to read the rest of the file."""
+    if task.is_partially_imported:
+        model.undo()
+
+
 def export_clicked(*, view: AnyTableView, main_view: MainView, model: AnyModel) -> None:
     """Export values to a csv/xls/... file from the table."""
     if view.items is not None:
@@ -123,24 +138,32 @@ def export_clicked(*, view: AnyTableView, main_view: MainView, model: AnyModel)
 def clear_items(*, view: AnyTableView, model: AnyModel) -> None:
     """Clear the data of the selected items."""
     if view.items is not None:
-        with model.record_history():
-            for rows, columns in view.selected_items.items():
-                for column in columns:
-                    row = rows[-1]
-                    view.items.set_data(row, column, "")
-        tools.update_view_with_dependencies(view)
+        with tools.batch_updates():
+            with model.record_history():
+                model.notify_change()
+                for rows, columns in view.selected_items.items():
+                    for column in columns:
+                        row = rows[-1]
+                        view.items.set_data(row, column, "")
+            tools.update_view_with_dependencies(view)
 
 
 def check_all_items(*, view: AnyTableView, model: AnyModel) -> None:
     """Un/Check all the items."""
     items = view.items
     if items is not None:
-        nb_rows = items.get_nb_rows()
-        nb_columns = items.get_nb_columns()
-        with model.record_history():
-            for column in range(nb_columns):
-                if all(items.is_checked(row, column) is not None for row in range(nb_rows)):
-                    all_checked = all(items.is_checked(row, column) for row in range(nb_rows))
-                    for row in range(nb_rows):
-                        items.set_checked(row, column, not all_checked)
-        tools.update_view_with_dependencies(view)
+        with tools.batch_updates():
+            nb_rows = items.get_nb_rows()
+            nb_columns = items.get_nb_columns()
+            with model.record_history():
+                model.notify_change()
+                for column in range(nb_columns):
+                    if all(
+                        items.is_checked(row, column) is not None for row in range(nb_rows)
+                    ):
+                        all_checked = all(
+                            items.is_checked(row, column) for row in range(nb_rows)
+                        )
+                        for row in range(nb_rows):
+                            items.set_checked(row, column, not all_checked)
+            tools.update_view_with_dependencies(view)
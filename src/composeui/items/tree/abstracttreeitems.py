@@ -1,7 +1,12 @@
 from composeui.commontypes import AnyItemsView, AnyModel
 from composeui.items.core.abstractitems import AbstractItems
 from composeui.items.core.itemsconverter import ItemsConverter
-from composeui.items.core.itemsutils import BackgroundType, DelegateProps
+from composeui.items.core.itemsutils import (
+    BackgroundType,
+    DelegateProps,
+    SortKey,
+    get_sort_key,
+)
 from composeui.items.core.paginationnavigator import PaginationNavigator
 
 from typing_extensions import OrderedDict, Self
@@ -156,7 +161,10 @@ class AbstractTreeItems(AbstractItems[AnyItemsView, AnyModel]):
         to avoid it.
         """
         with self._model.record_history():
-            return self.set_data(row, column, value, parent_rows)
+            is_ok = self.set_data(row, column, value, parent_rows)
+            if is_ok:
+                self._model.notify_change()
+            return is_ok
 
     def get_edit_data(self, row: int, column: int, parent_rows: Tuple[int, ...] = ()) -> Any:
         """Get the data displayed during the edition of an item.
@@ -165,6 +173,17 @@ class AbstractTreeItems(AbstractItems[AnyItemsView, AnyModel]):
         """
         return self.get_data(row, column, parent_rows)
 
+    def get_sort_keys(self, column: int, parent_rows: Tuple[int, ...] = ()) -> List[SortKey]:
+        """Get the keys to sort the children of the parent by the given column.
+
+        The keys are computed from the edited data, the numbers are sorted by value before
+        the texts.
+        """
+        return [
+            get_sort_key(self.get_edit_data(row, column, parent_rows))
+            for row in range(self.get_nb_rows(parent_rows))
+        ]
+
     def is_checked(
         self, row: int, column: int, parent_rows: Tuple[int, ...] = ()
     ) -> Optional[bool]:
@@ -191,7 +210,10 @@ class AbstractTreeItems(AbstractItems[AnyItemsView, AnyModel]):
         to avoid it.
         """
         with self._model.record_history():
-            return self.set_checked(row, column, value, parent_rows)
+            is_ok = self.set_checked(row, column, value, parent_rows)
+            if is_ok:
+                self._model.notify_change()
+            return is_ok
 
     def is_editable(self, row: int, column: int, parent_rows: Tuple[int, ...] = ()) -> bool:
         """Check if the item is editable."""
@@ -236,6 +258,35 @@ class AbstractTreeItems(AbstractItems[AnyItemsView, AnyModel]):
             )
         )
 
+    def get_filter_mask(self, parent_rows: Tuple[int, ...] = ()) -> List[bool]:
+        """Get for each child row of the parent if it is filtered or not, like is_filtered.
+
+        The filter is evaluated column by column only if the rows are on the current page.
+        It is much faster than calling is_filtered for each row.
+        """
+        nb_rows = self.get_nb_rows(parent_rows)
+        if len(parent_rows) > 0:
+            rows = range(nb_rows) if self._is_on_current_page(parent_rows[0]) else range(0)
+        elif self._view.has_pagination:
+            rows = range(
+                self.page_navigator.get_current_min_row(),
+                min(self.page_navigator.get_current_max_row() + 1, nb_rows),
+            )
+        else:
+            rows = range(nb_rows)
+        mask = [True] * nb_rows
+        if len(rows) == 0:
+            return mask
+        if len(self.filter_column_indices) == 0 or not self.filter_manager.has_pattern:
+            mask[rows.start : rows.stop] = [False] * len(rows)
+            return mask
+        columns = [
+            [self.get_data(row, column, parent_rows) for row in rows]
+            for column in self.filter_column_indices
+        ]
+        mask[rows.start : rows.stop] = self._get_unmatched_mask(columns)
+        return mask
+
     def get_expand_positions(self) -> List[Tuple[int, ...]]:
         """Get the expand positions.
 
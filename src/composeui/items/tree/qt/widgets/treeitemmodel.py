@@ -1,6 +1,12 @@
 r"""Item model of a tree."""
 
-from composeui.items.core.itemsutils import BackgroundType
+from composeui.items.core.itemsutils import (
+    BackgroundType,
+    RowChange,
+    RowChangeType,
+    SortKey,
+    get_sort_key,
+)
 from composeui.items.tree.abstracttreeitems import AbstractTreeItems
 
 from qtpy.QtCore import Signal  # type: ignore[attr-defined]
@@ -12,6 +18,7 @@ from qtpy.QtCore import (
     QMimeData,
     QModelIndex,
     QObject,
+    QPersistentModelIndex,
     QSortFilterProxyModel,
     Qt,
     QTimer,
@@ -20,9 +27,15 @@ from qtpy.QtGui import QBrush, QColor
 
 import contextlib
 import pickle
+from array import array
 from collections import deque
 from functools import partial
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union, overload
+from typing import Any, Dict, Generator, Iterable, List, Optional, Set, Tuple, Union, overload
+
+# id of the root node of the tree
+_ROOT_ID = 0
+# id of a node not created yet or parent of a removed node
+_NO_NODE_ID = -1
 
 
 class TreeItemModel(QSortFilterProxyModel):
@@ -36,40 +49,113 @@ class TreeItemModel(QSortFilterProxyModel):
         self.setDynamicSortFilter(False)
         self.setSortRole(Qt.InitialSortOrderRole)
         self.modelAboutToBeReset.connect(self.source_model.update_cache)
+        self.modelAboutToBeReset.connect(self._clear_filtered_rows)
         # self.modelReset.connect(self.source_model.highlight_indices.clear)
+        # if some rows have been filtered since the last reset
+        self._has_filtered_rows = False
+        # filter status of the children of each evaluated parent node, computed at once
+        self._filter_masks: Dict[int, List[bool]] = {}
+        # keys to sort the children of the parent nodes by column, computed at once
+        self._sort_keys: Dict[Tuple[int, int], List[SortKey]] = {}
+        self.modelAboutToBeReset.connect(self._clear_sort_keys)
+        self.source_model.dataChanged.connect(self._clear_sort_keys)
 
     @Slot()
     def update_cache(self) -> None:
         self.source_model.update_cache()
 
+    def apply_row_changes(self, row_changes: List[RowChange]) -> bool:
+        r"""Notify the views of the changes of the rows without resetting the model.
+
+        Returns False if the changes don't match the items, the model needs to be reset.
+        """
+        self._filter_masks.clear()
+        self._sort_keys.clear()
+        if not self.source_model.apply_row_changes(row_changes):
+            return False
+        if (
+            self.items.filter_manager.has_pattern
+            or self.items.page_navigator.current_nb_pages > 1
+            or self._has_filtered_rows
+        ):
+            self._clear_filtered_rows()
+            self.invalidateFilter()
+        return True
+
+    def dropMimeData(  # noqa: N802
+        self,
+        mime_data: QMimeData,
+        action: Qt.DropAction,
+        row: int,
+        column: int,
+        parent: Union[QModelIndex, QPersistentModelIndex],
+    ) -> bool:
+        """Drop the dragged rows and notify the views of the moved rows."""
+        is_ok = bool(super().dropMimeData(mime_data, action, row, column, parent))
+        row_changes = self.items.take_row_changes()
+        if not (row_changes and self.apply_row_changes(row_changes)):
+            self.beginResetModel()
+            self.endResetModel()
+        return is_ok
+
+    @Slot()
+    def _clear_sort_keys(self) -> None:
+        self._sort_keys.clear()
+
+    @Slot()
+    def _clear_filtered_rows(self) -> None:
+        self._has_filtered_rows = False
+        self._filter_masks.clear()
+
+    def get_position(self, index: QModelIndex) -> Tuple[int, ...]:
+        r"""Get the position of the row of the given index of the proxy."""
+        return self.source_model.get_position(self.mapToSource(index))
+
     def filterAcceptsRow(  # noqa: N802
         self, source_row: int, source_parent: QModelIndex
     ) -> bool:
-        r"""Check if the row is not filtered."""
-        if source_parent.isValid():
-            return not self.items.is_filtered(source_row, source_parent.internalPointer())
+        r"""Check if the row is not filtered.
+
+        The filter of all the children of the parent is computed at the first call.
+        """
+        parent_id = source_parent.internalId() if source_parent.isValid() else _ROOT_ID
+        filter_mask = self._filter_masks.get(parent_id)
+        if filter_mask is None:
+            filter_mask = self._filter_masks[parent_id] = self.items.get_filter_mask(
+                self.source_model.get_position(source_parent)
+            )
+        if source_row < len(filter_mask):
+            is_filtered = filter_mask[source_row]
         else:
-            return not self.items.is_filtered(source_row)
+            is_filtered = self.items.is_filtered(
+                source_row, self.source_model.get_position(source_parent)
+            )
+        self._has_filtered_rows |= is_filtered
+        return not is_filtered
 
     def lessThan(  # noqa: N802
         self, source_left: QModelIndex, source_right: QModelIndex
     ) -> bool:
-        r"""Check if the left index is less than the right index."""
-        try:
-            left_rows = source_left.internalPointer()
-            *left_parent_rows, left_row = left_rows
-            value_left = float(
-                self.items.get_data(left_row, source_left.column(), left_parent_rows)
-            )
-            right_rows = source_right.internalPointer()
-            *right_parent_rows, right_row = right_rows
-            value_right = float(
-                self.items.get_data(right_row, source_right.column(), right_parent_rows)
+        r"""Check if the left index is less than the right index.
+
+        The keys of all the children of the parent are computed at the first comparison.
+        """
+        key = (self.source_model.get_parent_id(source_left), source_left.column())
+        sort_keys = self._sort_keys.get(key)
+        if sort_keys is None:
+            sort_keys = self._sort_keys[key] = self.items.get_sort_keys(
+                source_left.column(), self.source_model.get_position(source_left)[:-1]
             )
-        except ValueError:
-            return bool(super().lessThan(source_left, source_right))
-        else:
-            return value_left < value_right
+        left_row, right_row = source_left.row(), source_right.row()
+        if left_row < len(sort_keys) and right_row < len(sort_keys):
+            return sort_keys[left_row] < sort_keys[right_row]
+        left_rows = self.source_model.get_position(source_left)
+        right_rows = self.source_model.get_position(source_right)
+        return get_sort_key(
+            self.items.get_edit_data(left_rows[-1], source_left.column(), left_rows[:-1])
+        ) < get_sort_key(
+            self.items.get_edit_data(right_rows[-1], source_right.column(), right_rows[:-1])
+        )
 
     def index_from_rows(self, rows: Tuple[int, ...], column: int) -> QModelIndex:
         r"""Get the index from the rows and column."""
@@ -92,7 +178,13 @@ class TreeItemModel(QSortFilterProxyModel):
 
 
 class _TreeItemModel(QAbstractItemModel):
-    r"""Item model for the table of the Table GUI."""
+    r"""Item model for the table of the Table GUI.
+
+    Each row of the tree is a node identified by an integer used as the internal id of its
+    indexes. The nodes are created when their indexes are requested and stored in flat
+    arrays: the parent and the row of each node and the children of the loaded nodes. The
+    ids of the removed nodes are freed and reused by the next created nodes.
+    """
 
     item_toggled = Signal()
 
@@ -100,8 +192,16 @@ class _TreeItemModel(QAbstractItemModel):
         r"""Instantiate the class."""
         super().__init__(*args, **kwargs)
         self.items = items
-        self._cache_rows: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
-        self._cache_data: Dict[Tuple[int, ...], List[List[str]]] = {}
+        self._node_parents = array("q")
+        self._node_rows = array("q")
+        # the ids of the children of the nodes or None if they are not loaded yet
+        self._node_children: List[Optional[List[int]]] = []
+        # the ids of the removed nodes which can be reused
+        self._free_ids: List[int] = []
+        # the displayed data of the nodes, loaded on demand
+        self._cache_data: Dict[int, List[str]] = {}
+        # the last computed position, the siblings are often requested one after the other
+        self._last_node_position: Tuple[int, Tuple[int, ...]] = (_ROOT_ID, ())
         self.highlight_indices: Set[Tuple[int, Tuple[int, ...], int, bool]] = set()
         self.update_cache()
 
@@ -115,25 +215,309 @@ class _TreeItemModel(QAbstractItemModel):
             index = self.index(row, current_column, index)
         return index
 
+    def get_position(
+        self, index: Union[QModelIndex, QPersistentModelIndex]
+    ) -> Tuple[int, ...]:
+        r"""Get the position of the row of the given index, an empty tuple for the root."""
+        if index.isValid():
+            node_id = index.internalId()
+            last_node_id, last_position = self._last_node_position
+            if node_id == last_node_id:
+                return last_position
+            return self._get_node_position(node_id)
+        return ()
+
+    def get_parent_id(self, index: QModelIndex) -> int:
+        r"""Get the id of the parent node of the row of the given index."""
+        return self._node_parents[index.internalId()] if index.isValid() else _NO_NODE_ID
+
     def update_cache(self) -> None:
-        r"""Update the internal datas."""
-        self._cache_data = self.items.get_all_datas()
-        self._cache_rows = {
-            (*parent_rows, row): (*parent_rows, row)
-            for parent_rows in self._cache_data
-            for row in range(len(self._cache_data[parent_rows]))
+        r"""Update the internal datas.
+
+        The nodes are only removed, they are loaded again when they are requested by the
+        views, i.e. the children of the expanded rows.
+        """
+        self._node_parents = array("q", [_NO_NODE_ID])
+        self._node_rows = array("q", [0])
+        self._node_children = [None]
+        self._free_ids = []
+        self._cache_data = {}
+        self._last_node_position = (_ROOT_ID, ())
+
+    def _get_node_position(self, node_id: int) -> Tuple[int, ...]:
+        r"""Get the position of the row of the given node."""
+        last_node_id, last_position = self._last_node_position
+        if node_id == last_node_id:
+            return last_position
+        rows = []
+        current_id = node_id
+        while current_id > _ROOT_ID:
+            rows.append(self._node_rows[current_id])
+            current_id = self._node_parents[current_id]
+        position = tuple(reversed(rows))
+        self._last_node_position = (node_id, position)
+        return position
+
+    def _get_children(self, node_id: int) -> List[int]:
+        r"""Get the ids of the children of the given node and load them if needed."""
+        children = self._node_children[node_id]
+        if children is None:
+            nb_rows = self.items.get_nb_rows(self._get_node_position(node_id))
+            children = [_NO_NODE_ID] * nb_rows
+            self._node_children[node_id] = children
+        return children
+
+    def _get_child(self, node_id: int, row: int) -> int:
+        r"""Get the id of the child at the given row and create it if needed."""
+        children = self._get_children(node_id)
+        child_id = children[row]
+        if child_id == _NO_NODE_ID:
+            if len(self._free_ids) > 0:
+                child_id = self._free_ids.pop()
+                self._node_parents[child_id] = node_id
+                self._node_rows[child_id] = row
+            else:
+                child_id = len(self._node_parents)
+                self._node_parents.append(node_id)
+                self._node_rows.append(row)
+                self._node_children.append(None)
+            children[row] = child_id
+        return child_id
+
+    def _free_node(self, node_id: int) -> None:
+        r"""Free the given node and its loaded descendants, their ids can be reused."""
+        node_ids = [node_id]
+        while len(node_ids) > 0:
+            current_id = node_ids.pop()
+            children = self._node_children[current_id]
+            if children is not None:
+                node_ids.extend(child_id for child_id in children if child_id != _NO_NODE_ID)
+            self._node_parents[current_id] = _NO_NODE_ID
+            self._node_children[current_id] = None
+            self._cache_data.pop(current_id, None)
+            self._free_ids.append(current_id)
+
+    def _get_row_data(self, node_id: int) -> List[str]:
+        r"""Get the displayed data of all the columns of the given node and cache them."""
+        row_data = self._cache_data.get(node_id)
+        if row_data is None:
+            rows = self._get_node_position(node_id)
+            parent_rows, row = rows[:-1], rows[-1]
+            row_data = [
+                self.items.get_data(row, column, parent_rows)
+                for column in range(self.items.get_nb_columns())
+            ]
+            self._cache_data[node_id] = row_data
+        return row_data
+
+    def _iter_loaded_nodes(self) -> Generator[Tuple[int, List[int]], None, None]:
+        r"""Iterate over the nodes of the tree whose children are loaded."""
+        node_ids = deque([_ROOT_ID])
+        while len(node_ids) > 0:
+            node_id = node_ids.popleft()
+            children = self._node_children[node_id]
+            if children is not None:
+                yield node_id, children
+                node_ids.extend(child_id for child_id in children if child_id != _NO_NODE_ID)
+
+    def _find_node(self, rows: Tuple[int, ...]) -> Optional[int]:
+        r"""Find the node at the given position or None if it is not created."""
+        node_id = _ROOT_ID
+        for row in rows:
+            children = self._node_children[node_id]
+            if children is None or not 0 <= row < len(children):
+                return None
+            node_id = children[row]
+            if node_id == _NO_NODE_ID:
+                return None
+        return node_id
+
+    def _find_loaded_children(self, rows: Tuple[int, ...]) -> Optional[Tuple[int, List[int]]]:
+        r"""Find the node at the given position if its children are loaded."""
+        node_id = self._find_node(rows)
+        if node_id is None:
+            return None
+        children = self._node_children[node_id]
+        return None if children is None else (node_id, children)
+
+    def _create_parent_index(self, node_id: int) -> QModelIndex:
+        r"""Create the index of the given node used as a parent."""
+        if node_id == _ROOT_ID:
+            return QModelIndex()
+        return self.createIndex(self._node_rows[node_id], 0, node_id)
+
+    def apply_row_changes(self, row_changes: List[RowChange]) -> bool:
+        r"""Notify the views of the inserted, removed, moved and modified rows.
+
+        The changes are first checked against the numbers of children of the loaded nodes.
+        Then they are notified one by one and the nodes are updated accordingly, only the
+        loaded nodes are modified. Finally only the modified rows are marked as changed.
+        Returns False if the changes don't match the items, the model needs to be reset.
+        The number of changes is limited by the items (see AbstractItems.max_row_changes).
+        """
+        cache_nb_rows = {
+            self._get_node_position(node_id): len(children)
+            for node_id, children in self._iter_loaded_nodes()
         }
+        modified_positions: Set[Tuple[int, ...]] = set()
+        for row_change in row_changes:
+            change_type = row_change.change_type
+            if change_type == RowChangeType.MOVE and _is_descendant(
+                _get_position_after_insertion(
+                    row_change.to_parent_rows, row_change.parent_rows, row_change.row
+                ),
+                (*row_change.parent_rows, row_change.row),
+            ):
+                # a row can't be moved into itself
+                return False
+            updated_nb_rows: Dict[Tuple[int, ...], int] = {}
+            for parent_rows, previous_nb_rows in cache_nb_rows.items():
+                new_parent_rows = _update_position(parent_rows, row_change)
+                if new_parent_rows is None:
+                    continue
+                nb_rows = previous_nb_rows
+                if parent_rows == row_change.parent_rows:
+                    if change_type == RowChangeType.INSERT:
+                        if not 0 <= row_change.row <= nb_rows:
+                            return False
+                        nb_rows += 1
+                    elif not 0 <= row_change.row < nb_rows:
+                        return False
+                    elif change_type != RowChangeType.DATA:
+                        nb_rows -= 1
+                if change_type == RowChangeType.MOVE and (
+                    new_parent_rows == row_change.to_parent_rows
+                ):
+                    if not 0 <= row_change.to_row <= nb_rows:
+                        return False
+                    nb_rows += 1
+                updated_nb_rows[new_parent_rows] = nb_rows
+            cache_nb_rows = updated_nb_rows
+            modified_positions = {
+                updated_position
+                for updated_position in (
+                    _update_position(position, row_change) for position in modified_positions
+                )
+                if updated_position is not None
+            }
+            if change_type == RowChangeType.DATA:
+                modified_positions.add((*row_change.parent_rows, row_change.row))
+        if any(
+            self.items.get_nb_rows(parent_rows) != nb_rows
+            for parent_rows, nb_rows in cache_nb_rows.items()
+        ):
+            return False
+        for row_change in row_changes:
+            self._notify_row_change(row_change)
+        last_column = self.columnCount() - 1
+        for position in modified_positions:
+            node_id = self._find_node(position)
+            if node_id is not None:
+                # the views don't know the rows without a node
+                self._cache_data.pop(node_id, None)
+                row = self._node_rows[node_id]
+                self.dataChanged.emit(
+                    self.createIndex(row, 0, node_id),
+                    self.createIndex(row, last_column, node_id),
+                )
+        return True
+
+    def _notify_row_change(self, row_change: RowChange) -> None:
+        r"""Notify the views of a change of row and update the loaded nodes accordingly.
+
+        The views only know the children of the loaded nodes, so a row moved from or to a
+        node whose children are not loaded is notified as a removed or inserted row.
+        """
+        row = row_change.row
+        if row_change.change_type == RowChangeType.INSERT:
+            self._notify_row_inserted(row_change.parent_rows, row)
+        elif row_change.change_type == RowChangeType.REMOVE:
+            self._notify_row_removed(row_change.parent_rows, row)
+        elif row_change.change_type == RowChangeType.MOVE:
+            from_children = self._find_loaded_children(row_change.parent_rows)
+            # the destination is given after the move, before the removal of the row it is
+            # shifted like after an insertion at the same position
+            to_parent_rows = _get_position_after_insertion(
+                row_change.to_parent_rows, row_change.parent_rows, row
+            )
+            to_children = self._find_loaded_children(to_parent_rows)
+            if from_children is None:
+                self._notify_row_inserted(to_parent_rows, row_change.to_row)
+            elif to_children is None:
+                self._notify_row_removed(row_change.parent_rows, row)
+            else:
+                self._notify_row_moved(from_children, row, to_children, row_change.to_row)
+
+    def _notify_row_inserted(self, parent_rows: Tuple[int, ...], row: int) -> None:
+        r"""Notify the views of an inserted row if the children of its parent are loaded."""
+        loaded_children = self._find_loaded_children(parent_rows)
+        if loaded_children is not None:
+            node_id, children = loaded_children
+            self.beginInsertRows(self._create_parent_index(node_id), row, row)
+            children.insert(row, _NO_NODE_ID)
+            self._update_node_rows(children, row + 1)
+            self.endInsertRows()
+
+    def _notify_row_removed(self, parent_rows: Tuple[int, ...], row: int) -> None:
+        r"""Notify the views of a removed row if the children of its parent are loaded."""
+        loaded_children = self._find_loaded_children(parent_rows)
+        if loaded_children is not None:
+            node_id, children = loaded_children
+            self.beginRemoveRows(self._create_parent_index(node_id), row, row)
+            child_id = children.pop(row)
+            self._update_node_rows(children, row)
+            self.endRemoveRows()
+            if child_id != _NO_NODE_ID:
+                # freed after the removal, the views may still request the removed indexes
+                self._free_node(child_id)
+
+    def _notify_row_moved(
+        self,
+        from_children: Tuple[int, List[int]],
+        from_row: int,
+        to_children: Tuple[int, List[int]],
+        to_row: int,
+    ) -> None:
+        r"""Notify the views of a row moved between two nodes whose children are loaded.
+
+        The destination row is the row after the move.
+        """
+        from_id, from_rows = from_children
+        to_id, to_rows = to_children
+        if from_id == to_id and from_row == to_row:
+            return
+        # the destination of beginMoveRows is the row before which the row is moved
+        destination = to_row + 1 if from_id == to_id and to_row > from_row else to_row
+        self.beginMoveRows(
+            self._create_parent_index(from_id),
+            from_row,
+            from_row,
+            self._create_parent_index(to_id),
+            destination,
+        )
+        child_id = from_rows.pop(from_row)
+        to_rows.insert(to_row, child_id)
+        if child_id != _NO_NODE_ID:
+            self._node_parents[child_id] = to_id
+        self._update_node_rows(from_rows, from_row)
+        self._update_node_rows(to_rows, min(from_row, to_row) if from_id == to_id else to_row)
+        self.endMoveRows()
+
+    def _update_node_rows(self, children: List[int], start: int) -> None:
+        r"""Update the rows of the children from the start row."""
+        self._last_node_position = (_ROOT_ID, ())
+        for row in range(start, len(children)):
+            child_id = children[row]
+            if child_id != _NO_NODE_ID:
+                self._node_rows[child_id] = row
 
     def index(
         self, row: int, column: int, parent: QModelIndex = QModelIndex()  # noqa: B008
     ) -> QModelIndex:
         r"""Get the index of the item for the given row and column."""
         if self.hasIndex(row, column, parent):
-            if parent.isValid():
-                parent_rows = parent.internalPointer()
-            else:
-                parent_rows = ()
-            return self.createIndex(row, column, self._cache_rows[(*parent_rows, row)])
+            parent_id = parent.internalId() if parent.isValid() else _ROOT_ID
+            return self.createIndex(row, column, self._get_child(parent_id, row))
         else:
             return QModelIndex()
 
@@ -145,9 +529,9 @@ class _TreeItemModel(QAbstractItemModel):
         """Get the parent of the given index."""
         if child is not None:
             if child.isValid():
-                rows = child.internalPointer()
-                if len(rows) > 1:
-                    return self.createIndex(rows[-2], 0, self._cache_rows[rows[:-1]])
+                parent_id = self._node_parents[child.internalId()]
+                if parent_id > _ROOT_ID:
+                    return self.createIndex(self._node_rows[parent_id], 0, parent_id)
             return QModelIndex()
         else:
             return super().parent()
@@ -155,9 +539,9 @@ class _TreeItemModel(QAbstractItemModel):
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008, N802
         """Get the number of rows under the given parent."""
         if parent.isValid():
-            return len(self._cache_data[parent.internalPointer()])
+            return len(self._get_children(parent.internalId()))
         else:
-            return len(self._cache_data[()])
+            return len(self._get_children(_ROOT_ID))
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802, B008
         r"""Get the number of columns for the children of the given parent."""
@@ -165,12 +549,12 @@ class _TreeItemModel(QAbstractItemModel):
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         r"""Get the data stored under the given role for the given index."""
-        rows = index.internalPointer()
-        parent_rows, row = rows[:-1], rows[-1]
         column = index.column()
         if role == Qt.DisplayRole:
-            return self._cache_data[parent_rows][row][column]
-        elif role == Qt.EditRole:
+            return self._get_row_data(index.internalId())[column]
+        rows = self.get_position(index)
+        parent_rows, row = rows[:-1], rows[-1]
+        if role == Qt.EditRole:
             return self.items.get_edit_data(row, column, parent_rows)
         elif role == Qt.BackgroundRole:
             background = self.items.get_background(row, column, parent_rows)
@@ -196,13 +580,13 @@ class _TreeItemModel(QAbstractItemModel):
         self, index: QModelIndex, value: Any, role: int = Qt.EditRole
     ) -> bool:
         r"""Set the data of the given index."""
-        rows = index.internalPointer()
+        rows = self.get_position(index)
         parent_rows, row = rows[:-1], rows[-1]
         column = index.column()
         if role == Qt.EditRole:
             is_ok = self.items.set_data_with_history(row, column, str(value), parent_rows)
             if is_ok:
-                self._cache_data[parent_rows][row][column] = str(value)
+                self._cache_data.pop(index.internalId(), None)
                 self.dataChanged.emit(index, index, [Qt.EditRole])
             return is_ok
         elif role == Qt.CheckStateRole:
@@ -216,10 +600,10 @@ class _TreeItemModel(QAbstractItemModel):
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
         r"""Get the item flags for the given index."""
         flags = Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled | Qt.ItemIsSelectable
-        rows = index.internalPointer()
-        column = index.column()
-        if rows is None:
+        if not index.isValid():
             return flags
+        rows = self.get_position(index)
+        column = index.column()
         row, parent_rows = rows[-1], rows[:-1]
         if self.items.is_checked(row, column, parent_rows) is not None:
             flags |= Qt.ItemIsUserCheckable
@@ -249,7 +633,7 @@ class _TreeItemModel(QAbstractItemModel):
     def mimeData(self, indexes: Iterable[QModelIndex]) -> QMimeData:  # noqa: N802
         """Get the positions of the given indexes into a QMimeData."""
         mime_data = QMimeData()
-        positions = [index.internalPointer() for index in indexes if index.isValid()]
+        positions = [self.get_position(index) for index in indexes if index.isValid()]
         mime_data.setData("bstream", pickle.dumps(positions))
         return mime_data
 
@@ -259,21 +643,17 @@ class _TreeItemModel(QAbstractItemModel):
         action: Qt.DropAction,
         row: int,
         column: int,
-        parent: QModelIndex,
+        parent: Union[QModelIndex, QPersistentModelIndex],
     ) -> bool:
         """Drop the items currently dragged into a new position."""
         if action == Qt.MoveAction:
-            to_parent_rows = parent.internalPointer()
-            if to_parent_rows is None:
-                to_parent_rows = ()
+            to_parent_rows = self.get_position(parent)
             positions = set(pickle.loads(mime_data.data("bstream").data()))
             is_ok = True
             for index, (*from_parent_rows, from_row) in enumerate(positions):
                 is_ok &= self.items.move(
-                    from_row, row + index, from_parent_rows, to_parent_rows
+                    from_row, row + index, tuple(from_parent_rows), to_parent_rows
                 )
-            self.beginResetModel()
-            self.endResetModel()
             return is_ok
         return False
 
@@ -302,3 +682,57 @@ class _TreeItemModel(QAbstractItemModel):
                 rows = (*parent_rows, row)
                 index = self.index_from_rows(rows, column)
                 self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+
+
+def _update_position(
+    position: Tuple[int, ...], row_change: RowChange
+) -> Optional[Tuple[int, ...]]:
+    r"""Get the position of a row after the given change or None if it has been removed."""
+    parent_rows = row_change.parent_rows
+    depth = len(parent_rows)
+    if row_change.change_type == RowChangeType.MOVE:
+        from_position = (*parent_rows, row_change.row)
+        if position[: depth + 1] == from_position:
+            # the moved row or one of its descendants
+            return (*row_change.to_parent_rows, row_change.to_row, *position[depth + 1 :])
+        # the row is removed from its parent then inserted into the destination
+        position = _get_position_after_removal(position, parent_rows, row_change.row)
+        return _get_position_after_insertion(
+            position, row_change.to_parent_rows, row_change.to_row
+        )
+    if len(position) <= depth or position[:depth] != parent_rows:
+        return position
+    row = position[depth]
+    if row_change.change_type == RowChangeType.INSERT and row >= row_change.row:
+        return (*parent_rows, row + 1, *position[depth + 1 :])
+    elif row_change.change_type == RowChangeType.REMOVE:
+        if row == row_change.row:
+            return None
+        elif row > row_change.row:
+            return (*parent_rows, row - 1, *position[depth + 1 :])
+    return position
+
+
+def _get_position_after_removal(
+    position: Tuple[int, ...], parent_rows: Tuple[int, ...], row: int
+) -> Tuple[int, ...]:
+    r"""Get the position of a row not removed after the removal of the given row."""
+    depth = len(parent_rows)
+    if len(position) > depth and position[:depth] == parent_rows and position[depth] > row:
+        return (*parent_rows, position[depth] - 1, *position[depth + 1 :])
+    return position
+
+
+def _get_position_after_insertion(
+    position: Tuple[int, ...], parent_rows: Tuple[int, ...], row: int
+) -> Tuple[int, ...]:
+    r"""Get the position of a row after the insertion of a row at the given position."""
+    depth = len(parent_rows)
+    if len(position) > depth and position[:depth] == parent_rows and position[depth] >= row:
+        return (*parent_rows, position[depth] + 1, *position[depth + 1 :])
+    return position
+
+
+def _is_descendant(position: Tuple[int, ...], ancestor_position: Tuple[int, ...]) -> bool:
+    r"""Check if the row at the given position is the ancestor or one of its descendants."""
+    return position[: len(ancestor_position)] == ancestor_position
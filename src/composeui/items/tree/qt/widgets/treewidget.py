@@ -61,13 +61,21 @@ class TreeWidget(ItemsWidget):
             self._model.source_model.successful_highlight(items)
 
     def update_view(self) -> None:
-        r"""Update the table."""
+        r"""Update the table.
+
+        If the changes of the rows have been notified by the items, the selection and the
+        scroll position of the tree are kept, otherwise the model is reset.
+        """
         if self._items is None:
             raise ValueError("The items of the table is not defined.")
         if self._model is not None:
             self.pagination_view.view.size_changed.emit()
-            self._model.beginResetModel()
-            self._model.endResetModel()
+            row_changes = self._items.take_row_changes()
+            if row_changes and self._model.apply_row_changes(row_changes):
+                self.table.update_expansion_status()
+            else:
+                self._model.beginResetModel()
+                self._model.endResetModel()
 
     @contextmanager
     def edit_tree_model(self) -> Generator[Optional[TreeItemModel], None, None]:
@@ -94,6 +102,8 @@ class TreeWidget(ItemsWidget):
     def _set_items(self, items: AbstractTreeItems[Any]) -> None:
         """Set the items."""
         self._items = items
+        # the changes of the rows are relative to the previous state of the tree
+        items.take_row_changes()
         self._model = TreeItemModel(items)
         self.table.setModel(self._model)
         self._set_delegates()
@@ -110,10 +120,8 @@ class TreeWidget(ItemsWidget):
             selected_items: OrderedDict[Tuple[int, ...], List[int]] = OrderedDict({})
             if self._model is not None:
                 for index in self.table.selectedIndexes():
-                    source_index = self._model.mapToSource(index)
-                    rows = source_index.internalPointer()
-                    column = source_index.column()
-                    selected_items.setdefault(rows, []).append(column)
+                    rows = self._model.get_position(index)
+                    selected_items.setdefault(rows, []).append(index.column())
             return selected_items
 
     @selected_items.setter
@@ -148,11 +156,11 @@ class TreeWidget(ItemsWidget):
     def _check_selection(self, index: QModelIndex) -> None:
         r"""Check the item at the given index."""
         if index.isValid() and self.items is not None and self._model is not None:
-            source_index = self._model.mapToSource(index)
-            # the call to internalPointer need to be done before the call to edit_model
-            # because the internals are invalidated by beginResetModel
-            *parent_rows, row = source_index.internalPointer()
-            column = source_index.column()
+            # the position needs to be computed before the call to edit_model
+            # because the nodes are removed by beginResetModel
+            rows = self._model.get_position(index)
+            parent_rows, row = rows[:-1], rows[-1]
+            column = index.column()
             with self.edit_tree_model():
                 self.items.set_checked(
                     row,
@@ -219,17 +227,15 @@ class _TreeView(QTreeView):
         proxy_index = self.indexAt(position)
         model = self.model()
         if isinstance(model, TreeItemModel):
-            index = model.mapToSource(proxy_index)
-            rows = index.internalPointer()
-            column = index.column()
-            self.context_menu_selection = (rows, column)
+            rows = model.get_position(proxy_index)
+            self.context_menu_selection = (rows, proxy_index.column())
 
     @Slot(QModelIndex)
     def _item_expanded(self, index: QModelIndex) -> None:
         r"""Set the given index as expanded."""
         model = self.model()
         if isinstance(model, TreeItemModel):
-            rows = model.mapToSource(index).internalPointer()
+            rows = model.get_position(index)
             model.source_model.items.set_expanded(rows[-1], True, rows[:-1])
 
     @Slot(QModelIndex)
@@ -237,5 +243,5 @@ class _TreeView(QTreeView):
         r"""Set the given index as collapsed."""
         model = self.model()
         if isinstance(model, TreeItemModel):
-            rows = model.mapToSource(index).internalPointer()
+            rows = model.get_position(index)
             model.source_model.items.set_expanded(rows[-1], False, rows[:-1])
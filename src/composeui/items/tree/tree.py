@@ -83,37 +83,41 @@ def export_clicked(*, view: AnyTreeView, main_view: MainView, model: AnyModel) -
 def add_clicked(*, view: AnyTreeView, model: AnyModel) -> None:
     r"""Add an item in the table."""
     if view.items is not None:
-        selected_positions = view.items.get_selected_positions()
-        parent_rows: Sequence[int]
-        if len(selected_positions) > 0:
-            parent_rows = selected_positions[-1]
-        else:
-            parent_rows = ()
-        if len(parent_rows) == (view.items.depth + 1):
-            *parent_rows, row = parent_rows
-        else:
-            row = view.items.get_nb_rows(parent_rows) - 1
-        with model.record_history():
-            position = view.items.insert(row + 1, tuple(parent_rows))
-            view.items.set_expanded(row + 1, True, tuple(parent_rows))
-        # update the pagination
-        # update the current page size to get the correct current page
-        # the update of the current page need to be done before the update of the table
-        # to display the correct rows for the new current page
-        pagination.update_current_page_size(view=view.pagination_view, parent_view=view)
-        if position is not None:
-            view.items.page_navigator.set_current_page_from_row(position[0])
-        elif len(parent_rows) > 0:
-            view.items.page_navigator.set_current_page_from_row(parent_rows[0])
-        else:
-            view.items.page_navigator.set_current_page_from_row(row + 1)
-        # update the tree
-        tools.update_view_with_dependencies(view)
-        # update the selection
-        if position is not None and position != ():
-            view.items.set_selected_positions([tuple(position)])
-        else:
-            view.items.set_selected_positions(selected_positions)
+        with tools.batch_updates():
+            selected_positions = view.items.get_selected_positions()
+            parent_rows: Sequence[int]
+            if len(selected_positions) > 0:
+                parent_rows = selected_positions[-1]
+            else:
+                parent_rows = ()
+            if len(parent_rows) == (view.items.depth + 1):
+                *parent_rows, row = parent_rows
+            else:
+                row = view.items.get_nb_rows(parent_rows) - 1
+            with model.record_history():
+                model.notify_change()
+                position = view.items.insert(row + 1, tuple(parent_rows))
+                view.items.set_expanded(row + 1, True, tuple(parent_rows))
+            # update the pagination
+            # update the current page size to get the correct current page
+            # the update of the current page need to be done before the update of the table
+            # to display the correct rows for the new current page
+            pagination.update_current_page_size(view=view.pagination_view, parent_view=view)
+            if position is not None:
+                view.items.page_navigator.set_current_page_from_row(position[0])
+            elif len(parent_rows) > 0:
+                view.items.page_navigator.set_current_page_from_row(parent_rows[0])
+            else:
+                view.items.page_navigator.set_current_page_from_row(row + 1)
+            # update the tree
+            tools.update_view_with_dependencies(view)
+            # the view must be updated before its selection
+            tools.flush_updates()
+            # update the selection
+            if position is not None and position != ():
+                view.items.set_selected_positions([tuple(position)])
+            else:
+                view.items.set_selected_positions(selected_positions)
 
 
 def remove_clicked(*, view: AnyTreeView, main_view: MainView, model: AnyModel) -> None:
@@ -122,48 +126,54 @@ def remove_clicked(*, view: AnyTreeView, main_view: MainView, model: AnyModel) -
         view.items.get_confirmation_message() == ""
         or tools.ask_confirmation(main_view, view.items.get_confirmation_message())
     ):
-        position: Optional[Tuple[int, ...]] = None
-        positions: Dict[Sequence[int], List[int]] = defaultdict(list)
-        parent_rows: Sequence[int]
-        for *parent_rows, row in sorted(
-            view.items.get_selected_positions(), key=lambda p: len(p), reverse=True
-        ):
-            positions[tuple(parent_rows)].append(row)
-        with model.record_history():
-            for parent_rows, rows in positions.items():
-                for row in sorted(rows, reverse=True):
-                    position = view.items.remove(row, tuple(parent_rows))
-        # remove the selection to force the update of the current indices
-        # of the linked tables
-        view.items.set_selected_positions([])
-        # update the pagination
-        # update the current page size to get the correct current page
-        # the update of the current page need to be done before the update of the table
-        # to display the correct rows for the new current page
-        pagination.update_current_page_size(view=view.pagination_view, parent_view=view)
-        if position is not None:
-            view.items.page_navigator.set_current_page_from_row(position[0])
-        else:
-            view.items.page_navigator.set_current_page_from_row(0)
-        # update the tree
-        tools.update_view_with_dependencies(view)
-        # select eventually the position given by the remove method
-        if position is not None:
-            view.items.set_selected_positions([position])
+        with tools.batch_updates():
+            position: Optional[Tuple[int, ...]] = None
+            positions: Dict[Sequence[int], List[int]] = defaultdict(list)
+            parent_rows: Sequence[int]
+            for *parent_rows, row in sorted(
+                view.items.get_selected_positions(), key=lambda p: len(p), reverse=True
+            ):
+                positions[tuple(parent_rows)].append(row)
+            with model.record_history():
+                model.notify_change()
+                for parent_rows, rows in positions.items():
+                    for row in sorted(rows, reverse=True):
+                        position = view.items.remove(row, tuple(parent_rows))
+            # remove the selection to force the update of the current indices
+            # of the linked tables
+            view.items.set_selected_positions([])
+            # update the pagination
+            # update the current page size to get the correct current page
+            # the update of the current page need to be done before the update of the table
+            # to display the correct rows for the new current page
+            pagination.update_current_page_size(view=view.pagination_view, parent_view=view)
+            if position is not None:
+                view.items.page_navigator.set_current_page_from_row(position[0])
+            else:
+                view.items.page_navigator.set_current_page_from_row(0)
+            # update the tree
+            tools.update_view_with_dependencies(view)
+            # the view must be updated before its selection
+            tools.flush_updates()
+            # select eventually the position given by the remove method
+            if position is not None:
+                view.items.set_selected_positions([position])
 
 
 def clear_items(*, view: AnyTreeView, model: AnyModel) -> None:
     """Clear the data of the selected items."""
     items = view.items
     if items is not None:
-        selected_items = view.selected_items
-        with model.record_history():
-            for rows, columns in selected_items.items():
-                for column in columns:
-                    row = rows[-1]
-                    parent_rows = rows[:-1]
-                    items.set_data(row, column, "", parent_rows)
-        tools.update_view_with_dependencies(view)
+        with tools.batch_updates():
+            selected_items = view.selected_items
+            with model.record_history():
+                model.notify_change()
+                for rows, columns in selected_items.items():
+                    for column in columns:
+                        row = rows[-1]
+                        parent_rows = rows[:-1]
+                        items.set_data(row, column, "", parent_rows)
+            tools.update_view_with_dependencies(view)
 
 
 def check_all_items(*, view: AnyTreeView, model: AnyModel) -> None:
@@ -171,12 +181,18 @@ def check_all_items(*, view: AnyTreeView, model: AnyModel) -> None:
     # TODO: Update to manage the trees properly
     items = view.items
     if items is not None:
-        nb_rows = items.get_nb_rows()
-        nb_columns = items.get_nb_columns()
-        with model.record_history():
-            for column in range(nb_columns):
-                if all(items.is_checked(row, column) is not None for row in range(nb_rows)):
-                    all_checked = all(items.is_checked(row, column) for row in range(nb_rows))
-                    for row in range(nb_rows):
-                        items.set_checked(row, column, not all_checked)
-        tools.update_view_with_dependencies(view)
+        with tools.batch_updates():
+            nb_rows = items.get_nb_rows()
+            nb_columns = items.get_nb_columns()
+            with model.record_history():
+                model.notify_change()
+                for column in range(nb_columns):
+                    if all(
+                        items.is_checked(row, column) is not None for row in range(nb_rows)
+                    ):
+                        all_checked = all(
+                            items.is_checked(row, column) for row in range(nb_rows)
+                        )
+                        for row in range(nb_rows):
+                            items.set_checked(row, column, not all_checked)
+            tools.update_view_with_dependencies(view)
@@ -50,5 +50,7 @@ def display_cancelling_text(view: ProgressPopupView) -> None:
     tasks = view.tasks
     if tasks is not None:
         view.label_text = (
-            "Can't cancel a running task ..." if tasks.is_sequential else "Cancelling ..."
+            "Can't cancel a running task ..."
+            if tasks.is_sequential and not tasks.reports_progress
+            else "Cancelling ..."
         )
@@ -6,7 +6,7 @@ import shutil
 import tarfile
 import tempfile
 from pathlib import Path
-from typing import Generator, List, Optional
+from typing import Generator, List, Optional, Set
 
 
 class BaseModel:
@@ -156,6 +156,26 @@ class BaseModel:
             if history is not None:
                 history.redo()
 
+    def get_modified_data_sources(self) -> Optional[Set[str]]:
+        """Get the data sources modified by the last undo/redo of the stores.
+
+        Return None if they are unknown for one of the stores.
+        """
+        modified_data_sources: Set[str] = set()
+        for store in self.stores:
+            history = store.get_history()
+            if history is not None:
+                store_data_sources = history.get_modified_data_sources()
+                if store_data_sources is None:
+                    return None
+                modified_data_sources.update(store_data_sources)
+        return modified_data_sources
+
+    def notify_change(self) -> None:
+        """Notify the stores that their data have been modified."""
+        for store in self.stores:
+            store.notify_change()
+
     @contextlib.contextmanager
     def record_history(self) -> Generator[None, None, None]:
         self.start_recording_history()
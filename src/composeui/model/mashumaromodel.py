@@ -9,9 +9,14 @@ from typing import Generic
 
 class MashumaroModel(BaseModel, Generic[AnyMashumaroDataClass]):
     def __init__(
-        self, app_name: str, version: str, root: AnyMashumaroDataClass, is_debug: bool = False
+        self,
+        app_name: str,
+        version: str,
+        root: AnyMashumaroDataClass,
+        is_debug: bool = False,
+        track_changes: bool = False,
     ) -> None:
-        self._data = MashumaroStore(root)
+        self._data = MashumaroStore(root, track_changes)
         super().__init__(app_name, version, self._data, is_debug=is_debug)
 
     @property
@@ -16,8 +16,9 @@ class MsgspecModel(BaseModel, Generic[AnyMsgspecStruct]):
         version: str,
         root: AnyMsgspecStruct,
         is_debug: bool = False,
+        track_changes: bool = False,
     ) -> None:
-        self._data = MsgspecStore(root)
+        self._data = MsgspecStore(root, track_changes)
         super().__init__(app_name, version, self._data, is_debug=is_debug)
 
     @property
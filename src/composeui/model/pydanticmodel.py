@@ -7,9 +7,14 @@ from typing import Generic
 
 class PydanticModel(BaseModel, Generic[AnyPydanticBaseModel]):
     def __init__(
-        self, app_name: str, version: str, root: AnyPydanticBaseModel, is_debug: bool = False
+        self,
+        app_name: str,
+        version: str,
+        root: AnyPydanticBaseModel,
+        is_debug: bool = False,
+        track_changes: bool = False,
     ) -> None:
-        self._data = PydanticStore(root)
+        self._data = PydanticStore(root, track_changes)
         super().__init__(app_name, version, self._data, is_debug=is_debug)
 
     @property
@@ -22,6 +22,14 @@ class AbstractStore(ABC):
     def set_debug_mode(self, is_debug: bool) -> None:
         """Set the status of the debug mode."""
 
+    def notify_change(self) -> None:
+        """Notify the store that its data have been modified.
+
+        It is used by the stores tracking their changes to know if the data have been modified
+        without comparing them. By default the method does nothing.
+        """
+        return None
+
     @abstractmethod
     def clear_study(self) -> None:
         """Clear all the data."""
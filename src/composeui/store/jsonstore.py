@@ -4,19 +4,42 @@ from composeui.history.abstracthistory import AbstractHistory
 from composeui.history.jsonhistory import JsonHistory
 from composeui.store.abstractstore import AbstractStore
 
+import json
 from abc import abstractmethod
 from pathlib import Path
-from typing import Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 
 T = TypeVar("T")
 
 
 class JsonStore(AbstractStore, Generic[T]):
-    def __init__(self, root: T) -> None:
+    """Store the data in a root that can be serialized into json.
+
+    If `track_changes` is True, the modifications of the root need to be notified using
+    notify_change. The history then uses the version of the root to know if the root has been
+    modified without comparing the states of the root. The slots of the forms and the items
+    notify the modifications they do.
+    """
+
+    def __init__(self, root: T, track_changes: bool = False) -> None:
         self.root = root
         self._is_debug = False
+        self._track_changes = track_changes
+        self._version = 0
         self._history = JsonHistory(self)
 
+    @property
+    def track_changes(self) -> bool:
+        return self._track_changes
+
+    def get_version(self) -> int:
+        """Get the version of the root incremented at each notified modification."""
+        return self._version
+
+    def notify_change(self) -> None:
+        """Notify the store that the root has been modified."""
+        self._version += 1
+
     def get_extension(self) -> str:
         return ".json"
 
@@ -50,3 +73,11 @@ class JsonStore(AbstractStore, Generic[T]):
 
     @abstractmethod
     def to_json(self) -> str: ...
+
+    def to_builtins(self) -> Any:
+        """Convert the root into json compatible builtin types (dict, list, str, ...).
+
+        By default the root is serialized into json and decoded, reimplement it when the
+        library can convert the root directly.
+        """
+        return json.loads(self.to_json())
@@ -3,6 +3,8 @@
 from composeui.commontypes import AnyMashumaroDataClass
 from composeui.store.jsonstore import JsonStore
 
+from typing import Any
+
 
 class MashumaroStore(JsonStore[AnyMashumaroDataClass]):
 
@@ -16,3 +18,6 @@ class MashumaroStore(JsonStore[AnyMashumaroDataClass]):
 
     def to_json(self) -> str:
         return str(self.root.to_json())
+
+    def to_builtins(self) -> Any:
+        return self.root.to_dict()
@@ -3,6 +3,8 @@ from composeui.store.jsonstore import JsonStore
 
 import msgspec
 
+from typing import Any
+
 
 class MsgspecStore(JsonStore[AnyMsgspecStruct]):
     # - The root is a msgspec struct that contains all the data in the study
@@ -24,3 +26,6 @@ class MsgspecStore(JsonStore[AnyMsgspecStruct]):
     def to_json(self) -> str:
         encoder = msgspec.json.Encoder()
         return encoder.encode(self.root).decode()
+
+    def to_builtins(self) -> Any:
+        return msgspec.to_builtins(self.root, str_keys=True)
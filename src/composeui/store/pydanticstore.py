@@ -1,6 +1,8 @@
 from composeui.commontypes import AnyPydanticBaseModel
 from composeui.store.jsonstore import JsonStore
 
+from typing import Any
+
 
 class PydanticStore(JsonStore[AnyPydanticBaseModel]):
     # - The root is a pydantic BaseModel that contains all the data in the study
@@ -29,3 +31,9 @@ class PydanticStore(JsonStore[AnyPydanticBaseModel]):
             return self.root.model_dump_json()
         except AttributeError:  # old version
             return self.root.json()
+
+    def to_builtins(self) -> Any:
+        try:
+            return self.root.model_dump(mode="json")
+        except AttributeError:  # old version
+            return super().to_builtins()
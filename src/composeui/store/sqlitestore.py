@@ -12,11 +12,18 @@ import sys
 import tempfile
 import warnings
 from pathlib import Path
-from typing import Generator, List, Optional, Sequence
+from typing import Dict, Generator, Iterable, List, Optional, Sequence
 
 
 class SqliteStore(AbstractStore):
-    """Managing state using sqlite3 python db api interface."""
+    """Managing state using sqlite3 python db api interface.
+
+    The modifications of the tables are notified using notify_table_change. The items caching
+    the content of a table use the version of the table to know if their cache is outdated.
+    The undo/redo and the opening of a study notify the tables they modify.
+    The writes done directly with get_connection outside of the items must be notified too,
+    otherwise the items keep showing their cached rows and ROWIDs.
+    """
 
     def __init__(
         self,
@@ -36,10 +43,14 @@ class SqliteStore(AbstractStore):
         if filepath is not None:
             self._filepath = Path(filepath).resolve()
         self._tmp_sqlite_filepath: Optional[Path] = None
+        self._version = 0
+        self._reset_version = 0
+        self._table_versions: Dict[str, int] = {}
         self.new_study()
 
     @contextlib.contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Get a connection of the pool, the modified tables must be notified after commit."""
         if self._pool.empty():
             self._pool.put(self.create_connection())
         db_conn = self._pool.get()
@@ -55,6 +66,26 @@ class SqliteStore(AbstractStore):
         """Get the manager of the undo/redo of the history of the store."""
         return self._history
 
+    def get_table_version(self, table: Optional[str] = None) -> int:
+        """Get the version of the given table or of the whole database if table is None."""
+        if table is None:
+            return self._version
+        return max(self._reset_version, self._table_versions.get(table.lower(), 0))
+
+    def notify_table_change(self, tables: Optional[Iterable[str]] = None) -> int:
+        """Notify the store that the given tables have been modified and get the new version.
+
+        If tables is None, all the tables are considered modified.
+        """
+        self._version += 1
+        if tables is None:
+            self._reset_version = self._version
+            self._table_versions.clear()
+        else:
+            for table in tables:
+                self._table_versions[table.lower()] = self._version
+        return self._version
+
     def get_filepath(self) -> Path:
         if self._filepath is not None:
             return self._filepath
@@ -71,10 +102,12 @@ class SqliteStore(AbstractStore):
     def clear_study(self) -> None:
         r"""Clear all the datas."""
         self.close_pool()
+        self.notify_table_change()
 
     def new_study(self) -> None:
         self.create_pool()
         self.create_tables()
+        self.notify_table_change()
 
     def save_study(self, filepath: Path) -> None:
         """Save the current study using the specific format."""
@@ -82,6 +115,9 @@ class SqliteStore(AbstractStore):
         with contextlib.closing(
             sqlite3.connect(str(filepath), check_same_thread=False)
         ) as filepath_con:
+            if self._history is not None:
+                # the saved file doesn't contain the actions exceeding the capacity
+                self._history.flush_compaction()
             self.commit_pool()  # ensure all the transactions are commited before backup
             with self.get_connection() as db_conn:
                 if sys.version_info >= (3, 7, 0):  # noqa: UP036
@@ -115,6 +151,7 @@ class SqliteStore(AbstractStore):
                 ),
                 stacklevel=2,
             )
+        self.notify_table_change()
 
     def create_pool(self) -> None:
         self.close_pool()
@@ -128,6 +165,8 @@ class SqliteStore(AbstractStore):
         self._pool.put(self.create_connection())
 
     def close_pool(self) -> None:
+        if self._history is not None:
+            self._history.clear_history()
         while not self._pool.empty():
             db_conn = self._pool.get()
             db_conn.close()
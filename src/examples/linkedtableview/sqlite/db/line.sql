@@ -13,3 +13,7 @@ CREATE TABLE IF NOT EXISTS point(
     y REAL NOT NULL DEFAULT 0.0,
     z REAL NOT NULL DEFAULT 0.0
 );
+
+CREATE INDEX IF NOT EXISTS line_index ON line(l_index);
+
+CREATE INDEX IF NOT EXISTS point_line_index ON point(l_id, p_index);
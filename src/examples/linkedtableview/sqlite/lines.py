@@ -5,7 +5,7 @@ from composeui.items.table.tableview import TableView
 from composeui.items.tree.treeview import ExportTreeOptions
 from composeui.store.sqlitestore import SqliteStore
 
-from typing import TYPE_CHECKING, Any, Generator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:
     from examples.linkedtableview.sqlite.app import Model
@@ -44,6 +44,27 @@ class LinesQuery:
             db_conn.commit()
         return cursor.lastrowid
 
+    def insert_lines(self, index: int, count: int) -> None:
+        """Insert count lines at the given index in one transaction."""
+        with self._data.get_connection() as db_conn:
+            # to keep the lines sorted
+            db_conn.execute(
+                "UPDATE line SET l_index=l_index+:count WHERE l_index >= :l_index",
+                {"l_index": index, "count": count},
+            )
+            db_conn.executemany(
+                "INSERT INTO line(l_index) VALUES(:l_index)",
+                [{"l_index": l_index} for l_index in range(index, index + count)],
+            )
+            db_conn.execute(
+                """--sql
+                UPDATE line SET l_name='line ' || l_id
+                WHERE l_index >= :l_index AND l_index < :l_index + :count
+                """,
+                {"l_index": index, "count": count},
+            )
+            db_conn.commit()
+
     def remove_line(self, line_index: int) -> None:
         """Remove the line at the given index."""
         with self._data.get_connection() as db_conn:
@@ -62,6 +83,18 @@ class LinesQuery:
             db_conn.execute("DELETE FROM line")
             db_conn.commit()
 
+    def set_line_names(self, line_index: int, names: List[str]) -> None:
+        """Set the names of the lines from the given index in one transaction."""
+        with self._data.get_connection() as db_conn:
+            db_conn.executemany(
+                "UPDATE line SET l_name=:l_name WHERE l_index=:l_index",
+                [
+                    {"l_index": l_index, "l_name": name}
+                    for l_index, name in enumerate(names, start=line_index)
+                ],
+            )
+            db_conn.commit()
+
     def count_lines(self) -> int:
         """Get the number of lines."""
         with self._data.get_connection() as db_conn:
@@ -136,6 +169,37 @@ class LinesQuery:
             db_conn.commit()
         return cursor.lastrowid
 
+    def append_points(self, line_index: int, points: List[Dict[str, Any]]) -> None:
+        """Append the points given by their name and coordinates in one transaction.
+
+        The points with a None name are named after their id like the inserted points.
+        """
+        line_id = self.get_line_id(line_index)
+        index = self.count_points(line_index)
+        with self._data.get_connection() as db_conn:
+            db_conn.executemany(
+                """--sql
+                INSERT INTO point(l_id, p_index, p_name, x, y, z)
+                VALUES(:l_id, :p_index, COALESCE(:p_name, 'point'), :x, :y, :z)
+                """,
+                [
+                    {"l_id": line_id, "p_index": p_index, **point}
+                    for p_index, point in enumerate(points, start=index)
+                ],
+            )
+            db_conn.executemany(
+                """--sql
+                UPDATE point SET p_name='point ' || p_id
+                WHERE l_id=:l_id AND p_index=:p_index
+                """,
+                [
+                    {"l_id": line_id, "p_index": p_index}
+                    for p_index, point in enumerate(points, start=index)
+                    if point["p_name"] is None
+                ],
+            )
+            db_conn.commit()
+
     def remove_point(self, line_index: int, index: int) -> None:
         """Remove the point at the given index."""
         l_id = self.get_line_id(line_index)
@@ -320,6 +384,10 @@ class LinesItems(AbstractTableItems["Model"]):
         self._model.lines_query.insert_line(row)
         return row
 
+    def insert_rows(self, row: int, count: int) -> Optional[int]:
+        self._model.lines_query.insert_lines(row, count)
+        return row
+
     def _remove_by_id(self, rid: Any) -> None:
         row = self.get_row_from_id(rid)
         self._model.lines_query.remove_line(row)
@@ -346,6 +414,21 @@ class LinesItems(AbstractTableItems["Model"]):
             return True
         return False
 
+    def set_block(
+        self, row_start: int, columns: Sequence[int], values: Sequence[Sequence[Any]]
+    ) -> List[Tuple[int, int]]:
+        invalid_items: List[Tuple[int, int]] = []
+        for column, column_values in zip(columns, values):
+            if column == 0:
+                self._model.lines_query.set_line_names(
+                    row_start, [str(value) for value in column_values]
+                )
+            else:
+                invalid_items.extend(
+                    (row, column) for row in range(row_start, row_start + len(column_values))
+                )
+        return invalid_items
+
 
 class PointsItems(AbstractTableItems["Model"]):
     def __init__(self, view: TableView["PointsItems"], model: "Model") -> None:
@@ -446,6 +529,32 @@ class PointsItems(AbstractTableItems["Model"]):
                 return True
         return False
 
+    def append_detail_block(
+        self,
+        master_items: AbstractTableItems[Any],
+        master_row: int,
+        columns: Sequence[int],
+        values: Sequence[Sequence[Any]],
+    ) -> List[Tuple[int, int]]:
+        """Append the points to the given line without selecting it."""
+        nb_points = len(values[0]) if len(values) > 0 else 0
+        points: List[Dict[str, Any]] = [
+            {"p_name": None, "x": 0.0, "y": 0.0, "z": 0.0} for _ in range(nb_points)
+        ]
+        invalid_items: List[Tuple[int, int]] = []
+        for column, column_values in zip(columns, values):
+            for index, value in enumerate(column_values):
+                if column == 0:
+                    points[index]["p_name"] = str(value)
+                    continue
+                float_value = self.to_float_value(value, 0.0) if 1 <= column <= 3 else None
+                if float_value is None:
+                    invalid_items.append((index, column))
+                else:
+                    points[index]["xyz"[column - 1]] = float_value
+        self._model.lines_query.append_points(master_row, points)
+        return invalid_items
+
     def get_delegate_props(
         self, column: int, *, row: Optional[int] = None
     ) -> Optional[DelegateProps]:
@@ -352,9 +352,11 @@ class LinesItems(AbstractTreeItems["Model"]):
     def insert(self, row: int, parent_rows: Tuple[int, ...] = ()) -> Optional[Tuple[int, ...]]:
         if len(parent_rows) == 0:
             self._model.lines_query.insert_line(row)
+            self.notify_row_inserted(row)
             return (row,)
         elif len(parent_rows) == 1:
             self._model.lines_query.insert_point(parent_rows[0], row)
+            self.notify_row_inserted(row, parent_rows)
             return (*parent_rows, row)
         else:
             return ()
@@ -362,8 +364,10 @@ class LinesItems(AbstractTreeItems["Model"]):
     def remove(self, row: int, parent_rows: Tuple[int, ...] = ()) -> Optional[Tuple[int, ...]]:
         if len(parent_rows) == 0:
             self._model.lines_query.remove_line(row)
+            self.notify_row_removed(row)
         elif len(parent_rows) == 1:
             self._model.lines_query.remove_point(parent_rows[0], row)
+            self.notify_row_removed(row, parent_rows)
         return super().remove(row, parent_rows)
 
     def get_data(self, row: int, column: int, parent_rows: Tuple[int, ...] = ()) -> str:
@@ -1,3 +1,7 @@
+from composeui.core.tasks.abstracttask import TaskStatus
+from composeui.items.core.views.itemsview import FormatExtension
+from composeui.items.linkedtable import linkedtable
+from composeui.items.linkedtable.importfilelinkedtabletask import ImportFileLinkedTableTask
 from composeui.items.linkedtable.linkedtableview import LinkedTableView
 from composeui.items.tree.treeview import ExportTreeOptions
 from examples.linkedtableview.sqlite.app import LinkedTableViewApp, Model
@@ -8,7 +12,7 @@ import pytest
 
 import sys
 from pathlib import Path
-from typing import Tuple
+from typing import List, Tuple
 from unittest.mock import patch
 
 
@@ -230,6 +234,121 @@ def test_import(
     assert points_items.get_nb_rows() == 1
 
 
+def test_import_by_chunks(
+    lines_items: LinesItems,
+    points_items: PointsItems,
+    tmp_path: Path,
+) -> None:
+    # the points of a line are not consecutive and are split between the chunks
+    filepath = Path(tmp_path, "lines.csv")
+    filepath.write_text(
+        "Name;Name;X;Y;Z\n"
+        "line a;p1;1.0;0.0;0.0\n"
+        "line b;p2;2.0;0.0;0.0\n"
+        "line a;p3;3.0;0.0;0.0\n"
+        "line b;p4;zzz;0.0;0.0\n"
+        "line a;p5;5.0;0.0;0.0\n"
+    )
+    task = ImportFileLinkedTableTask(
+        lines_items, points_items, filepath, True, FormatExtension.CSV
+    )
+    task.chunk_size = 2
+    assert task.run()
+    assert "Failed to set 'zzz'" in task.warning_message
+    assert lines_items.get_nb_rows() == 2
+    lines_items.set_selected_rows([0])
+    assert lines_items.get_data(0, 0) == "line a"
+    assert [points_items.get_data(row, 0) for row in range(3)] == ["p1", "p3", "p5"]
+    assert [points_items.get_edit_data(row, 1) for row in range(3)] == [1.0, 3.0, 5.0]
+    lines_items.set_selected_rows([1])
+    assert lines_items.get_data(1, 0) == "line b"
+    assert [points_items.get_data(row, 0) for row in range(2)] == ["p2", "p4"]
+
+
+def test_append_detail_block(
+    lines_items: LinesItems, points_items: PointsItems, model: Model
+) -> None:
+    # the points without a name are named after their id
+    assert points_items.append_detail_block(lines_items, 0, [1], [[1.0, 2.0]]) == []
+    # a point can be named "point" like the default name
+    assert points_items.append_detail_block(lines_items, 0, [0, 1], [["point"], ["x"]]) == [
+        (0, 1)
+    ]
+    point_ids = [model.lines_query.get_point_id(0, row) for row in range(3)]
+    assert [model.lines_query.get_point_name(0, row) for row in range(3)] == [
+        f"point {point_ids[0]}",
+        f"point {point_ids[1]}",
+        "point",
+    ]
+    assert [model.lines_query.get_x(0, row) for row in range(3)] == [1.0, 2.0, 0.0]
+    # the points are appended to the given master row without changing its selection
+    assert lines_items.get_selected_rows() == []
+    assert model.lines_query.count_points(1) == 4
+
+
+def test_import_progress_and_cancel(
+    lines_items: LinesItems,
+    points_items: PointsItems,
+    model: Model,
+    tmp_path: Path,
+) -> None:
+    filepath = Path(tmp_path, "lines.csv")
+    filepath.write_text(
+        "Name;Name;X;Y;Z\n" + "".join(f"line {i};p{i};1.0;0.0;0.0\n" for i in range(5))
+    )
+    task = ImportFileLinkedTableTask(
+        lines_items, points_items, filepath, True, FormatExtension.CSV
+    )
+    task.chunk_size = 2
+    progresses: List[float] = []
+    task.set_progress_callback(lambda: progresses.append(task.progress))
+    assert task.run()
+    assert task.status == TaskStatus.SUCCESS
+    assert len(progresses) == 3
+    assert progresses == sorted(progresses)
+    assert progresses[-1] == 1.0
+    assert lines_items.get_nb_rows() == 5
+    # the import stops after the first chunk if the task is canceled
+    task.set_progress_callback(lambda: setattr(task, "is_canceled", True))
+    with model.record_history():
+        assert not task.run()
+    assert task.status == TaskStatus.CANCELED
+    assert lines_items.get_nb_rows() == 2
+    # the rows imported before the cancellation are undone
+    assert task.is_partially_imported
+    linkedtable.undo_partial_import(task, model)
+    assert lines_items.get_nb_rows() == 5
+
+
+def test_import_bad_file_by_chunks(
+    lines_items: LinesItems,
+    points_items: PointsItems,
+    model: Model,
+    tmp_path: Path,
+) -> None:
+    # the string of the last row is not closed, the chunks read before are imported
+    filepath = Path(tmp_path, "lines.csv")
+    filepath.write_text(
+        "Name;Name;X;Y;Z\n"
+        + "".join(f"line {i};p{i};1.0;0.0;0.0\n" for i in range(4))
+        + '"line 4;p4;1.0;0.0;0.0\n'
+    )
+    task = ImportFileLinkedTableTask(
+        lines_items, points_items, filepath, True, FormatExtension.CSV
+    )
+    task.chunk_size = 2
+    with model.record_history():
+        assert not task.run()
+    assert task.status == TaskStatus.FAILED
+    assert task.is_partially_imported
+    assert "after importing 4 master row(s)" in task.error_message
+    assert lines_items.get_nb_rows() == 4
+    # the partial import is undone with the history
+    linkedtable.undo_partial_import(task, model)
+    assert lines_items.get_nb_rows() == 2
+    assert model.lines_query.count_points(1) == 4
+
+
 def test_import_and_remove_all(
     linked_table: LinkedTableView[LinesItems, PointsItems],
     lines_items: LinesItems,
@@ -32,6 +32,29 @@ def test_get_conversion_id_row(items: PointsItems) -> None:
     assert items.get_row_from_id(1) == 1
 
 
+def test_conversion_id_row_after_move_and_remove(items: PointsItems) -> None:
+    """Test the mapping between the row ids and the rows is kept after a move/remove."""
+    for row in range(4):
+        items.insert(row)
+    assert [items.get_id_from_row(row) for row in range(4)] == [1, 2, 3, 4]
+    # move point 1 to the end
+    assert items.move(0, 3)
+    assert [items.get_id_from_row(row) for row in range(4)] == [2, 3, 4, 1]
+    assert [items.get_row_from_id(rid) for rid in range(1, 5)] == [3, 0, 1, 2]
+    assert items.get_data(3, 0) == "point 1"
+    # remove point 3
+    items.remove(1)
+    assert [items.get_id_from_row(row) for row in range(3)] == [2, 4, 1]
+    assert [items.get_row_from_id(rid) for rid in (2, 4, 1)] == [0, 1, 2]
+    with pytest.raises(IndexError):
+        items.get_row_from_id(3)
+    with pytest.raises(IndexError):
+        items.get_id_from_row(3)
+    # the mapping is the same after a rebuild of the cache
+    items.update_cache()
+    assert [items.get_id_from_row(row) for row in range(3)] == [2, 4, 1]
+
+
 def test_row_count(items: PointsItems) -> None:
     assert items.get_nb_rows() == 0
     items.insert(0)
@@ -0,0 +1,131 @@
+"""Test the connection and the call of the callbacks of a BaseSignal."""
+
+from composeui.core.basesignal import (
+    SIGNAL_LOGGER,
+    BaseSignal,
+    _get_signature_parameters,
+    _is_coroutine_callback,
+)
+
+import pytest
+
+import logging
+import sys
+from functools import partial
+from typing import Any, Callable, List
+
+
+class _View:
+    clicked = BaseSignal()
+
+
+def _append(calls: List[str], name: str) -> Callable[[], None]:
+    def callback() -> None:
+        calls.append(name)
+
+    return callback
+
+
+def _create_emitter() -> Any:
+    QtCore = pytest.importorskip("qtpy.QtCore")  # noqa: N806
+
+    class Emitter(QtCore.QObject):  # type: ignore[misc]
+        triggered = QtCore.Signal()
+
+    return Emitter()
+
+
+def test_signature_parameters() -> None:
+    def callback(view: Any, model: Any, row: int) -> None: ...
+
+    class Slots:
+        def callback(self, view: Any) -> None: ...
+
+    parameters = _get_signature_parameters(callback)
+    assert [parameter.name for parameter in parameters] == ["view", "model", "row"]
+    # the parameters are cached by function
+    assert _get_signature_parameters(callback) is parameters
+    # the bound parameter of a method is removed
+    assert [parameter.name for parameter in _get_signature_parameters(Slots().callback)] == [
+        "view"
+    ]
+    assert [parameter.name for parameter in _get_signature_parameters(partial(callback))] == [
+        "view",
+        "model",
+        "row",
+    ]
+
+
+def test_coroutine_callbacks() -> None:
+    async def async_callback() -> None: ...
+
+    def callback() -> None: ...
+
+    assert _is_coroutine_callback(async_callback)
+    assert _is_coroutine_callback(partial(async_callback))
+    assert not _is_coroutine_callback(callback)
+    # the status of the callbacks is computed once when they are connected
+    signal = BaseSignal()
+    signal.append(callback)
+    signal.insert(0, async_callback)
+    assert signal._is_coroutines == [True, False]  # noqa: SLF001
+    del signal[0]
+    assert signal._is_coroutines == [False]  # noqa: SLF001
+
+
+def test_signal_log(caplog: pytest.LogCaptureFixture) -> None:
+    calls: List[str] = []
+    signal = BaseSignal()
+    signal._name = "clicked"  # noqa: SLF001
+    # without the debug level, the callback is called without the log
+    signal.append(_append(calls, "first"))
+    assert len(signal.callbacks[0].args[0]) == 1  # type: ignore[attr-defined]
+    caplog.set_level(logging.DEBUG, logger=SIGNAL_LOGGER.name)
+    signal.append(_append(calls, "second"))
+    assert len(signal.callbacks[1].args[0]) == 2  # type: ignore[attr-defined]
+    signal()
+    assert calls == ["first", "second"]
+    assert [record.getMessage().count("callback") for record in caplog.records] == [1]
+    assert "clicked" in caplog.records[0].getMessage()
+
+
+def test_qt_slots_order() -> None:
+    emitter = _create_emitter()
+    calls: List[str] = []
+    view = _View()
+    view.clicked.add_qt_signals(emitter.triggered)
+    view.clicked.append(_append(calls, "b"))
+    view.clicked.insert(0, _append(calls, "a"))
+    view.clicked.append(_append(calls, "d"))
+    emitter.triggered.emit()
+    assert calls == ["a", "b", "d"]
+    calls.clear()
+    view.clicked[2] = _append(calls, "c")
+    emitter.triggered.emit()
+    assert calls == ["a", "b", "c"]
+    calls.clear()
+    view.clicked = [_append(calls, "e"), _append(calls, "f")]  # type: ignore[assignment]
+    emitter.triggered.emit()
+    assert calls == ["e", "f"]
+    calls.clear()
+    del view.clicked[0]
+    emitter.triggered.emit()
+    assert calls == ["f"]
+
+
+def test_qt_slots_exception(monkeypatch: pytest.MonkeyPatch) -> None:
+    emitter = _create_emitter()
+    calls: List[str] = []
+    exceptions: List[BaseException] = []
+    monkeypatch.setattr(sys, "excepthook", lambda _, e, __: exceptions.append(e))
+
+    def failing_callback() -> None:
+        raise ValueError("failure")
+
+    signal = BaseSignal()
+    signal.add_qt_signals(emitter.triggered)
+    signal.extend([failing_callback, _append(calls, "next")])
+    # the exception of a slot doesn't prevent the call of the next slots
+    emitter.triggered.emit()
+    assert calls == ["next"]
+    assert [str(e) for e in exceptions] == ["failure"]
@@ -0,0 +1,38 @@
+"""Test the patches computed between json compatible structures."""
+
+from composeui.history import jsondiff
+
+import pytest
+
+import copy
+import json
+from typing import Any
+
+
+@pytest.mark.parametrize(
+    ("source", "target"),
+    [
+        (1, 2),
+        ({"a": 1, "b": [1, 2, 3]}, {"a": 1, "b": [1, 2, 3]}),
+        ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 5], "c": {"d": None}}),
+        ({"a": [{"b": 1}, {"c": 2}]}, {"a": [{"b": 1}, {"c": 3}, {"d": 4}, 5]}),
+        ({"a": 1.0}, {"a": 1}),
+        ({"a": True}, {"a": 1}),
+        ([], {"a": []}),
+    ],
+)
+def test_make_apply_patch(source: Any, target: Any) -> None:
+    patch = jsondiff.make_patch(source, target)
+    assert (len(patch) == 0) is (json.dumps(source) == json.dumps(target))
+    # the patch is saved as json in the history
+    patch = json.loads(json.dumps(patch))
+    state, inverse_patch = jsondiff.apply_patch(copy.deepcopy(source), patch)
+    assert state == target
+    state, _ = jsondiff.apply_patch(state, inverse_patch)
+    assert state == source
+
+
+def test_apply_patch_with_int_keys() -> None:
+    patch = json.loads(json.dumps(jsondiff.make_patch({1: "a", 2: "b"}, {1: "c"})))
+    state, _ = jsondiff.apply_patch({1: "a", 2: "b"}, patch)
+    assert state == {1: "c"}
@@ -0,0 +1,164 @@
+"""Test the undo/redo of the JsonHistory with patches and checkpoints."""
+
+from composeui.history.jsonhistory import JsonHistory
+from composeui.store.msgspecstore import MsgspecStore
+
+import msgspec
+import pytest
+
+from pathlib import Path
+from typing import Dict, List
+
+
+class Root(msgspec.Struct):
+    name: str = ""
+    values: List[int] = msgspec.field(default_factory=list)
+    labels: Dict[int, str] = msgspec.field(default_factory=dict)
+
+
+@pytest.mark.parametrize("checkpoint_interval", [1, 2, 20])
+def test_undo_redo(checkpoint_interval: int, tmpdir: Path) -> None:
+    store = MsgspecStore(Root())
+    store._history = JsonHistory(store, checkpoint_interval)  # noqa: SLF001
+    history = store._history  # noqa: SLF001
+    states = [msgspec.json.encode(store.root)]
+    for index in range(5):
+        history.start_recording()
+        store.root.name = f"name {index}"
+        store.root.values.append(index)
+        store.root.labels[index] = str(index)
+        history.stop_recording()
+        states.append(msgspec.json.encode(store.root))
+    # no modification are not saved
+    history.start_recording()
+    history.stop_recording()
+    for state in reversed(states[:-1]):
+        history.undo()
+        assert msgspec.json.encode(store.root) == state
+    # nothing more to undo
+    history.undo()
+    assert msgspec.json.encode(store.root) == states[0]
+    for state in states[1:3]:
+        history.redo()
+        assert msgspec.json.encode(store.root) == state
+    # the history is kept after a save/open
+    history.save_history(Path(tmpdir, "history.sqlite"))
+    history.open_history(Path(tmpdir, "history.sqlite"))
+    history.undo()
+    assert msgspec.json.encode(store.root) == states[1]
+    for state in states[2:]:
+        history.redo()
+        assert msgspec.json.encode(store.root) == state
+
+
+def test_modifications_without_recording() -> None:
+    store = MsgspecStore(Root())
+    store._history = JsonHistory(store)  # noqa: SLF001
+    history = store._history  # noqa: SLF001
+    history.start_recording()
+    store.root.values.append(1)
+    history.stop_recording()
+    # the modification without recording is not undone with the next action
+    store.root.name = "name"
+    history.start_recording()
+    store.root.labels[1] = "1"
+    history.stop_recording()
+    history.undo()
+    assert store.root == Root(name="name", values=[1])
+    # the modification after the last action is kept by the undo/redo
+    store.root.name = "other name"
+    history.undo()
+    assert store.root == Root(name="other name")
+    history.redo()
+    history.redo()
+    assert store.root == Root(name="other name", values=[1], labels={1: "1"})
+
+
+def test_track_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = MsgspecStore(Root(), track_changes=True)
+    store._history = JsonHistory(store)  # noqa: SLF001
+    history = store._history  # noqa: SLF001
+    history.start_recording()
+    store.root.name = "name"
+    store.notify_change()
+    history.stop_recording()
+    # the root is not serialized for an action without a notified modification
+    with monkeypatch.context() as m:
+        m.setattr(store, "to_builtins", lambda: pytest.fail("the root is serialized"))
+        history.start_recording()
+        history.stop_recording()
+        # the modification not notified is not saved
+        history.start_recording()
+        store.root.values.append(1)
+        history.stop_recording()
+    history.undo()
+    assert store.root == Root()
+    history.redo()
+    assert store.root == Root(name="name")
+
+
+def test_detect_untracked_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = MsgspecStore(Root(), track_changes=True)
+    store._history = JsonHistory(store)  # noqa: SLF001
+    history = store._history  # noqa: SLF001
+    monkeypatch.setattr(history, "detect_untracked_changes", True)
+    history.start_recording()
+    store.root.name = "name"
+    store.notify_change()
+    history.stop_recording()
+    # the modification not notified is also saved
+    history.start_recording()
+    store.root.values.append(1)
+    history.stop_recording()
+    # an action without modification is not saved
+    history.start_recording()
+    history.stop_recording()
+    history.undo()
+    assert store.root == Root(name="name")
+    history.undo()
+    assert store.root == Root()
+    history.redo()
+    assert store.root == Root(name="name")
+    history.redo()
+    assert store.root == Root(name="name", values=[1])
+
+
+def test_capacity(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = MsgspecStore(Root())
+    store._history = JsonHistory(store, checkpoint_interval=4)  # noqa: SLF001
+    history = store._history  # noqa: SLF001
+    monkeypatch.setattr(history, "get_capacity", lambda: 3)
+    for index in range(10):
+        history.start_recording()
+        store.root.values.append(index)
+        history.stop_recording()
+    history._compactor.flush()  # noqa: SLF001
+    with history._history_store.get_connection() as db_conn:  # noqa: SLF001
+        result = db_conn.execute("SELECT idx, state_json FROM _CUI_UNDO_LOG").fetchall()
+    assert [row[0] for row in result] == [8, 9, 10]
+    # the states are compressed
+    assert all(isinstance(row[1], bytes) for row in result)
+    # the free pages are given back to the file system
+    with history._history_store.get_connection() as db_conn:  # noqa: SLF001
+        assert db_conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2  # incremental
+        assert db_conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+    for _ in range(5):
+        history.undo()
+    assert store.root.values == list(range(7))
+
+
+def test_modified_data_sources() -> None:
+    store = MsgspecStore(Root())
+    store._history = JsonHistory(store)  # noqa: SLF001
+    history = store._history  # noqa: SLF001
+    history.start_recording()
+    store.root.values.append(1)
+    store.root.labels[1] = "1"
+    history.stop_recording()
+    history.undo()
+    assert history.get_modified_data_sources() == {"values", "labels"}
+    history.redo()
+    assert history.get_modified_data_sources() == {"values", "labels"}
+    # nothing more to redo
+    history.redo()
+    assert history.get_modified_data_sources() == set()
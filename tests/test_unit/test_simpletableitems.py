@@ -1,6 +1,11 @@
 """Test the SimpleTableItems class without an order column."""
 
+from composeui.core.tasks.abstracttask import TaskStatus
+from composeui.items.core.itemsutils import RowChangeType, get_sort_key
+from composeui.items.core.views.itemsview import FormatExtension
 from composeui.items.simpletable.simpletableitems import SimpleTableItems
+from composeui.items.table import table
+from composeui.items.table.importfiletabletask import ImportFileTableTask
 from composeui.items.table.tableview import TableView
 from composeui.model.sqlitemodel import SqliteModel
 
@@ -60,3 +65,308 @@ def test_convert_row_id(items: SimpleTableItems[Any]) -> None:
     assert items.get_row_from_id(3) == 1
     with pytest.raises(IndexError):
         assert items.get_row_from_id(2)
+
+
+def test_get_data_block(items: SimpleTableItems[Any]) -> None:
+    for row in range(10):
+        items.insert(row)
+        items.set_data(row, 0, f"name {row}")
+    # remove a row to have a gap in the ROWIDs
+    items.remove(2)
+    all_datas = items.get_all_datas()
+    assert items.get_data_block(1, 5, [0, 1]) == [all_datas[0][1:5], all_datas[1][1:5]]
+    assert items.get_data_block(5, 20, [1]) == [all_datas[1][5:]]
+    assert items.get_data_block(20, 30, [0]) == [[]]
+    # same result as the default implementation
+    assert items.get_data_block(0, 9, [1, 0]) == [
+        [items.get_data(row, column) for row in range(9)] for column in (1, 0)
+    ]
+
+
+def test_cache_updated_in_place(items: SimpleTableItems[Any]) -> None:
+    for row in range(5):
+        items.insert(row)
+    items.set_data(1, 0, "first")
+    items.set_data(3, 1, "40")
+    items.remove(2)
+    items.insert(0)
+    assert items.get_cached_data() == items.get_all_datas()
+    assert items.get_cached_data() == [
+        ["", "first", "", "", ""],
+        ["30", "30", "40", "30", "30"],
+    ]
+
+
+def test_insert_rows_and_set_block(items: SimpleTableItems[Any]) -> None:
+    items.insert(0)
+    items.insert_rows(1, 3)
+    assert items.get_nb_rows() == 4
+    # the invalid values are not set
+    assert items.set_block(1, [0, 1], [["a", "b", "c"], [12, "x", 14.0]]) == [(2, 1)]
+    assert items.get_cached_data() == items.get_all_datas()
+    assert items.get_cached_data() == [
+        ["", "a", "b", "c"],
+        ["30", "12", "30", "14"],
+    ]
+    assert items.set_block(3, [1], [["15"]]) == []
+    assert items.get_data(3, 1) == "15"
+    # nothing is set if the block exceeds the rows
+    with pytest.raises(IndexError):
+        items.set_block(3, [0], [["d", "e"]])
+    assert items.get_data(3, 0) == "c"
+    # the values set by id are casted like the blocks
+    assert not items.set_data_by_id(items.get_id_from_row(0), 1, "y")
+    assert items.set_data_by_id(items.get_id_from_row(0), 1, "16")
+    with items._store.get_connection() as db_conn:  # noqa: SLF001
+        assert db_conn.execute("SELECT age FROM test WHERE ROWID=1").fetchone()[0] == 16
+
+
+def test_cache_by_pages(items: SimpleTableItems[Any]) -> None:
+    paged_items = SimpleTableItems(
+        TableView(),
+        items._model,  # noqa: SLF001
+        items._store,  # noqa: SLF001
+        "test",
+        is_read_only=False,
+        page_size=3,
+        max_cached_pages=2,
+    )
+    assert paged_items.get_cached_data() is None
+    for row in range(10):
+        paged_items.insert(row)
+        paged_items.set_data(row, 0, f"name {row}")
+    assert paged_items.get_nb_rows() == 10
+    assert paged_items.get_data_block(0, 10, [0]) == [[f"name {row}" for row in range(10)]]
+    assert len(paged_items._page_cache._pages) == 2  # type: ignore[union-attr]  # noqa: SLF001
+    paged_items.remove(4)
+    paged_items.set_data(7, 1, "12")
+    assert paged_items.get_nb_rows() == 9
+    assert paged_items.get_data_block(2, 9, [0, 1]) == [
+        ["name 2", "name 3", "name 5", "name 6", "name 7", "name 8", "name 9"],
+        ["30", "30", "30", "30", "30", "12", "30"],
+    ]
+    paged_items.update_cache()
+    assert paged_items.get_data_block(0, 9, [0]) == [items.get_all_datas()[0]]
+
+
+def test_row_changes(items: SimpleTableItems[Any], monkeypatch: pytest.MonkeyPatch) -> None:
+    assert items.take_row_changes() == []
+    # the changes are notified by the methods modifying the rows
+    items.insert(0)
+    assert items.set_data(0, 0, "a")
+    # the table has no order column so the row is inserted at the end
+    items.insert(0)
+    items.remove(0)
+    row_changes = items.take_row_changes()
+    assert row_changes is not None
+    assert [(change.change_type, change.row) for change in row_changes] == [
+        (RowChangeType.INSERT, 0),
+        (RowChangeType.DATA, 0),
+        (RowChangeType.INSERT, 1),
+        (RowChangeType.REMOVE, 0),
+    ]
+    assert items.take_row_changes() == []
+    items.insert_rows(1, 2)
+    assert items.set_block(0, [0], [["b", "c"]]) == []
+    row_changes = items.take_row_changes()
+    assert row_changes is not None
+    assert [(change.change_type, change.row) for change in row_changes] == [
+        (RowChangeType.INSERT, 1),
+        (RowChangeType.INSERT, 2),
+        (RowChangeType.DATA, 0),
+        (RowChangeType.DATA, 1),
+    ]
+    # the changes done outside of the items are unknown
+    items._store.notify_table_change(["test"])  # noqa: SLF001
+    items.set_data(0, 0, "d")
+    assert items.take_row_changes() is None
+    # too many changes: the view is fully updated
+    monkeypatch.setattr(SimpleTableItems, "max_row_changes", 2)
+    for _ in range(3):
+        items.remove(0)
+    assert items.take_row_changes() is None
+    assert items.take_row_changes() == []
+
+
+def test_row_changes_as_tree(items: SimpleTableItems[Any]) -> None:
+    tree_items = items.converter()._items  # noqa: SLF001
+    tree_items.insert(0)
+    tree_items.insert(1)
+    tree_items.remove(0)
+    # the tree gets the changes of the table as the changes of the roots
+    row_changes = tree_items.take_row_changes()
+    assert row_changes is not None
+    assert [
+        (change.change_type, change.row, change.parent_rows) for change in row_changes
+    ] == [
+        (RowChangeType.INSERT, 0, ()),
+        (RowChangeType.INSERT, 1, ()),
+        (RowChangeType.REMOVE, 0, ()),
+    ]
+    assert items.take_row_changes() == []
+    tree_items.invalidate_row_changes()
+    assert items.take_row_changes() is None
+
+
+def test_sort_keys(items: SimpleTableItems[Any]) -> None:
+    for row, (name, age) in enumerate([("b", "40"), ("10", "5"), ("a", "12")]):
+        items.insert(row)
+        items.set_data(row, 0, name)
+        items.set_data(row, 1, age)
+    for column in range(items.get_nb_columns()):
+        assert items.get_sort_keys(column) == [
+            get_sort_key(items.get_edit_data(row, column)) for row in range(3)
+        ]
+    # the numbers are sorted by value before the texts
+    assert sorted(range(3), key=items.get_sort_keys(0).__getitem__) == [1, 2, 0]
+    assert sorted(range(3), key=items.get_sort_keys(1).__getitem__) == [1, 2, 0]
+
+
+def test_import_file_by_chunks(items: SimpleTableItems[Any], tmpdir: Path) -> None:
+    pytest.importorskip("pandas")
+    filepath = Path(tmpdir, "table.csv")
+    filepath.write_text("name;age\n" + "".join(f"p{i};{i}\n" for i in range(5)))
+    task = ImportFileTableTask(items, filepath, False, FormatExtension.CSV)
+    task.chunk_size = 2
+    progresses = []
+    task.set_progress_callback(lambda: progresses.append(task.progress))
+    assert task.run()
+    assert task.status == TaskStatus.SUCCESS
+    assert len(progresses) == 3
+    assert progresses[-1] == 1.0
+    assert items.get_all_datas()[0] == [f"p{i}" for i in range(5)]
+    assert not task.is_partially_imported
+    # the import stops after the first chunk if the task is canceled
+    task.set_progress_callback(lambda: setattr(task, "is_canceled", True))
+    model = items._model  # noqa: SLF001
+    with model.record_history():
+        assert not task.run()
+    assert task.status == TaskStatus.CANCELED
+    assert items.get_nb_rows() == 7
+    # the rows imported before the cancellation are undone
+    assert task.is_partially_imported
+    table.undo_partial_import(task, model)
+    assert items.get_nb_rows() == 5
+
+
+def test_import_bad_file_by_chunks(items: SimpleTableItems[Any], tmpdir: Path) -> None:
+    pytest.importorskip("pandas")
+    model = items._model  # noqa: SLF001
+    with model.record_history():
+        items.insert(0)
+    filepath = Path(tmpdir, "table.csv")
+    filepath.write_text("name;age\n" + "".join(f"p{i};{i}\n" for i in range(4)) + '"p4;4\n')
+    task = ImportFileTableTask(items, filepath, True, FormatExtension.CSV)
+    task.chunk_size = 2
+    with model.record_history():
+        assert not task.run()
+    # the string of the last row is not closed, the chunks read before are imported
+    assert task.status == TaskStatus.FAILED
+    assert task.is_partially_imported
+    assert "after importing 4 row(s)" in task.error_message
+    assert items.get_all_datas()[0] == [f"p{i}" for i in range(4)]
+    # the partial import is undone with the history
+    table.undo_partial_import(task, model)
+    assert items.get_nb_rows() == 1
+    # nothing is undone if the file can't be read before the modification of the items
+    filepath.write_text('name;age\n"p0;0\n')
+    with model.record_history():
+        assert not task.run()
+    assert not task.is_partially_imported
+    table.undo_partial_import(task, model)
+    assert items.get_nb_rows() == 1
+
+
+def test_import_truncated_json_file(
+    items: SimpleTableItems[Any], tmpdir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("pandas")
+    model = items._model  # noqa: SLF001
+    filepath = Path(tmpdir, "table.json")
+    records = [f'{{"name": "p{i}", "age": {i}}}' for i in range(4)]
+    filepath.write_text("[" + ", ".join(records) + ', {"name": "p4"')
+    task = ImportFileTableTask(items, filepath, False, FormatExtension.JSON)
+    task.chunk_size = 2
+    with model.record_history():
+        assert not task.run()
+    # the list is not closed, the chunks read before are imported
+    assert task.status == TaskStatus.FAILED
+    assert task.is_partially_imported
+    assert "after importing 4 row(s)" in task.error_message
+    table.undo_partial_import(task, model)
+    assert items.get_nb_rows() == 0
+    # the import is undone if the items fail to set the values too
+    filepath.write_text("[" + ", ".join(records) + "]")
+    set_block = items.set_block
+
+    def fail_after_first_block(*args: Any) -> Any:
+        monkeypatch.setattr(items, "set_block", lambda *_: 1 / 0)
+        return set_block(*args)
+
+    monkeypatch.setattr(items, "set_block", fail_after_first_block)
+    with model.record_history():
+        assert not task.run()
+    assert task.status == TaskStatus.FAILED
+    assert task.is_partially_imported
+    assert items.get_nb_rows() == 4
+    table.undo_partial_import(task, model)
+    assert items.get_nb_rows() == 0
+
+
+def test_cache_updated_after_undo_redo(items: SimpleTableItems[Any]) -> None:
+    model = items._model  # noqa: SLF001
+    with model.record_history():
+        items.insert(0)
+        items.insert(1)
+    assert items.get_nb_rows() == 2
+    # the undo is not done by the items and no view updates the cache
+    model.undo()
+    assert items.get_nb_rows() == 0
+    assert items.get_cached_data() == [[], []]
+    with pytest.raises(IndexError):
+        items.get_id_from_row(0)
+    model.redo()
+    assert items.get_nb_rows() == 2
+    assert items.set_data(1, 0, "x")
+    assert items.get_cached_data() == items.get_all_datas()
+    # a modification done outside of the items and notified to the store
+    with items._store.get_connection() as db_conn:  # noqa: SLF001
+        db_conn.execute("DELETE FROM test WHERE name='x'")
+        db_conn.commit()
+    items._store.notify_table_change(["test"])  # noqa: SLF001
+    # the sort keys are given for the rows of the updated cache
+    assert len(items.get_sort_keys(0)) == 1
+    assert list(items._row_ids.get_ids(0, 2)) == [1]  # noqa: SLF001
+    assert items.get_nb_rows() == 1
+    assert items.get_cached_data() == items.get_all_datas()
+
+
+def test_order_column_with_gaps(
+    items: SimpleTableItems[Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = items._store  # noqa: SLF001
+    with store.get_connection() as db_conn:
+        db_conn.execute(
+            "CREATE TABLE ordered(name TEXT DEFAULT '', position INTEGER DEFAULT 0)"
+        )
+        # the positions have gaps and a duplicate
+        db_conn.executemany(
+            "INSERT INTO ordered(name, position) VALUES(?, ?)",
+            [("c", 10), ("a", 0), ("b", 5), ("d", 10), ("e", 42)],
+        )
+        db_conn.commit()
+    monkeypatch.setattr(SimpleTableItems, "max_selected_row_ids", 2)
+    for page_size in (None, 2):
+        ordered_items = SimpleTableItems(
+            TableView(),
+            items._model,  # noqa: SLF001
+            store,
+            "ordered",
+            order_column="position",
+            page_size=page_size,
+        )
+        names = ordered_items.get_all_datas()[0]
+        assert names[:3] == ["a", "b", "c"]
+        assert ordered_items.get_data_block(0, 5, [0]) == [names]
+        assert ordered_items.get_data_block(1, 4, [0]) == [names[1:4]]
+        assert ordered_items.get_edit_data_block(3, 5, [0, 1]) == [names[3:], [10, 42]]
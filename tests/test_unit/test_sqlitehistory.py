@@ -0,0 +1,206 @@
+"""Test the undo/redo of the SqliteHistory."""
+
+from composeui.history.compaction import HistoryCompactor
+from composeui.history.sqlitehistory import SqliteHistory, _group_commands
+from composeui.store.sqlitestore import SqliteStore
+
+import pytest
+
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+
+def get_points(store: SqliteStore) -> List[Tuple[str, float, float]]:
+    with store.get_connection() as db_conn:
+        result = db_conn.execute("SELECT p_name, x, y FROM points ORDER BY p_id").fetchall()
+    return [(str(row[0]), float(row[1]), float(row[2])) for row in result]
+
+
+def test_undo_redo() -> None:
+    store = SqliteStore()
+    store.add_tables([Path("src/examples/tableview/db/points.sql")])
+    store.create_tables()
+    history = store.get_history()
+    assert history is not None
+    states = [get_points(store)]
+    history.start_recording()
+    with store.get_connection() as db_conn:
+        db_conn.executemany(
+            "INSERT INTO points(p_name, x) VALUES(?, ?)", [(f"p{i}", i) for i in range(3)]
+        )
+        db_conn.commit()
+    history.stop_recording()
+    states.append(get_points(store))
+    history.start_recording()
+    with store.get_connection() as db_conn:
+        db_conn.execute("UPDATE points SET x=10, y=y WHERE p_name='p1'")
+        db_conn.execute("DELETE FROM points WHERE p_name='p2'")
+        db_conn.commit()
+    history.stop_recording()
+    states.append(get_points(store))
+    # an update without modification is not saved
+    history.start_recording()
+    with store.get_connection() as db_conn:
+        db_conn.execute("UPDATE points SET y=0")
+        db_conn.commit()
+    history.stop_recording()
+    for state in reversed(states[:-1]):
+        history.undo()
+        assert get_points(store) == state
+    for state in states[1:]:
+        history.redo()
+        assert get_points(store) == state
+
+
+def test_triggers_schema_change() -> None:
+    store = SqliteStore()
+    store.add_tables([Path("src/examples/tableview/db/points.sql")])
+    store.create_tables()
+    history = store.get_history()
+    assert history is not None
+    with store.get_connection() as db_conn:
+        db_conn.execute("INSERT INTO points(p_name) VALUES('p0')")
+        db_conn.execute("ALTER TABLE points ADD COLUMN w REAL DEFAULT 0.0")
+        db_conn.commit()
+    # the triggers are created again with the new column
+    history.start_recording()
+    with store.get_connection() as db_conn:
+        db_conn.execute("UPDATE points SET w=1.0")
+        db_conn.commit()
+    history.stop_recording()
+    history.undo()
+    with store.get_connection() as db_conn:
+        assert db_conn.execute("SELECT w FROM points").fetchone()[0] == 0.0
+
+
+def test_modified_data_sources() -> None:
+    store = SqliteStore()
+    store.add_tables([Path("src/examples/tableview/db/points.sql")])
+    store.create_tables()
+    history = store.get_history()
+    assert history is not None
+    history.start_recording()
+    with store.get_connection() as db_conn:
+        db_conn.execute("INSERT INTO points(p_name) VALUES('p0')")
+        db_conn.commit()
+    history.stop_recording()
+    history.undo()
+    assert history.get_modified_data_sources() == {"points"}
+    history.redo()
+    assert history.get_modified_data_sources() == {"points"}
+
+
+def test_capacity(monkeypatch: pytest.MonkeyPatch, tmpdir: Path) -> None:
+    store = SqliteStore()
+    store.add_tables([Path("src/examples/tableview/db/points.sql")])
+    store.create_tables()
+    history = store.get_history()
+    assert history is not None
+    monkeypatch.setattr(history, "get_capacity", lambda: 3)
+    monkeypatch.setattr(HistoryCompactor, "prune_interval", 4)
+
+    def get_undo_indexes() -> List[int]:
+        with store.get_connection() as db_conn:
+            result = db_conn.execute("SELECT DISTINCT idx FROM _CUI_UNDO_LOG ORDER BY idx")
+            return [int(row[0]) for row in result]
+
+    for index in range(9):
+        history.start_recording()
+        with store.get_connection() as db_conn:
+            db_conn.execute("INSERT INTO points(p_name) VALUES(?)", (f"p{index}",))
+            db_conn.commit()
+        history.stop_recording()
+    # the actions are removed by batches of 4 actions
+    assert get_undo_indexes() == [5, 6, 7, 8, 9]
+    # the pending actions are removed before the save
+    store.save_study(Path(tmpdir, "saved.sqlite"))
+    assert get_undo_indexes() == [7, 8, 9]
+    # the vacuum of the database of the user is not modified
+    with store.get_connection() as db_conn:
+        assert db_conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+
+def test_deferred_capacity(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = SqliteStore()
+    store.add_tables([Path("src/examples/tableview/db/points.sql")])
+    store.create_tables()
+    history = store.get_history()
+    assert history is not None
+    monkeypatch.setattr(history, "get_capacity", lambda: 1)
+    monkeypatch.setattr(HistoryCompactor, "prune_interval", 2)
+    calls: List[Callable[[], None]] = []
+    monkeypatch.setattr(HistoryCompactor, "call_later", calls.append)
+
+    def get_undo_indexes() -> List[int]:
+        with store.get_connection() as db_conn:
+            result = db_conn.execute("SELECT DISTINCT idx FROM _CUI_UNDO_LOG ORDER BY idx")
+            return [int(row[0]) for row in result]
+
+    for index in range(5):
+        history.start_recording()
+        with store.get_connection() as db_conn:
+            db_conn.execute("INSERT INTO points(p_name) VALUES(?)", (f"p{index}",))
+            db_conn.commit()
+        history.stop_recording()
+    # the removal is scheduled once and not done during the recording
+    assert len(calls) == 1
+    assert get_undo_indexes() == [1, 2, 3, 4, 5]
+    calls.pop()()
+    assert get_undo_indexes() == [5]
+
+
+def test_group_commands_without_user_triggers() -> None:
+    store = SqliteStore()
+    store.add_tables([Path("src/examples/tableview/db/points.sql")])
+    store.create_tables()
+    history = store.get_history()
+    assert isinstance(history, SqliteHistory)
+    with store.get_connection() as db_conn:
+        db_conn.executescript(
+            """--sql
+            CREATE TABLE notes(p_id INTEGER REFERENCES points(p_id) ON DELETE CASCADE);
+            CREATE TABLE labels(l_id INTEGER PRIMARY KEY NOT NULL, name TEXT DEFAULT "");
+            CREATE TABLE deleted_labels(name TEXT);
+            CREATE TRIGGER labels_deleted AFTER DELETE ON labels BEGIN
+                INSERT INTO deleted_labels(name) VALUES(OLD.name);
+            END;
+            """
+        )
+        db_conn.commit()
+        # points is referenced by a foreign key and labels has a trigger
+        assert history._get_ungrouped_tables(db_conn) == {"points", "labels"}  # noqa: SLF001
+    commands = [
+        "DELETE FROM labels WHERE ROWID=2",
+        "DELETE FROM labels WHERE ROWID=1",
+        "DELETE FROM deleted_labels WHERE ROWID=1",
+        "DELETE FROM deleted_labels WHERE ROWID=2",
+    ]
+    assert _group_commands(commands, {"points", "labels"}) == [
+        "DELETE FROM labels WHERE ROWID=2",
+        "DELETE FROM labels WHERE ROWID=1",
+        "DELETE FROM deleted_labels WHERE ROWID IN (1,2)",
+    ]
+
+
+def test_undo_cascade_deletion() -> None:
+    store = SqliteStore()
+    store.add_tables([Path("src/examples/linkedtableview/sqlite/db/line.sql")])
+    store.create_tables()
+    history = store.get_history()
+    assert history is not None
+    with store.get_connection() as db_conn:
+        db_conn.execute("INSERT INTO line(l_id) VALUES(1)")
+        db_conn.executemany("INSERT INTO point(l_id) VALUES(?)", [(1,), (1,)])
+        db_conn.commit()
+    history.start_recording()
+    with store.get_connection() as db_conn:
+        db_conn.execute("DELETE FROM line")
+        db_conn.commit()
+    history.stop_recording()
+    # the points deleted by the cascade are inserted again with their line
+    history.undo()
+    with store.get_connection() as db_conn:
+        assert db_conn.execute("SELECT COUNT(*) FROM point WHERE l_id=1").fetchone()[0] == 2
+    history.redo()
+    with store.get_connection() as db_conn:
+        assert db_conn.execute("SELECT COUNT(*) FROM point").fetchone()[0] == 0
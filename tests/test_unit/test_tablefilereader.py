@@ -0,0 +1,53 @@
+"""Test the reading of the table files by chunks of rows."""
+
+from composeui.items.core.tablefilereader import TableFileReader
+from composeui.items.core.views.itemsview import FormatExtension
+
+import pytest
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+pytest.importorskip("pandas")
+
+RECORDS: List[Dict[str, Any]] = [{"name": f"p{i}", "age": i} for i in range(5)]
+
+
+def read_records(filepath: Path, extension: FormatExtension) -> List[List[Dict[str, Any]]]:
+    reader = TableFileReader(filepath, extension, chunk_size=2)
+    chunks = []
+    previous_progress = 0.0
+    for table_df, progress in reader.iter_chunks():
+        assert previous_progress <= progress <= 1.0
+        previous_progress = progress
+        chunks.append(table_df.to_dict("records"))
+    assert previous_progress == 1.0
+    return chunks
+
+
+@pytest.mark.parametrize("is_lines", [False, True])
+def test_read_json_by_chunks(tmpdir: Path, is_lines: bool) -> None:
+    filepath = Path(tmpdir, "table.json")
+    if is_lines:
+        filepath.write_text("".join(json.dumps(record) + "\n" for record in RECORDS))
+    else:
+        filepath.write_text(json.dumps(RECORDS, indent=4))
+    chunks = read_records(filepath, FormatExtension.JSON)
+    assert chunks == [RECORDS[:2], RECORDS[2:4], RECORDS[4:]]
+
+
+def test_read_csv_by_chunks(tmpdir: Path) -> None:
+    filepath = Path(tmpdir, "table.csv")
+    filepath.write_text(
+        "name;age\n" + "".join(f"{record['name']};{record['age']}\n" for record in RECORDS)
+    )
+    chunks = read_records(filepath, FormatExtension.CSV)
+    assert chunks == [RECORDS[:2], RECORDS[2:4], RECORDS[4:]]
+
+
+def test_read_empty_file(tmpdir: Path) -> None:
+    filepath = Path(tmpdir, "table.json")
+    filepath.write_text("[]")
+    # an empty chunk is given for an empty list of records
+    assert read_records(filepath, FormatExtension.JSON) == [[]]
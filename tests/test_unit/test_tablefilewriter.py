@@ -0,0 +1,47 @@
+"""Test the writing of the table files by chunks of rows."""
+
+from composeui.items.core.tablefilewriter import TableFileWriter
+from composeui.items.core.views.itemsview import FormatExtension
+
+import pytest
+
+from pathlib import Path
+
+pd = pytest.importorskip("pandas")
+
+COLUMN_NAMES = ["name", "age"]
+TABLE_DF = pd.DataFrame({"name": [f"p<{i}>" for i in range(5)], "age": [0.5, 1, 2, 3, 4.5]})
+
+
+def write_by_chunks(filepath: Path, extension: FormatExtension) -> None:
+    writer = TableFileWriter(filepath, extension, COLUMN_NAMES)
+    with writer.open():
+        for row_start in range(0, 5, 2):
+            chunk_df = TABLE_DF.iloc[row_start : row_start + 2]
+            writer.write_chunk([chunk_df[name].tolist() for name in COLUMN_NAMES])
+
+
+def test_write_csv_by_chunks(tmpdir: Path) -> None:
+    filepath = Path(tmpdir, "table.csv")
+    write_by_chunks(filepath, FormatExtension.CSV)
+    assert filepath.read_text() == TABLE_DF.to_csv(sep=";", index=False)
+
+
+def test_write_json_by_chunks(tmpdir: Path) -> None:
+    filepath = Path(tmpdir, "table.json")
+    write_by_chunks(filepath, FormatExtension.JSON)
+    assert filepath.read_text() == TABLE_DF.to_json(orient="records", index=False)
+
+
+def test_write_html_by_chunks(tmpdir: Path) -> None:
+    filepath = Path(tmpdir, "table.html")
+    write_by_chunks(filepath, FormatExtension.HTML)
+    assert filepath.read_text() == TABLE_DF.to_html(index=False)
+
+
+def test_write_empty_table(tmpdir: Path) -> None:
+    filepath = Path(tmpdir, "table.csv")
+    with TableFileWriter(filepath, FormatExtension.CSV, COLUMN_NAMES).open():
+        pass
+    # only the header is written
+    assert filepath.read_text() == "name;age\n"
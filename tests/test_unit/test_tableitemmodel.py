@@ -0,0 +1,119 @@
+"""Test the notification of the row changes by the Qt model of a table."""
+
+from composeui.items.simpletable.simpletableitems import SimpleTableItems
+from composeui.items.table.tableview import TableView
+from composeui.model.sqlitemodel import SqliteModel
+
+import pytest
+
+from pathlib import Path
+from typing import Any, List, Tuple
+
+pytest.importorskip("qtpy.QtCore")
+
+from composeui.items.table.qt.widgets.tableitemmodel import TableItemModel
+
+
+@pytest.fixture()
+def items(tmpdir: Path) -> SimpleTableItems[Any]:
+    sqlite_path = Path(tmpdir, "test.sqlite")
+    model = SqliteModel("test", "0.1.0", False, sqlite_path)
+    with model.sqlite_store.get_connection() as db_conn:
+        db_conn.execute(
+            """--sql
+            CREATE TABLE test(
+                name TEXT DEFAULT "",
+                position INTEGER DEFAULT 0
+            )
+            """
+        )
+        db_conn.commit()
+    table_items = SimpleTableItems(
+        TableView(),
+        model,
+        model.sqlite_store,
+        "test",
+        order_column="position",
+        is_read_only=False,
+    )
+    for row, name in enumerate("abc"):
+        table_items.insert(row)
+        table_items.set_data(row, 0, name)
+    table_items.take_row_changes()
+    return table_items
+
+
+def record_signals(model: TableItemModel) -> List[Tuple[str, Any]]:
+    r"""Record the signals notifying the changes of the rows to the views.
+
+    The moves are notified by the proxy as a change of layout, so the signals of the source
+    model are recorded.
+    """
+    signals: List[Tuple[str, Any]] = []
+    model.modelReset.connect(lambda: signals.append(("reset", None)))
+    source_model = model.source_model
+    source_model.rowsInserted.connect(
+        lambda _, first, last: signals.append(("inserted", (first, last)))
+    )
+    source_model.rowsRemoved.connect(
+        lambda _, first, last: signals.append(("removed", (first, last)))
+    )
+    source_model.rowsMoved.connect(
+        lambda _, first, __, ___, destination: signals.append(("moved", (first, destination)))
+    )
+    source_model.dataChanged.connect(
+        lambda top_left, bottom_right, *_: signals.append(
+            ("changed", (top_left.row(), bottom_right.row()))
+        )
+    )
+    return signals
+
+
+def get_names(model: TableItemModel) -> List[str]:
+    return [model.data(model.index(row, 0)) for row in range(model.rowCount())]
+
+
+def test_apply_row_changes(
+    items: SimpleTableItems[Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    model = TableItemModel(items)
+    signals = record_signals(model)
+    # the items keep their cache up to date, the model doesn't select the table again
+    monkeypatch.setattr(items, "update_cache", lambda: pytest.fail("the cache is reloaded"))
+    items.insert(1)
+    items.set_data(1, 0, "d")
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("inserted", (1, 1)), ("changed", (1, 1))]
+    assert get_names(model) == ["a", "d", "b", "c"]
+    signals.clear()
+    # the modified rows are given at their position after all the changes
+    items.set_data(2, 0, "e")
+    items.remove(0)
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("removed", (0, 0)), ("changed", (1, 1))]
+    assert get_names(model) == ["d", "e", "c"]
+    signals.clear()
+    assert items.move(0, 2)
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("moved", (0, 3))]
+    assert get_names(model) == ["e", "c", "d"]
+
+
+def test_apply_inconsistent_row_changes(items: SimpleTableItems[Any]) -> None:
+    model = TableItemModel(items)
+    signals = record_signals(model)
+    items.insert(0)
+    row_changes = items.take_row_changes() or []
+    # the insertion is notified twice, the model must be reset
+    assert not model.apply_row_changes(row_changes * 2)
+    assert signals == []
+
+
+def test_drop_rows(items: SimpleTableItems[Any]) -> None:
+    QtCore = pytest.importorskip("qtpy.QtCore")  # noqa: N806
+    model = TableItemModel(items)
+    signals = record_signals(model)
+    mime_data = model.mimeData([model.index(0, 0)])
+    assert model.dropMimeData(mime_data, QtCore.Qt.MoveAction, -1, -1, model.index(2, 0))
+    assert signals == [("moved", (0, 3))]
+    assert get_names(model) == ["b", "c", "a"]
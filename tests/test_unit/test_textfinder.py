@@ -69,6 +69,22 @@ def test_is_regex_valid() -> None:
     assert text_finder.has_pattern is True
 
 
+@pytest.mark.parametrize(
+    ("pattern", "is_comparison_valid"),
+    [
+        ("salt and pepper", True),
+        ("> 3 and < 10", True),
+        ("> 3 and pepper", False),
+        (">= three", False),
+    ],
+)
+def test_is_comparison_valid(pattern: str, is_comparison_valid: bool) -> None:
+    r"""Check the attribute is_comparison_valid of TextFinder."""
+    text_finder = TextFinder()
+    text_finder.pattern = pattern
+    assert text_finder.is_comparison_valid is is_comparison_valid
+
+
 @pytest.mark.parametrize(
     ("pattern", "match_case", "match_whole_word", "use_regex", "expected_result"),
     [
@@ -80,6 +96,10 @@ def test_is_regex_valid() -> None:
         ("<=1.15e2", False, False, False, True),
         (">1.15e2", False, False, False, False),
         ("<1.15e2", False, False, False, False),
+        # compound comparisons
+        ("> 1e2 and < 2e2", False, False, False, True),
+        ("> 1e2 AND < 1e2", False, False, False, False),
+        (">= 1.15e2 and <= 1.15e2", True, False, False, True),
     ],
 )
 def test_match_with_operator(
@@ -96,3 +116,28 @@ def test_match_with_operator(
     text_finder.match_whole_word = match_whole_word
     text_finder.use_regex = use_regex
     assert text_finder.match("1.15e2") is expected_result
+
+
+@pytest.mark.parametrize(
+    ("pattern", "match_case", "match_whole_word", "use_regex"),
+    [
+        ("test", False, False, False),
+        ("Test", True, False, False),
+        ("a simple test", False, True, False),
+        ("[a-z]est", False, False, True),
+        ("a simple [A-Z]est", True, True, True),
+        ("<=3e3", False, False, False),
+        ("> 1e2 and < 1e3", False, False, False),
+    ],
+)
+def test_match_values(
+    pattern: str, match_case: bool, match_whole_word: bool, use_regex: bool
+) -> None:
+    r"""Check the match of a column of values is the same as the match of each value."""
+    text_finder = TextFinder()
+    text_finder.pattern = pattern
+    text_finder.match_case = match_case
+    text_finder.match_whole_word = match_whole_word
+    text_finder.use_regex = use_regex
+    values = ["a simple Test", "a simple test", "Test", "1.15e2", "5e3", ""]
+    assert text_finder.match_values(values) == [text_finder.match(value) for value in values]
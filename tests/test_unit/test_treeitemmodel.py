@@ -0,0 +1,320 @@
+"""Test the nodes and the notification of the row changes of the Qt model of a tree."""
+
+from composeui.items.core.itemsutils import RowChange, RowChangeType
+from composeui.items.tree.abstracttreeitems import AbstractTreeItems
+from composeui.items.tree.treeview import TreeView
+
+import pytest
+
+from typing import Any, List, Optional, Tuple
+
+pytest.importorskip("qtpy.QtCore")
+
+from composeui.items.tree.qt.widgets.treeitemmodel import (
+    _NO_NODE_ID,
+    _ROOT_ID,
+    TreeItemModel,
+    _update_position,
+)
+
+
+class _Node:
+    def __init__(self, name: str, children: Optional[List["_Node"]] = None) -> None:
+        self.name = name
+        self.children = children or []
+
+
+class NamesItems(AbstractTreeItems[Any]):
+    r"""Tree of names stored in memory which notifies its changes of rows."""
+
+    def __init__(self, root: _Node) -> None:
+        super().__init__(TreeView(), None, depth=2)
+        self._root = root
+        # the parents whose numbers of rows have been requested
+        self.loaded_parents: List[Tuple[int, ...]] = []
+
+    def _get_node(self, rows: Tuple[int, ...]) -> _Node:
+        node = self._root
+        for row in rows:
+            node = node.children[row]
+        return node
+
+    def get_nb_columns(self) -> int:
+        return 1
+
+    def get_column_title(self, column: int) -> str:
+        return "Name"
+
+    def get_nb_rows(self, parent_rows: Tuple[int, ...] = ()) -> int:
+        self.loaded_parents.append(parent_rows)
+        return len(self._get_node(parent_rows).children)
+
+    def get_data(self, row: int, column: int, parent_rows: Tuple[int, ...] = ()) -> str:
+        return self._get_node((*parent_rows, row)).name
+
+    def insert(self, row: int, parent_rows: Tuple[int, ...] = ()) -> Optional[Tuple[int, ...]]:
+        self._get_node(parent_rows).children.insert(row, _Node("new"))
+        self.notify_row_inserted(row, parent_rows)
+        return (*parent_rows, row)
+
+    def remove(self, row: int, parent_rows: Tuple[int, ...] = ()) -> Optional[Tuple[int, ...]]:
+        del self._get_node(parent_rows).children[row]
+        self.notify_row_removed(row, parent_rows)
+        return super().remove(row, parent_rows)
+
+    def move(
+        self,
+        from_row: int,
+        to_row: int,
+        from_parent_rows: Tuple[int, ...] = (),
+        to_parent_rows: Tuple[int, ...] = (),
+    ) -> bool:
+        node = self._get_node(from_parent_rows).children.pop(from_row)
+        self._get_node(to_parent_rows).children.insert(to_row, node)
+        self.notify_row_moved(from_row, to_row, from_parent_rows, to_parent_rows)
+        return True
+
+    def set_data(
+        self, row: int, column: int, value: str, parent_rows: Tuple[int, ...] = ()
+    ) -> bool:
+        self._get_node((*parent_rows, row)).name = value
+        self.notify_data_changed(row, parent_rows)
+        return True
+
+
+@pytest.fixture()
+def items() -> NamesItems:
+    return NamesItems(
+        _Node(
+            "",
+            [
+                _Node("a", [_Node("a0"), _Node("a1")]),
+                _Node("b", [_Node("b0")]),
+                _Node("c"),
+            ],
+        )
+    )
+
+
+def get_names(model: TreeItemModel, parent: Any = None) -> List[Any]:
+    r"""Get the names of the loaded rows, with the names of their children if loaded."""
+    source_model = model.source_model
+    names: List[Any] = []
+    parent_index = source_model.index(0, 0).parent() if parent is None else parent
+    for row in range(source_model.rowCount(parent_index)):
+        index = source_model.index(row, 0, parent_index)
+        names.append(source_model.data(index))
+        if source_model.get_position(index) != ():
+            children = source_model._node_children[index.internalId()]  # noqa: SLF001
+            if children is not None and len(children) > 0:
+                names.append(get_names(model, index))
+    return names
+
+
+def record_signals(model: TreeItemModel) -> List[Tuple[str, Any]]:
+    r"""Record the signals of the source model notifying the changes of the rows."""
+    signals: List[Tuple[str, Any]] = []
+    source_model = model.source_model
+    model.modelReset.connect(lambda: signals.append(("reset", None)))
+    source_model.rowsInserted.connect(
+        lambda parent, first, _: signals.append(
+            ("inserted", (*source_model.get_position(parent), first))
+        )
+    )
+    source_model.rowsRemoved.connect(
+        lambda parent, first, _: signals.append(
+            ("removed", (*source_model.get_position(parent), first))
+        )
+    )
+    source_model.rowsMoved.connect(
+        lambda parent, first, _, destination, row: signals.append(
+            (
+                "moved",
+                (
+                    (*source_model.get_position(parent), first),
+                    (*source_model.get_position(destination), row),
+                ),
+            )
+        )
+    )
+    source_model.dataChanged.connect(
+        lambda top_left, *_: signals.append(("changed", source_model.get_position(top_left)))
+    )
+    return signals
+
+
+def test_move_rows(items: NamesItems) -> None:
+    model = TreeItemModel(items)
+    source_model = model.source_model
+    # load the children of the first row
+    a_index = source_model.index(0, 0)
+    assert source_model.rowCount(a_index) == 2
+    signals = record_signals(model)
+    # move in the same parent, the position of the destination is given after the move
+    assert items.move(0, 1, (0,), (0,))
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("moved", ((0, 0), (0, 2)))]
+    assert get_names(model) == ["a", ["a1", "a0"], "b", "c"]
+    signals.clear()
+    # move to a parent whose children are not loaded: the row is removed for the views
+    assert items.move(1, 0, (0,), (1,))
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("removed", (0, 1))]
+    assert get_names(model) == ["a", ["a1"], "b", "c"]
+    signals.clear()
+    # move between loaded parents
+    b_index = source_model.index(1, 0)
+    assert source_model.rowCount(b_index) == 2
+    assert items.move(0, 2, (0,), (1,))
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("moved", ((0, 0), (1, 2)))]
+    assert get_names(model) == ["a", "b", ["a0", "b0", "a1"], "c"]
+    signals.clear()
+    # move a parent before its previous sibling with its loaded children
+    assert items.move(1, 0)
+    assert items.set_data(0, 0, "a2", (0,))
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("moved", ((1,), (0,))), ("changed", (0, 0))]
+    assert get_names(model) == ["b", ["a2", "b0", "a1"], "a", "c"]
+
+
+def test_move_row_into_itself(items: NamesItems) -> None:
+    model = TreeItemModel(items)
+    signals = record_signals(model)
+    model.source_model.rowCount(model.source_model.index(0, 0))
+    # the changes are inconsistent with the tree, the model must be reset
+    items.notify_row_moved(0, 0, (), (0,))
+    assert not model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == []
+
+
+def test_insert_remove_rows(items: NamesItems) -> None:
+    model = TreeItemModel(items)
+    source_model = model.source_model
+    # expand the first row only
+    source_model.rowCount(source_model.index(0, 0))
+    signals = record_signals(model)
+    # the rows inserted under a collapsed parent are loaded with the parent
+    assert items.insert(0, (1,)) == (1, 0)
+    assert items.insert(2, (0,)) == (0, 2)
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("inserted", (0, 2))]
+    assert get_names(model) == ["a", ["a0", "a1", "new"], "b", "c"]
+    signals.clear()
+    # the expanded parent keeps its loaded children when its row is shifted
+    assert items.insert(0) == (0,)
+    assert items.remove(0, (2,)) == (2, 0)
+    assert items.remove(1, (1,)) == (1, 1)
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("inserted", (0,)), ("removed", (1, 1))]
+    assert get_names(model) == ["new", "a", ["a0", "new"], "b", "c"]
+    b_index = source_model.index(2, 0)
+    assert source_model.data(source_model.index(0, 0, b_index)) == "b0"
+    assert source_model.rowCount(b_index) == 1
+    signals.clear()
+    # the removal of an expanded parent removes its loaded children
+    assert items.remove(1) == (1,)
+    assert model.apply_row_changes(items.take_row_changes() or [])
+    assert signals == [("removed", (1,))]
+    assert get_names(model) == ["new", "b", ["b0"], "c"]
+
+
+def test_index_parent(items: NamesItems) -> None:
+    source_model = TreeItemModel(items).source_model
+    for position in [(0,), (0, 0), (0, 1), (1,), (1, 0), (2,)]:
+        index = source_model.index_from_rows(position, 0)
+        assert source_model.get_position(index) == position
+        parent = source_model.parent(index)
+        assert source_model.get_position(parent) == position[:-1]
+        # the same node is used for all the indexes of a row
+        child = source_model.index(position[-1], 0, parent)
+        assert child.internalId() == index.internalId()
+        assert source_model.parent(child.siblingAtColumn(0)) == parent
+    assert not source_model.parent(source_model.index(0, 0)).isValid()
+    assert not source_model.index(3, 0).isValid()
+    assert not source_model.index(0, 0, source_model.index(2, 0)).isValid()
+
+
+def test_node_table(items: NamesItems) -> None:
+    source_model = TreeItemModel(items).source_model
+    source_model.index_from_rows((0, 1), 0)
+    source_model.index(2, 0)
+    # the nodes are created in the order of the requests of their indexes
+    assert list(source_model._node_parents) == [_NO_NODE_ID, _ROOT_ID, 1, 0]  # noqa: SLF001
+    assert list(source_model._node_rows) == [0, 0, 1, 2]  # noqa: SLF001
+    assert source_model._node_children == [  # noqa: SLF001
+        [1, _NO_NODE_ID, 3],
+        [_NO_NODE_ID, 2],
+        None,
+        None,
+    ]
+    assert source_model.get_parent_id(source_model.index(1, 0, source_model.index(0, 0))) == 1
+    source_model.data(source_model.index(1, 0, source_model.index(0, 0)))
+    assert set(source_model._cache_data) == {2}  # noqa: SLF001
+    # the removed nodes and their descendants are freed
+    items.remove(0)
+    assert source_model.apply_row_changes(items.take_row_changes() or [])
+    assert list(source_model._node_parents) == [  # noqa: SLF001
+        _NO_NODE_ID,
+        _NO_NODE_ID,
+        _NO_NODE_ID,
+        0,
+    ]
+    assert source_model._node_children == [[_NO_NODE_ID, 3], None, None, None]  # noqa: SLF001
+    assert source_model._cache_data == {}  # noqa: SLF001
+    assert source_model.get_position(source_model.index(1, 0)) == (1,)
+    # the ids of the freed nodes are reused
+    source_model.index(0, 0)
+    assert source_model._node_children[_ROOT_ID] == [2, 3]  # noqa: SLF001
+    assert list(source_model._node_parents) == [_NO_NODE_ID, _NO_NODE_ID, 0, 0]  # noqa: SLF001
+    assert list(source_model._node_rows)[2:] == [0, 1]  # noqa: SLF001
+
+
+def test_lazy_loading(items: NamesItems) -> None:
+    source_model = TreeItemModel(items).source_model
+    assert items.loaded_parents == []
+    assert source_model.rowCount() == 3
+    assert source_model.rowCount() == 3
+    assert items.loaded_parents == [()]
+    # the children are loaded when the parent is expanded
+    b_index = source_model.index(1, 0)
+    assert items.loaded_parents == [()]
+    assert source_model.data(source_model.index(0, 0, b_index)) == "b0"
+    assert items.loaded_parents == [(), (1,)]
+    # the nodes are removed by the update of the cache and loaded again on demand
+    source_model.update_cache()
+    assert source_model._node_children == [None]  # noqa: SLF001
+    assert source_model.rowCount() == 3
+    assert items.loaded_parents == [(), (1,), ()]
+
+
+@pytest.mark.parametrize(
+    ("position", "row_change", "expected_position"),
+    [
+        ((1, 2), RowChange(RowChangeType.INSERT, 2, (1,)), (1, 3)),
+        ((1, 2), RowChange(RowChangeType.INSERT, 3, (1,)), (1, 2)),
+        ((1, 2), RowChange(RowChangeType.INSERT, 0), (2, 2)),
+        ((1, 2), RowChange(RowChangeType.INSERT, 0, (0,)), (1, 2)),
+        ((1, 2), RowChange(RowChangeType.REMOVE, 2, (1,)), None),
+        ((1, 2), RowChange(RowChangeType.REMOVE, 1), None),
+        ((1, 2), RowChange(RowChangeType.REMOVE, 0, (1,)), (1, 1)),
+        ((1, 2), RowChange(RowChangeType.REMOVE, 0), (0, 2)),
+        ((1, 2), RowChange(RowChangeType.DATA, 1), (1, 2)),
+        ((1,), RowChange(RowChangeType.INSERT, 0, (1,)), (1,)),
+        # the moved row and its descendants
+        ((1, 2), RowChange(RowChangeType.MOVE, 1, (), 0), (0, 2)),
+        ((1, 2), RowChange(RowChangeType.MOVE, 2, (1,), 0, (0,)), (0, 0)),
+        # the siblings of the moved row at its source and at its destination
+        ((1, 2), RowChange(RowChangeType.MOVE, 0, (1,), 3, (1,)), (1, 1)),
+        ((1, 2), RowChange(RowChangeType.MOVE, 3, (1,), 0, (1,)), (1, 3)),
+        ((1, 2), RowChange(RowChangeType.MOVE, 0, (), 1), (0, 2)),
+        ((1, 2), RowChange(RowChangeType.MOVE, 0, (0,), 1, (1,)), (1, 3)),
+        ((1, 2), RowChange(RowChangeType.MOVE, 0, (), 0, (2,)), (0, 2)),
+    ],
+)
+def test_update_position(
+    position: Tuple[int, ...],
+    row_change: RowChange,
+    expected_position: Optional[Tuple[int, ...]],
+) -> None:
+    assert _update_position(position, row_change) == expected_position
@@ -0,0 +1,85 @@
+"""Test the scheduler of the updates of the views."""
+
+from composeui.core import tools
+from composeui.core.updatescheduler import UpdateOptions, UpdateScheduler
+from composeui.core.views.view import View
+
+from typing import Callable, List, Tuple
+
+
+def create_views() -> Tuple[View, View, View, View]:
+    r"""Create views with the dependencies a -> (b, c) -> d."""
+    view_a, view_b, view_c, view_d = View(), View(), View(), View()
+    view_a.dependencies.extend([view_c, view_b])
+    view_b.dependencies.append(view_d)
+    view_c.dependencies.append(view_d)
+    return view_a, view_b, view_c, view_d
+
+
+def test_update_once_by_dependencies() -> None:
+    view_a, view_b, view_c, view_d = create_views()
+    updated_views: List[View] = []
+    scheduler = UpdateScheduler(lambda view, _: updated_views.append(view))
+    scheduler.schedule([view_a])
+    assert updated_views == [view_a, view_c, view_b, view_d]
+    updated_views.clear()
+    with scheduler.batch():
+        scheduler.schedule([view_b])
+        scheduler.schedule([view_c])
+        scheduler.schedule([view_a])
+        assert updated_views == []
+    assert updated_views == [view_a, view_b, view_c, view_d]
+
+
+def test_deferred_updates() -> None:
+    _, view_b, view_c, view_d = create_views()
+    updates: List[Tuple[View, UpdateOptions]] = []
+    calls_later: List[Callable[[], None]] = []
+    scheduler = UpdateScheduler(lambda view, options: updates.append((view, options)))
+    scheduler.set_call_later(calls_later.append)
+    scheduler.schedule([view_b], UpdateOptions(keep_selection=True))
+    scheduler.schedule([view_d], UpdateOptions(before_validation=True))
+    assert len(calls_later) == 1
+    assert updates == []
+    calls_later[0]()
+    assert updates == [
+        (view_b, UpdateOptions(keep_selection=True)),
+        (view_d, UpdateOptions(keep_selection=True)),
+    ]
+    updates.clear()
+    # synchronous flush
+    scheduler.schedule([view_c])
+    scheduler.flush()
+    assert [view for view, _ in updates] == [view_c, view_d]
+
+
+def test_defer_updates_of_tools() -> None:
+    class CountingView(View):
+        def __init__(self) -> None:
+            super().__init__()
+            self.nb_updates = 0
+
+        def update(self) -> None:
+            self.nb_updates += 1
+
+    view = CountingView()
+    calls_later: List[Callable[[], None]] = []
+    tools.defer_updates(calls_later.append)
+    try:
+        tools.update_view_with_dependencies(view)
+        tools.update_view_with_dependencies(view)
+        assert view.nb_updates == 0
+        assert len(calls_later) == 1
+        calls_later.pop()()
+        assert view.nb_updates == 1
+        # the pending updates are applied before reading the state of the view
+        tools.update_view_with_dependencies(view)
+        tools.flush_updates()
+        assert view.nb_updates == 2
+        calls_later.pop()()
+        assert view.nb_updates == 2
+    finally:
+        tools.defer_updates(None)
+    # the views are updated immediately again
+    tools.update_view_with_dependencies(view)
+    assert view.nb_updates == 3